@@ -0,0 +1,78 @@
+"""
+Compara dos ejecuciones guardadas y falla si hay regresiones de rendimiento
+
+Uso:
+    python compare.py                      # penúltima sesión vs última
+    python compare.py BASE HEAD            # ids de sesión o de ejecución
+    python compare.py --threshold 0.15 --store resultados.jsonl
+"""
+import argparse
+import sys
+
+from controller.results_store import ResultsStore, compare_runs
+
+
+def main(argv=None):
+    """
+    Punto de entrada del comando compare
+
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv)
+
+    Returns:
+        0 si no hay regresiones, 1 si las hay, 2 si las ejecuciones no existen
+    """
+    parser = argparse.ArgumentParser(description="Compara dos ejecuciones de benchmarks guardadas")
+    parser.add_argument('base', nargs='?', default='previous',
+                        help="Sesión o ejecución base (por defecto: previous)")
+    parser.add_argument('head', nargs='?', default='latest',
+                        help="Sesión o ejecución nueva (por defecto: latest)")
+    parser.add_argument('--store', default='benchmark_results.jsonl',
+                        help="Archivo JSONL de resultados")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Empeoramiento relativo mínimo para marcar regresión (0.10 = 10%%)")
+    parser.add_argument('--all', action='store_true',
+                        help="Mostrar también las fases sin cambios")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.store)
+    try:
+        base = store.select(args.base)
+        head = store.select(args.head)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 2
+
+    try:
+        rows = compare_runs(base, head, args.threshold)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 2
+    if not rows:
+        print("No hay fases comparables (tipos de datos o tamaños distintos)")
+        return 2
+
+    base_commit = base[0]['metadata']['git']['commit'] or '?'
+    head_commit = head[0]['metadata']['git']['commit'] or '?'
+    print(f"Base: {args.base} ({base_commit[:10]})  Nueva: {args.head} ({head_commit[:10]})")
+    print(f"Umbral: {args.threshold:.0%}, significancia: Welch t al 95%\n")
+
+    markers = {'regression': '✗ REGRESIÓN', 'improvement': '✓ mejora', 'unchanged': ''}
+    width = max(len('árbol'), *(len(row['contender']) for row in rows)) + 2
+    print(f"{'tipo':<12}{'árbol':<{width}}{'fase':<14}{'tamaño':>8}{'base (s)':>12}{'nueva (s)':>12}"
+          f"{'cambio':>9}{'t':>8}  estado")
+    for row in rows:
+        if row['status'] == 'unchanged' and not args.all:
+            continue
+        print(f"{row['data_type']:<12}{row['contender']:<{width}}{row['phase']:<14}{row['size']:>8}"
+              f"{row['base']:>12.6f}{row['head']:>12.6f}{row['change']:>+9.1%}{row['t']:>8.2f}  "
+              f"{markers[row['status']]}")
+
+    regressions = sum(row['status'] == 'regression' for row in rows)
+    improvements = sum(row['status'] == 'improvement' for row in rows)
+    print(f"\n{len(rows)} comparaciones: {regressions} regresiones, {improvements} mejoras")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
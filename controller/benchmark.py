@@ -0,0 +1,150 @@
+"""
+Motor de medición con calentamiento, repeticiones e intervalos de confianza
+"""
+import gc
+import math
+import statistics
+import time
+
+
+# Valores críticos t de Student (dos colas, 95%) por grados de libertad
+_T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056,
+    27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042
+}
+
+
+def t_critical_95(degrees_of_freedom):
+    """
+    Obtiene el valor crítico t de Student para un intervalo del 95%
+
+    Args:
+        degrees_of_freedom: Grados de libertad (n - 1)
+
+    Returns:
+        Valor crítico; para más de 30 grados se usa la aproximación normal
+    """
+    if degrees_of_freedom < 1:
+        return float('inf')
+    return _T_CRITICAL_95.get(degrees_of_freedom, 1.960)
+
+
+def percentile(sorted_samples, q):
+    """
+    Obtiene un percentil por el método del rango más cercano
+
+    Args:
+        sorted_samples: Muestras ordenadas ascendentemente
+        q: Percentil entre 0 y 100
+
+    Returns:
+        Muestra en la posición del percentil (None si no hay muestras)
+    """
+    if not sorted_samples:
+        return None
+    rank = math.ceil(q / 100 * len(sorted_samples))
+    return sorted_samples[min(max(rank, 1), len(sorted_samples)) - 1]
+
+
+def summarize(samples):
+    """
+    Calcula estadísticas descriptivas de una lista de tiempos
+
+    Args:
+        samples: Lista de tiempos en segundos
+
+    Returns:
+        Diccionario con min, median, mean, stdev, ci95 (semiancho del
+        intervalo de confianza del 95% para la media), n y samples
+    """
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    ci95 = t_critical_95(n - 1) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': mean,
+        'stdev': stdev,
+        'ci95': ci95,
+        'n': n,
+        'samples': list(samples)
+    }
+
+
+class Benchmark:
+    """Ejecuta una medición varias veces y resume su distribución"""
+
+    def __init__(self, warmup=1, repeats=5, max_repeats=30,
+                 target_rel_error=None, disable_gc=True):
+        """
+        Configura el motor de medición
+
+        Args:
+            warmup: Ejecuciones previas descartadas
+            repeats: Repeticiones mínimas medidas
+            max_repeats: Repeticiones máximas cuando se busca un error objetivo
+            target_rel_error: Error relativo objetivo (ci95 / media). Si se
+                indica, se repite hasta alcanzarlo o llegar a max_repeats
+            disable_gc: Si True, el recolector de basura se desactiva durante
+                cada región cronometrada y se ejecuta antes de ella
+        """
+        self.warmup = warmup
+        self.repeats = max(1, repeats)
+        self.max_repeats = max(self.repeats, max_repeats)
+        self.target_rel_error = target_rel_error
+        self.disable_gc = disable_gc
+
+    def time_once(self, func, state=None):
+        """
+        Cronometra una ejecución con perf_counter_ns
+
+        Args:
+            func: Función a medir; recibe el estado preparado
+            state: Resultado de la preparación (fuera de la región medida)
+
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        gc_was_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            func(state)
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            if self.disable_gc and gc_was_enabled:
+                gc.enable()
+        return elapsed / 1e9
+
+    def run(self, func, setup=None):
+        """
+        Mide una función con calentamiento y repeticiones
+
+        Args:
+            func: Función a medir; recibe el resultado de setup()
+            setup: Función sin argumentos que prepara un estado nuevo para
+                cada ejecución (por ejemplo, un árbol vacío). Su costo no se mide
+
+        Returns:
+            Diccionario de estadísticas (ver summarize)
+        """
+        for _ in range(self.warmup):
+            self.time_once(func, setup() if setup else None)
+
+        samples = []
+        while True:
+            samples.append(self.time_once(func, setup() if setup else None))
+            if len(samples) < self.repeats:
+                continue
+            if self.target_rel_error is None or len(samples) >= self.max_repeats:
+                break
+            stats = summarize(samples)
+            if stats['mean'] > 0 and stats['ci95'] / stats['mean'] <= self.target_rel_error:
+                break
+        return summarize(samples)
@@ -0,0 +1,160 @@
+"""
+Registro de motores de conjunto ordenado (contendientes de las pruebas)
+
+Cada motor es una clase que cumple model.engine.OrderedSetEngine. Se
+registra con register_engine y queda disponible por nombre para el
+controlador, la vista, main.py y la interfaz gráfica. Los paquetes externos
+pueden agregar motores sin editar este repositorio declarando un punto de
+entrada en el grupo ENTRY_POINT_GROUP, por ejemplo en su pyproject.toml:
+
+    [project.entry-points."arboles.engines"]
+    avl = "mi_paquete.avl:AVLTree"
+
+El punto de entrada puede apuntar a la clase del motor (se registra con el
+nombre del punto de entrada) o a una función que recibe register_engine.
+"""
+from importlib import metadata
+
+from model import (BinarySearchTree, ScapegoatTree, RedBlackTree, ArrayRedBlackTree, BTree, SplayTree,
+                   InstrumentedBinarySearchTree, InstrumentedRedBlackTree)
+from model.engine import OrderedSetEngine
+
+
+# Grupo de puntos de entrada que se revisa al importar el módulo
+ENTRY_POINT_GROUP = 'arboles.engines'
+
+# Colores y marcadores por posición de registro, para los motores que no
+# declaran los suyos (el verde queda para las series de referencia)
+_COLOR_CYCLE = ['red', 'blue', 'orange', 'purple', 'brown', 'magenta', 'olive', 'cyan', 'gray', 'black']
+_MARKER_CYCLE = ['o', 's', '^', 'D', 'v', 'P', 'X', '*', 'h', '<']
+
+# Nombre → descripción del motor (factory, label, instrumented, color, marker)
+ENGINES = {}
+
+
+def register_engine(name, factory, label=None, short_label=None, instrumented=None,
+                    color=None, marker=None):
+    """
+    Registra un motor de conjunto ordenado
+
+    Args:
+        name: Nombre corto del motor; es la llave de sus resultados
+        factory: Clase del motor (su constructor crea un conjunto vacío)
+        label: Nombre para leyendas y reportes (por defecto, el nombre)
+        short_label: Abreviatura para leyendas compuestas (por defecto, el
+            nombre en mayúsculas)
+        instrumented: Clase con un diccionario 'counters' para el conteo de
+            operaciones (None si el motor no se puede instrumentar)
+        color: Color de matplotlib de sus series (por defecto, de una paleta)
+        marker: Marcador de matplotlib de sus series
+
+    Returns:
+        La misma clase del motor
+
+    Raises:
+        TypeError: Si la clase no cumple el protocolo OrderedSetEngine
+    """
+    missing = [method for method in ('insert', 'search', 'height', '__iter__')
+               if not callable(getattr(factory, method, None))]
+    if missing:
+        raise TypeError(f"El motor {name} no cumple {OrderedSetEngine.__name__}: "
+                        f"faltan {', '.join(missing)}")
+    position = len([other for other in ENGINES if other != name])
+    ENGINES[name] = {
+        'factory': factory,
+        'label': label or name,
+        'short_label': short_label or name.upper(),
+        'instrumented': instrumented,
+        'color': color or _COLOR_CYCLE[position % len(_COLOR_CYCLE)],
+        'marker': marker or _MARKER_CYCLE[position % len(_MARKER_CYCLE)]
+    }
+    return factory
+
+
+def engine_names():
+    """
+    Obtiene los nombres registrados en orden de registro
+
+    Returns:
+        Lista de nombres
+    """
+    return list(ENGINES)
+
+
+def get_engine(name):
+    """
+    Obtiene la descripción de un motor
+
+    Args:
+        name: Nombre del motor
+
+    Returns:
+        Diccionario con factory, label, short_label, instrumented, color y marker
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Motor desconocido: {name} (disponibles: {', '.join(ENGINES)})")
+    return ENGINES[name]
+
+
+def engine_styles(names):
+    """
+    Describe cómo dibujar cada motor, en forma serializable para los resultados
+
+    Args:
+        names: Nombres de los motores
+
+    Returns:
+        Diccionario nombre → {'label', 'short_label', 'color', 'marker'}
+    """
+    return {name: {key: get_engine(name)[key] for key in ('label', 'short_label', 'color', 'marker')}
+            for name in names}
+
+
+def load_entry_point_engines(group=ENTRY_POINT_GROUP):
+    """
+    Registra los motores declarados por paquetes instalados
+
+    Un punto de entrada defectuoso no impide cargar los demás: se informa y
+    se omite.
+
+    Args:
+        group: Grupo de puntos de entrada
+
+    Returns:
+        Lista de nombres de los puntos de entrada cargados
+    """
+    try:
+        entry_points = metadata.entry_points(group=group)
+    except TypeError:
+        # Python < 3.10: entry_points() devuelve un diccionario por grupo
+        entry_points = metadata.entry_points().get(group, [])
+    loaded = []
+    for entry_point in entry_points:
+        try:
+            target = entry_point.load()
+            if isinstance(target, type):
+                register_engine(entry_point.name, target,
+                                label=getattr(target, 'engine_label', None))
+            else:
+                target(register_engine)
+        except Exception as error:
+            print(f"Motor {entry_point.name} omitido ({entry_point.value}): {error}")
+            continue
+        loaded.append(entry_point.name)
+    return loaded
+
+
+register_engine('bst', BinarySearchTree, label='BST (sin balanceo)', short_label='BST',
+                instrumented=InstrumentedBinarySearchTree, color='red', marker='o')
+register_engine('rbt', RedBlackTree, label='Red-Black Tree', short_label='RBT',
+                instrumented=InstrumentedRedBlackTree, color='blue', marker='s')
+register_engine('btree', BTree, label='B-Tree (orden 64)', short_label='B-Tree')
+register_engine('splay', SplayTree, label='Splay Tree', short_label='Splay')
+register_engine('scapegoat', ScapegoatTree, label='BST chivo expiatorio (α=0.7)',
+                short_label='Scapegoat')
+register_engine('rbt_array', ArrayRedBlackTree, label='Red-Black Tree (arreglos)',
+                short_label='RBT arreglos')
+load_entry_point_engines()
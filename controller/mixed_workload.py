@@ -0,0 +1,122 @@
+"""
+Generación de mezclas de operaciones al estilo YCSB (búsqueda, inserción, eliminación)
+"""
+import bisect
+
+
+# Mezclas predefinidas: operación → proporción
+MIXES = {
+    'read_mostly': {'search': 0.95, 'insert': 0.05},
+    'read_heavy': {'search': 0.80, 'insert': 0.10, 'delete': 0.10},
+    'balanced': {'search': 0.50, 'insert': 0.25, 'delete': 0.25},
+    'write_heavy': {'search': 0.10, 'insert': 0.60, 'delete': 0.30}
+}
+
+# Distribuciones de acceso para elegir las llaves de búsqueda y eliminación
+DISTRIBUTIONS = ('uniform', 'zipf', 'latest')
+
+OPERATIONS = ('search', 'insert', 'delete')
+
+
+def resolve_mix(mix):
+    """
+    Normaliza una mezcla de operaciones
+
+    Args:
+        mix: Nombre de una mezcla de MIXES o diccionario operación → peso
+
+    Returns:
+        Diccionario operación → proporción (suman 1)
+
+    Raises:
+        ValueError: Si la mezcla no existe, usa operaciones desconocidas o
+            no tiene pesos positivos
+    """
+    if isinstance(mix, str):
+        if mix not in MIXES:
+            raise ValueError(f"Mezcla desconocida: {mix} (disponibles: {', '.join(MIXES)})")
+        mix = MIXES[mix]
+    unknown = set(mix) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"Operaciones desconocidas: {', '.join(sorted(unknown))}")
+    total = sum(weight for weight in mix.values() if weight > 0)
+    if total <= 0:
+        raise ValueError("La mezcla debe tener al menos una operación con peso positivo")
+    return {op: weight / total for op, weight in mix.items() if weight > 0}
+
+
+def generate_operations(preload, mix, distribution, rng, zipf_s=0.99):
+    """
+    Genera una secuencia infinita de operaciones sobre un árbol precargado
+
+    Se simula el conjunto de llaves vivas para que las búsquedas y
+    eliminaciones apunten a llaves existentes. Las inserciones usan llaves
+    nuevas mayores que todas las anteriores (como en YCSB), por lo que las
+    llaves precargadas deben ser numéricas.
+
+    - uniform: todas las llaves vivas son igual de probables
+    - zipf: pocas llaves (elegidas al azar) concentran la mayoría de accesos
+    - latest: las llaves insertadas más recientemente son las más accedidas
+
+    Args:
+        preload: Llaves ya insertadas en el árbol
+        mix: Diccionario operación → proporción (ver resolve_mix)
+        distribution: 'uniform', 'zipf' o 'latest'
+        rng: Generador random.Random ya sembrado
+        zipf_s: Exponente de la distribución de Zipf
+
+    Yields:
+        Tuplas (operación, llave)
+
+    Raises:
+        ValueError: Si la distribución no existe
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribución desconocida: {distribution} "
+                         f"(disponibles: {', '.join(DISTRIBUTIONS)})")
+
+    live = list(preload)
+    rng.shuffle(live)
+    next_key = max(live) + 1 if live else 1
+
+    # Rangos de Zipf sobre el tamaño inicial; se escalan al tamaño actual
+    ranks = max(len(live), 1)
+    cumulative = []
+    total = 0.0
+    for rank in range(1, ranks + 1):
+        total += 1.0 / rank ** zipf_s
+        cumulative.append(total)
+
+    def pick_index():
+        if distribution == 'uniform':
+            return rng.randrange(len(live))
+        rank = bisect.bisect_left(cumulative, rng.random() * total)
+        index = rank * len(live) // ranks
+        if distribution == 'latest':
+            # El rango 0 es la llave más reciente (al final de la lista)
+            return len(live) - 1 - index
+        return index
+
+    operations = list(mix)
+    cum_weights = []
+    running = 0.0
+    for op in operations:
+        running += mix[op]
+        cum_weights.append(running)
+
+    while True:
+        op = rng.choices(operations, cum_weights=cum_weights)[0]
+        if op == 'insert' or not live:
+            key = next_key
+            next_key += 1
+            live.append(key)
+            yield 'insert', key
+        elif op == 'search':
+            yield 'search', live[pick_index()]
+        else:
+            # Eliminación: se quita intercambiando con el último elemento
+            index = pick_index()
+            key = live[index]
+            live[index] = live[-1]
+            live.pop()
+            yield 'delete', key
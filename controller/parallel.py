@@ -0,0 +1,123 @@
+"""
+Ejecución de pruebas en procesos separados: grupo de procesos y aislamiento por prueba
+"""
+import gc
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def available_cpus():
+    """
+    Obtiene los núcleos que el proceso actual puede usar
+
+    Returns:
+        Lista ordenada de identificadores de núcleo
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(cpu_queue):
+    """
+    Inicializador de cada proceso: lo fija a un núcleo propio
+
+    Con cada proceso en su núcleo, el planificador no los mueve ni los hace
+    competir por el mismo núcleo, y las mediciones no se interfieren.
+
+    Args:
+        cpu_queue: Cola con los núcleos libres (None para no fijar)
+    """
+    if cpu_queue is None or not hasattr(os, 'sched_setaffinity'):
+        return
+    cpu = cpu_queue.get()
+    os.sched_setaffinity(0, {cpu})
+
+
+def run_cells(func, cells, workers=None, pin_cpus=True):
+    """
+    Ejecuta func(cell) para cada celda en procesos separados
+
+    Args:
+        func: Función de nivel de módulo (debe poder serializarse)
+        cells: Lista de argumentos, uno por tarea
+        workers: Cantidad de procesos; por defecto un núcleo menos que los
+            disponibles, para dejar uno libre al proceso principal
+        pin_cpus: Si True, cada proceso se fija a un núcleo distinto
+
+    Returns:
+        Lista de resultados en el mismo orden que cells
+    """
+    cpus = available_cpus()
+    if workers is None:
+        workers = max(1, len(cpus) - 1)
+
+    context = multiprocessing.get_context()
+    cpu_queue = None
+    if pin_cpus and workers <= len(cpus):
+        cpu_queue = context.Queue()
+        # Los núcleos más altos primero: el 0 suele atender interrupciones
+        for cpu in reversed(cpus[-workers:]):
+            cpu_queue.put(cpu)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_pin_worker, initargs=(cpu_queue,)) as executor:
+        return list(executor.map(func, cells))
+
+
+def _isolated_entry(connection, func, argument):
+    """
+    Punto de entrada del proceso aislado: ejecuta la prueba y envía el resultado
+
+    Args:
+        connection: Extremo de escritura del pipe hacia el proceso principal
+        func: Función a ejecutar
+        argument: Argumento de la función
+    """
+    # Con fork, el montículo heredado pasa a la generación permanente para
+    # que el recolector de la prueba no lo recorra
+    gc.collect()
+    gc.freeze()
+    try:
+        connection.send((True, func(argument)))
+    except Exception as error:
+        connection.send((False, f"{type(error).__name__}: {error}"))
+    finally:
+        connection.close()
+
+
+def run_isolated(func, argument, start_method='fork'):
+    """
+    Ejecuta func(argument) en un proceso nuevo y devuelve su resultado por un pipe
+
+    Los objetos creados por la prueba mueren con el proceso, así que la
+    siguiente medición no hereda su basura ni la fragmentación del montículo.
+
+    Args:
+        func: Función de nivel de módulo
+        argument: Argumento de la función (debe poder serializarse con 'spawn')
+        start_method: 'fork' (copia del proceso actual) o 'spawn' (intérprete nuevo)
+
+    Returns:
+        Valor devuelto por func
+
+    Raises:
+        RuntimeError: Si la prueba falla o el proceso termina sin responder
+    """
+    context = multiprocessing.get_context(start_method)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_isolated_entry, args=(sender, func, argument))
+    process.start()
+    sender.close()
+    try:
+        ok, payload = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(f"El proceso aislado terminó sin resultado (código {process.exitcode})")
+    finally:
+        receiver.close()
+    process.join()
+    if not ok:
+        raise RuntimeError(f"Falló la prueba aislada: {payload}")
+    return payload
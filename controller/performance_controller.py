@@ -1,27 +1,104 @@
 """
-Controlador para la comparación de rendimiento entre ABB y Red-Black Tree
+Controlador para la comparación de rendimiento entre motores de árboles
+
+Los contendientes salen del registro de controller.engines: por defecto el
+ABB y el Red-Black Tree, más los motores registrados por otros paquetes.
 """
+import gc
+import os
 import time
 import random
-from model import BinarySearchTree, RedBlackTree
+import bisect
+from itertools import islice
+import tracemalloc
+import numpy as np
+from controller.benchmark import Benchmark, summarize
+from controller.histogram import LatencyHistogram, timer_overhead_ns
+from controller.mixed_workload import resolve_mix, generate_operations
+from controller.parallel import run_cells, run_isolated
+from controller.workloads import generate_workload, dataset_hash, search_probes
+from controller.engines import engine_names, get_engine, engine_styles
+from model import (BinarySearchTree, RedBlackTree, ArrayRedBlackTree, BTree,
+                   OrderStatisticBinarySearchTree, OrderStatisticRedBlackTree)
+from model.engine import supports
 
 
 class PerformanceController:
     """Controlador para medir y comparar el rendimiento de los árboles"""
     
-    def __init__(self):
-        """Inicializa el controlador"""
-        self.bst_times = {
+    # Percentiles de latencia reportados por operación
+    LATENCY_PERCENTILES = (50, 95, 99, 99.9)
+    
+    # Variantes aumentadas con tamaños de subárbol que usan las pruebas de
+    # select()/rank() en lugar del motor registrado (que no los mantiene)
+    ORDER_STATISTIC_VARIANTS = {
+        'bst': OrderStatisticBinarySearchTree,
+        'rbt': OrderStatisticRedBlackTree
+    }
+    
+    def __init__(self, benchmark=None, seed=None, results_store=None, engines=None):
+        """
+        Inicializa el controlador
+        
+        Args:
+            benchmark: Motor de medición (Benchmark) usado por
+                compare_performance; por defecto 1 calentamiento y 5 repeticiones
+            seed: Semilla de los datos generados. Con semilla, cada combinación
+                (tipo de datos, tamaño) produce siempre los mismos datos
+            results_store: ResultsStore donde se guarda cada ejecución de
+                compare_performance (None para no guardar)
+            engines: Nombres de los motores a comparar, registrados en
+                controller.engines (por defecto, todos los registrados)
+            
+        Raises:
+            ValueError: Si algún motor no está registrado
+        """
+        self.benchmark = benchmark if benchmark is not None else Benchmark()
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.results_store = results_store
+        self.engines = list(engines) if engines is not None else engine_names()
+        for name in self.engines:
+            get_engine(name)
+        self.times = {name: self._empty_times() for name in self.engines}
+        self.frozen_times = self._empty_frozen_times()
+        self.data_sizes = []
+    
+    def _empty_times(self):
+        """
+        Crea el diccionario vacío de mediciones por fase
+        
+        Returns:
+            Diccionario con una lista por cada fase medida
+        """
+        return {
             'insert': [],
+            'bulk': [],
             'search': [],
-            'height': []
+            'search_batch': [],
+            'delete': [],
+            'height': [],
+            'memory': {
+                'peak': [],
+                'retained': [],
+                'bytes_per_key': [],
+                'rss': []
+            },
+            'stats': {}
         }
-        self.rbt_times = {
-            'insert': [],
+    
+    def _empty_frozen_times(self):
+        """
+        Crea el diccionario vacío de mediciones de la instantánea congelada
+        
+        Returns:
+            Diccionario con las fases de congelado y búsqueda
+        """
+        return {
+            'freeze': [],
             'search': [],
-            'height': []
+            'stats': {}
         }
-        self.data_sizes = []
     
     def generate_ordered_data(self, size):
         """
@@ -33,7 +110,7 @@ class PerformanceController:
         Returns:
             Lista de datos ordenados
         """
-        return list(range(1, size + 1))
+        return generate_workload('ordered', size, self.rng)
     
     def generate_random_data(self, size):
         """
@@ -45,9 +122,7 @@ class PerformanceController:
         Returns:
             Lista de datos aleatorios
         """
-        data = list(range(1, size + 1))
-        random.shuffle(data)
-        return data
+        return generate_workload('random', size, self.rng)
     
     def generate_reverse_data(self, size):
         """
@@ -59,7 +134,57 @@ class PerformanceController:
         Returns:
             Lista de datos en orden inverso
         """
-        return list(range(size, 0, -1))
+        return generate_workload('reverse', size, self.rng)
+    
+    def generate_k_sorted_data(self, size, k=16):
+        """
+        Genera datos casi ordenados: cada bloque de k elementos se desordena
+        
+        Args:
+            size: Cantidad de elementos
+            k: Tamaño del bloque; cada valor queda a menos de k posiciones de
+                su lugar en el orden ascendente
+            
+        Returns:
+            Lista de datos casi ordenados
+        """
+        return generate_workload('k_sorted', size, self.rng, k=k)
+    
+    def generate_data(self, size, data_type='random'):
+        """
+        Genera datos con un generador del registro de cargas de trabajo
+        
+        Args:
+            size: Cantidad de elementos
+            data_type: Nombre registrado en controller.workloads (por ejemplo
+                'random', 'ordered', 'reverse', 'k_sorted', 'zipf', 'strings')
+            
+        Returns:
+            Lista de datos
+            
+        Raises:
+            ValueError: Si el tipo de datos no está registrado
+        """
+        return generate_workload(data_type, size, self.rng)
+    
+    def generate_cell_data(self, size, data_type='random'):
+        """
+        Genera los datos de una combinación (tipo de datos, tamaño)
+        
+        Con semilla, el generador se deriva de (semilla, tipo, tamaño), de modo
+        que los datos no dependen del orden en que se ejecutan las pruebas ni
+        del proceso que las ejecuta.
+        
+        Args:
+            size: Cantidad de elementos
+            data_type: Tipo de datos
+            
+        Returns:
+            Lista de datos
+        """
+        if self.seed is None:
+            return self.generate_data(size, data_type)
+        return generate_workload(data_type, size, f"{self.seed}:{data_type}:{size}")
     
     def measure_insertion_time(self, tree, data):
         """
@@ -72,10 +197,43 @@ class PerformanceController:
         Returns:
             Tiempo transcurrido en segundos
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         for value in data:
             tree.insert(value)
-        end_time = time.time()
+        end_time = time.perf_counter()
+        return end_time - start_time
+    
+    def measure_bulk_build_time(self, tree_class, data):
+        """
+        Mide el tiempo de construcción masiva (ordenamiento + carga lineal)
+        
+        Args:
+            tree_class: Clase del árbol (BST o RBT) con from_iterable()
+            data: Lista de datos a cargar
+            
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        start_time = time.perf_counter()
+        tree_class.from_iterable(data)
+        end_time = time.perf_counter()
+        return end_time - start_time
+    
+    def measure_finger_insertion_time(self, tree, data):
+        """
+        Mide el tiempo de inserción en modo finger (RBT)
+        
+        Args:
+            tree: Árbol Red-Black
+            data: Lista de datos a insertar
+            
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        start_time = time.perf_counter()
+        for value in data:
+            tree.insert_finger(value)
+        end_time = time.perf_counter()
         return end_time - start_time
     
     def measure_search_time(self, tree, data):
@@ -89,82 +247,1474 @@ class PerformanceController:
         Returns:
             Tiempo transcurrido en segundos
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         for value in data:
             tree.search(value)
-        end_time = time.time()
+        end_time = time.perf_counter()
         return end_time - start_time
     
-    def compare_performance(self, data_sizes, data_type='random'):
+    def _read_rss(self):
+        """
+        Lee la memoria residente del proceso desde /proc/self/statm
+        
+        Returns:
+            Bytes residentes, o None si /proc no está disponible
         """
-        Compara el rendimiento de BST y RBT con diferentes tamaños de datos
+        try:
+            with open('/proc/self/statm') as statm:
+                resident_pages = int(statm.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    
+    def measure_memory_profile(self, tree_factory, data, include_rss=True):
+        """
+        Mide el pico y la memoria retenida al construir un árbol con los datos
+        
+        La memoria retenida es la diferencia entre instantáneas de tracemalloc
+        tomadas antes y después de la construcción (sin contar las trazas del
+        propio tracemalloc); el pico incluye los temporales de la construcción.
+        
+        Args:
+            tree_factory: Clase o función que crea un árbol vacío
+            data: Lista de datos a insertar
+            include_rss: Si True, mide también el crecimiento de la memoria
+                residente en una construcción separada sin tracemalloc
+            
+        Returns:
+            Diccionario con peak, retained y bytes_per_key (bytes retenidos
+            por llave) y rss (bytes residentes ganados, o None)
+        """
+        rss = None
+        if include_rss:
+            gc.collect()
+            rss_before = self._read_rss()
+            tree = tree_factory()
+            for value in data:
+                tree.insert(value)
+            rss_after = self._read_rss()
+            del tree
+            if rss_before is not None and rss_after is not None:
+                rss = rss_after - rss_before
+        
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        
+        tree = tree_factory()
+        for value in data:
+            tree.insert(value)
+        
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        after = tracemalloc.take_snapshot()
+        if not was_tracing:
+            tracemalloc.stop()
+        del tree
+        
+        # Se filtra después de tomar ambas instantáneas: el filtro compila
+        # patrones y esas asignaciones no deben contarse como retenidas
+        ignore_tracemalloc = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        before = before.filter_traces(ignore_tracemalloc)
+        after = after.filter_traces(ignore_tracemalloc)
+        retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        
+        size = len(data)
+        return {
+            'peak': peak,
+            'retained': retained,
+            'bytes_per_key': retained / size if size else 0,
+            'rss': rss
+        }
+    
+    def measure_memory_usage(self, tree_factory, data):
+        """
+        Mide la memoria retenida por un árbol construido con los datos
+        
+        Args:
+            tree_factory: Clase o función que crea un árbol vacío
+            data: Lista de datos a insertar
+            
+        Returns:
+            Bytes asignados que siguen vivos tras construir el árbol
+        """
+        return self.measure_memory_profile(tree_factory, data, include_rss=False)['retained']
+    
+    def compare_storage_engines(self, data_sizes, data_type='random'):
+        """
+        Compara el Red-Black Tree de objetos contra el basado en arreglos
         
         Args:
             data_sizes: Lista de tamaños de datos a probar
             data_type: Tipo de datos ('random', 'ordered', 'reverse')
             
         Returns:
-            Diccionario con los resultados de las pruebas
+            Diccionario con tiempos, alturas y bytes por llave de cada motor
         """
-        self.data_sizes = data_sizes
-        self.bst_times = {
-            'insert': [],
-            'search': [],
-            'height': []
+        engines = {
+            'rbt': RedBlackTree,
+            'rbt_array': ArrayRedBlackTree
         }
-        self.rbt_times = {
-            'insert': [],
-            'search': [],
-            'height': []
+        results = {
+            'data_sizes': data_sizes,
+            'data_type': data_type
         }
+        for name in engines:
+            results[name] = {
+                'insert': [],
+                'search': [],
+                'height': [],
+                'bytes_per_key': []
+            }
         
         for size in data_sizes:
-            # Generar datos según el tipo
-            if data_type == 'random':
-                data = self.generate_random_data(size)
-            elif data_type == 'ordered':
-                data = self.generate_ordered_data(size)
-            else:  # reverse
-                data = self.generate_reverse_data(size)
-            
-            # Pruebas con BST
-            bst = BinarySearchTree()
-            bst_insert_time = self.measure_insertion_time(bst, data)
-            bst_search_time = self.measure_search_time(bst, data)
-            bst_height = bst.height()
-            
-            self.bst_times['insert'].append(bst_insert_time)
-            self.bst_times['search'].append(bst_search_time)
-            self.bst_times['height'].append(bst_height)
-            
-            # Pruebas con RBT
-            rbt = RedBlackTree()
-            rbt_insert_time = self.measure_insertion_time(rbt, data)
-            rbt_search_time = self.measure_search_time(rbt, data)
-            rbt_height = rbt.height()
-            
-            self.rbt_times['insert'].append(rbt_insert_time)
-            self.rbt_times['search'].append(rbt_search_time)
-            self.rbt_times['height'].append(rbt_height)
-            
-            print(f"Tamaño {size}: BST altura={bst_height}, RBT altura={rbt_height}")
+            data = self.generate_data(size, data_type)
+            
+            for name, tree_class in engines.items():
+                tree = tree_class()
+                insert_time = self.measure_insertion_time(tree, data)
+                search_time = self.measure_search_time(tree, data)
+                
+                results[name]['insert'].append(insert_time)
+                results[name]['search'].append(search_time)
+                results[name]['height'].append(tree.height())
+                del tree
+                
+                retained = self.measure_memory_usage(tree_class, data)
+                results[name]['bytes_per_key'].append(retained / size if size else 0)
+            
+            print(f"Tamaño {size}: RBT {results['rbt']['bytes_per_key'][-1]:.1f} B/llave, "
+                  f"RBT arreglos {results['rbt_array']['bytes_per_key'][-1]:.1f} B/llave")
         
-        return {
-            'data_sizes': self.data_sizes,
-            'bst': self.bst_times,
-            'rbt': self.rbt_times,
+        return results
+    
+    def measure_batched_search_time(self, tree, data, batch_size=1000):
+        """
+        Mide el tiempo de búsqueda por lotes con search_many()
+        
+        Args:
+            tree: Árbol (BST o RBT)
+            data: Lista de datos a buscar
+            batch_size: Cantidad de valores por lote
+            
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        batches = [data[i:i + batch_size] for i in range(0, len(data), batch_size)]
+        start_time = time.perf_counter()
+        for batch in batches:
+            tree.search_many(batch)
+        end_time = time.perf_counter()
+        return end_time - start_time
+    
+    def measure_freeze_time(self, tree):
+        """
+        Mide el tiempo de congelar un árbol en disposición Eytzinger
+        
+        Args:
+            tree: Árbol (BST o RBT) ya construido
+            
+        Returns:
+            Tupla (tiempo en segundos, instantánea creada)
+        """
+        start_time = time.perf_counter()
+        frozen = tree.freeze()
+        end_time = time.perf_counter()
+        return end_time - start_time, frozen
+    
+    def measure_frozen_search_time(self, frozen, data):
+        """
+        Mide el tiempo de búsqueda vectorizada en una instantánea congelada
+        
+        Args:
+            frozen: Instantánea creada con freeze()
+            data: Lista de datos a buscar
+            
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        queries = np.asarray(data)
+        start_time = time.perf_counter()
+        frozen.contains_many(queries)
+        end_time = time.perf_counter()
+        return end_time - start_time
+    
+    def measure_deletion_time(self, tree, data):
+        """
+        Mide el tiempo de eliminación de datos en un árbol
+        
+        Args:
+            tree: Árbol (BST o RBT)
+            data: Lista de datos a eliminar
+            
+        Returns:
+            Tiempo transcurrido en segundos
+        """
+        start_time = time.perf_counter()
+        for value in data:
+            tree.delete(value)
+        end_time = time.perf_counter()
+        return end_time - start_time
+    
+    def measure_order_statistics_time(self, tree, positions, keys):
+        """
+        Mide select() y rank() aumentados contra la línea base con lista inorden
+        
+        Args:
+            tree: Árbol (BST o RBT) ya construido
+            positions: Posiciones para select()
+            keys: Valores para rank()
+            
+        Returns:
+            Tupla (select, rank, select_baseline, rank_baseline) en segundos
+        """
+        start_time = time.perf_counter()
+        for k in positions:
+            tree.select(k)
+        select_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        for key in keys:
+            tree.rank(key)
+        rank_time = time.perf_counter() - start_time
+        
+        # Línea base: recorrer el árbol completo en cada consulta
+        start_time = time.perf_counter()
+        for k in positions:
+            tree.inorder_traversal()[k]
+        select_baseline = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        for key in keys:
+            bisect.bisect_left(tree.inorder_traversal(), key)
+        rank_baseline = time.perf_counter() - start_time
+        
+        return select_time, rank_time, select_baseline, rank_baseline
+    
+    def compare_order_statistics(self, data_sizes, data_type='random', queries=100):
+        """
+        Compara rank/select en O(log n) contra la línea base basada en listas
+        
+        El ABB y el RBT se reemplazan por sus variantes aumentadas
+        (ORDER_STATISTIC_VARIANTS); los demás motores participan si
+        implementan select() y rank().
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_type: Tipo de datos ('random', 'ordered', 'reverse')
+            queries: Cantidad de consultas select() y rank() por tamaño
+            
+        Returns:
+            Diccionario con los tiempos de cada árbol y de la línea base
+        """
+        results = {
+            'data_sizes': data_sizes,
             'data_type': data_type
         }
+        factories = {name: self.ORDER_STATISTIC_VARIANTS.get(name, get_engine(name)['factory'])
+                     for name in self.engines}
+        engines = [name for name in self.engines
+                   if supports(factories[name], 'select') and supports(factories[name], 'rank')]
+        for name in engines:
+            results[name] = {
+                'select': [],
+                'rank': [],
+                'select_baseline': [],
+                'rank_baseline': []
+            }
+        
+        for size in data_sizes:
+            data = self.generate_data(size, data_type)
+            positions = [self.rng.randrange(size) for _ in range(queries)]
+            keys = [self.rng.choice(data) for _ in range(queries)]
+            
+            for name in engines:
+                tree = self._build_tree(factories[name], data)
+                
+                times = self.measure_order_statistics_time(tree, positions, keys)
+                for phase, elapsed in zip(('select', 'rank', 'select_baseline', 'rank_baseline'), times):
+                    results[name][phase].append(elapsed)
+            
+            for name in engines:
+                print(f"Tamaño {size}: {get_engine(name)['short_label']} "
+                      f"select={results[name]['select'][-1]:.6f}s "
+                      f"(lista {results[name]['select_baseline'][-1]:.6f}s), "
+                      f"rank={results[name]['rank'][-1]:.6f}s "
+                      f"(lista {results[name]['rank_baseline'][-1]:.6f}s)")
+        
+        return results
     
-    def get_results(self):
+    def compare_finger_insertion(self, data_sizes, data_types=('ordered', 'reverse', 'k_sorted')):
         """
-        Obtiene los resultados de las pruebas
+        Compara la inserción finger contra el descenso desde la raíz en el RBT
+        
+        Ambas fases pasan por el motor de medición (calentamiento y
+        repeticiones) partiendo cada vez de un árbol vacío.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_types: Tipos de datos casi ordenados a probar
+            
+        Returns:
+            Diccionario con las medianas 'root' y 'finger' por tipo de datos
+            y la distribución completa en 'stats'
+        """
+        results = {
+            'data_sizes': data_sizes,
+            'seed': self.seed
+        }
+        for data_type in data_types:
+            results[data_type] = {
+                'root': [],
+                'finger': [],
+                'stats': {}
+            }
+        
+        for size in data_sizes:
+            for data_type in data_types:
+                data = self.generate_cell_data(size, data_type)
+                
+                def insert_all(tree):
+                    for value in data:
+                        tree.insert(value)
+                
+                def insert_finger_all(tree):
+                    for value in data:
+                        tree.insert_finger(value)
+                
+                times = results[data_type]
+                self._record(times, 'root', self.benchmark.run(insert_all, RedBlackTree))
+                self._record(times, 'finger', self.benchmark.run(insert_finger_all, RedBlackTree))
+                
+                print(f"Tamaño {size} ({data_type}): raíz={times['root'][-1]:.6f}s, "
+                      f"finger={times['finger'][-1]:.6f}s")
+        
+        return results
+    
+    def measure_operation_counts(self, tree_class, data):
+        """
+        Cuenta las operaciones elementales de insertar y buscar los datos
+        
+        Args:
+            tree_class: Clase instrumentada (InstrumentedBinarySearchTree o
+                InstrumentedRedBlackTree)
+            data: Lista de datos a insertar y luego buscar
+            
+        Returns:
+            Diccionario con los contadores del árbol
+        """
+        tree = tree_class()
+        for value in data:
+            tree.insert(value)
+        for value in data:
+            tree.search(value)
+        return tree.counters
+    
+    def _record(self, times, phase, stats):
+        """
+        Guarda una medición: la mediana como valor principal y la distribución completa
+        
+        Args:
+            times: Diccionario de mediciones del contendiente
+            phase: Nombre de la fase
+            stats: Estadísticas devueltas por Benchmark.run
+        """
+        times[phase].append(stats['median'])
+        times['stats'].setdefault(phase, []).append(stats)
+    
+    def _build_tree(self, tree_class, data):
+        """
+        Construye un árbol insertando los datos (fuera de la región medida)
+        
+        Args:
+            tree_class: Clase del árbol
+            data: Lista de datos a insertar
+            
+        Returns:
+            Árbol construido
+        """
+        tree = tree_class()
+        for value in data:
+            tree.insert(value)
+        return tree
+    
+    def _benchmark_tree(self, tree_class, data, times, measure_memory=True, probes=None):
+        """
+        Mide todas las fases de un árbol con el motor de medición
+        
+        Las fases opcionales (carga masiva, búsqueda por lotes y eliminación)
+        solo se miden si la clase tiene la operación; si no, su lista queda
+        más corta que data_sizes (vacía si el motor nunca la implementa).
+        
+        Args:
+            tree_class: Clase del motor (cumple OrderedSetEngine)
+            data: Lista de datos de la prueba
+            times: Diccionario de mediciones donde guardar los resultados
+            measure_memory: Si True, agrega la fase de memoria en times['memory']
+            probes: Llaves de la fase de búsqueda (por defecto, los datos:
+                todas las búsquedas aciertan)
+            
+        Returns:
+            Árbol construido con los datos, para mediciones posteriores
+        """
+        def insert_all(tree):
+            for value in data:
+                tree.insert(value)
+        
+        probes = data if probes is None else probes
+        
+        def search_all(tree):
+            for value in probes:
+                tree.search(value)
+        
+        batches = [probes[i:i + 1000] for i in range(0, len(probes), 1000)]
+        
+        def search_batches(tree):
+            for batch in batches:
+                tree.search_many(batch)
+        
+        def delete_all(tree):
+            for value in data:
+                tree.delete(value)
+        
+        benchmark = self.benchmark
+        tree = self._build_tree(tree_class, data)
+        
+        self._record(times, 'insert', benchmark.run(insert_all, tree_class))
+        if supports(tree_class, 'from_iterable'):
+            self._record(times, 'bulk', benchmark.run(lambda _: tree_class.from_iterable(data)))
+        self._record(times, 'search', benchmark.run(search_all, lambda: tree))
+        if supports(tree_class, 'search_many'):
+            self._record(times, 'search_batch', benchmark.run(search_batches, lambda: tree))
+        if supports(tree_class, 'delete'):
+            self._record(times, 'delete',
+                         benchmark.run(delete_all, lambda: self._build_tree(tree_class, data)))
+        times['height'].append(tree.height())
+        
+        # Fase de memoria: después de los tiempos, porque tracemalloc los altera
+        if measure_memory:
+            for name, value in self.measure_memory_profile(tree_class, data).items():
+                times['memory'][name].append(value)
+        return tree
+    
+    def _benchmark_frozen(self, tree, probes, times):
+        """
+        Mide el congelado de un árbol y la búsqueda vectorizada en la instantánea
+        
+        Args:
+            tree: Árbol ya construido con los datos
+            probes: Lista de llaves a buscar
+            times: Diccionario de mediciones de la instantánea
+        """
+        frozen = tree.freeze()
+        queries = np.asarray(probes)
+        self._record(times, 'freeze',
+                     self.benchmark.run(lambda source: source.freeze(), lambda: tree))
+        self._record(times, 'search',
+                     self.benchmark.run(lambda snapshot: snapshot.contains_many(queries), lambda: frozen))
+    
+    def _count_operations(self, tree_class, data, times):
+        """
+        Acumula los contadores de un árbol instrumentado en times['counters']
+        
+        Args:
+            tree_class: Clase instrumentada
+            data: Lista de datos de la prueba
+            times: Diccionario de mediciones del contendiente
+        """
+        counters = self.measure_operation_counts(tree_class, data)
+        for name, value in counters.items():
+            times.setdefault('counters', {}).setdefault(name, []).append(value)
+    
+    def measure_contender(self, name, data, count_operations=False, measure_memory=True,
+                          probes=None):
+        """
+        Mide un solo contendiente sobre un conjunto de datos
+        
+        Es la unidad de trabajo de la ejecución en paralelo: no comparte
+        estado con otros contendientes ni con otros tamaños.
+        
+        Args:
+            name: Motor registrado en controller.engines o 'frozen'
+            data: Lista de datos de la prueba
+            count_operations: Si True, agrega los contadores de operaciones
+                (solo en motores con clase instrumentada)
+            measure_memory: Si True, agrega la fase de memoria (no en 'frozen')
+            probes: Llaves de la fase de búsqueda (por defecto, los datos)
+            
+        Returns:
+            Diccionario de mediciones con un valor por fase
+        """
+        if probes is None:
+            probes = data
+        if name == 'frozen':
+            times = self._empty_frozen_times()
+            self._benchmark_frozen(self._build_tree(RedBlackTree, data), probes, times)
+            return times
+        
+        engine = get_engine(name)
+        times = self._empty_times()
+        self._benchmark_tree(engine['factory'], data, times, measure_memory, probes)
+        if count_operations and engine['instrumented'] is not None:
+            self._count_operations(engine['instrumented'], data, times)
+        return times
+    
+    def _merge_times(self, times, trial):
+        """
+        Agrega las mediciones de una prueba aislada al diccionario del contendiente
+        
+        Args:
+            times: Diccionario de mediciones acumuladas
+            trial: Diccionario devuelto por measure_contender
+        """
+        for phase, entries in trial['stats'].items():
+            for stats in entries:
+                self._record(times, phase, stats)
+        if 'height' in trial:
+            times['height'].extend(trial['height'])
+        for name, values in trial.get('memory', {}).items():
+            times['memory'][name].extend(values)
+        for name, values in trial.get('counters', {}).items():
+            times.setdefault('counters', {}).setdefault(name, []).extend(values)
+    
+    def search_probe_keys(self, data, data_type, hit_ratio=1.0):
+        """
+        Obtiene las llaves de la fase de búsqueda con una proporción de aciertos
+        
+        Args:
+            data: Llaves insertadas
+            data_type: Tipo de datos (forma parte de la semilla de las consultas)
+            hit_ratio: Fracción de búsquedas que existen; con 1.0 se buscan
+                exactamente los datos insertados
+            
+        Returns:
+            Lista de llaves a buscar, del mismo tamaño que data
+        """
+        if hit_ratio >= 1.0:
+            return data
+        seed = self.rng if self.seed is None else f"{self.seed}:probes:{data_type}:{len(data)}"
+        return search_probes(data, len(data), hit_ratio, seed)[0]
+    
+    def compare_performance(self, data_sizes, data_type='random', count_operations=False,
+                            isolation=None, hit_ratio=1.0):
+        """
+        Compara el rendimiento de los motores con diferentes tamaños de datos
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_type: Tipo de datos registrado en controller.workloads
+            count_operations: Si True, repite la construcción y búsqueda con
+                árboles instrumentados y guarda los contadores en 'counters'
+                (solo en motores con clase instrumentada)
+            isolation: None para medir en este proceso, o 'fork'/'spawn' para
+                medir cada contendiente y tamaño en un proceso nuevo
+            hit_ratio: Fracción de búsquedas de llaves existentes; el resto son
+                llaves ausentes entre las existentes y fuera de su rango
+            
+        Returns:
+            Diccionario con los resultados de las pruebas: una entrada por
+            motor, 'frozen' y 'engines' (nombre → etiqueta, color y marcador)
+        """
+        self.data_sizes = data_sizes
+        self.times = {name: self._empty_times() for name in self.engines}
+        self.frozen_times = self._empty_frozen_times()
+        if count_operations:
+            for name in self.engines:
+                if get_engine(name)['instrumented'] is not None:
+                    self.times[name]['counters'] = {}
+        hashes = []
+        
+        for size in data_sizes:
+            data = self.generate_cell_data(size, data_type)
+            hashes.append(dataset_hash(data))
+            probes = self.search_probe_keys(data, data_type, hit_ratio)
+            
+            if isolation is not None:
+                # Cada contendiente en un proceso propio con el montículo limpio
+                for name in self.engines + ['frozen']:
+                    trial = run_isolated(_run_isolated_trial,
+                                         (self.benchmark, name, data, count_operations, probes),
+                                         isolation)
+                    self._merge_times(self.times.get(name, self.frozen_times), trial)
+                print(f"Tamaño {size}: {self._format_heights()} (aislado: {isolation})")
+                continue
+            
+            # Pruebas con cada motor; el RBT se conserva para congelarlo
+            frozen_source = None
+            for name in self.engines:
+                tree = self._benchmark_tree(get_engine(name)['factory'], data, self.times[name],
+                                            probes=probes)
+                if name == 'rbt':
+                    frozen_source = tree
+                del tree
+            
+            # Instantánea congelada: contendiente extra en la búsqueda
+            if frozen_source is None:
+                frozen_source = self._build_tree(RedBlackTree, data)
+            self._benchmark_frozen(frozen_source, probes, self.frozen_times)
+            del frozen_source
+            
+            # Conteo de operaciones fuera de las regiones cronometradas
+            for name in self.engines:
+                if 'counters' in self.times[name]:
+                    self._count_operations(get_engine(name)['instrumented'], data, self.times[name])
+            
+            print(f"Tamaño {size}: {self._format_heights()}")
+        
+        return self._store(self.get_results({
+            'data_type': data_type,
+            'seed': self.seed,
+            'dataset_hash': hashes,
+            'hit_ratio': hit_ratio,
+            'isolation': isolation
+        }))
+    
+    def _format_heights(self):
+        """
+        Formatea la última altura medida de cada motor
+        
+        Returns:
+            Texto 'BST altura=..., RBT altura=...'
+        """
+        return ", ".join(f"{get_engine(name)['short_label']} altura={self.times[name]['height'][-1]}"
+                         for name in self.engines)
+    
+    def _store(self, results):
+        """
+        Guarda una ejecución en el almacén de resultados, si hay uno configurado
         
+        Args:
+            results: Resultados de compare_performance
+            
         Returns:
-            Diccionario con los resultados
+            Los mismos resultados, con 'run_id' si se guardaron
+        """
+        if self.results_store is not None:
+            results['run_id'] = self.results_store.save(results)
+        return results
+    
+    def compare_isolation_bias(self, data_sizes, data_type='random', isolation='fork'):
         """
+        Cuantifica el sesgo de medir todos los contendientes en el mismo proceso
+        
+        Ejecuta las mismas pruebas (con los mismos datos) en este proceso y
+        aisladas, y calcula la diferencia relativa de cada fase:
+        (en proceso - aislado) / aislado.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_type: Tipo de datos
+            isolation: Método de aislamiento ('fork' o 'spawn')
+            
+        Returns:
+            Diccionario con 'in_process', 'isolated' y 'bias' (contendiente →
+            fase → lista de diferencias relativas por tamaño)
+        """
+        seed = self.seed
+        if seed is None:
+            # Ambas ejecuciones deben ver exactamente los mismos datos
+            self.seed = random.randrange(2 ** 32)
+        try:
+            in_process = self.compare_performance(data_sizes, data_type)
+            isolated = self.compare_performance(data_sizes, data_type, isolation=isolation)
+        finally:
+            self.seed = seed
+        
+        bias = {}
+        for name in self.engines + ['frozen']:
+            bias[name] = {}
+            for phase in in_process[name]['stats']:
+                bias[name][phase] = [
+                    (shared - alone) / alone if alone else 0.0
+                    for shared, alone in zip(in_process[name][phase], isolated[name][phase])
+                ]
+        
+        for i, size in enumerate(data_sizes):
+            changes = ", ".join(f"{name} {phase}={bias[name][phase][i]:+.1%}"
+                                for name in self.engines for phase in ('insert', 'search'))
+            print(f"Tamaño {size}: sesgo en proceso vs aislado: {changes}")
+        
         return {
+            'data_sizes': data_sizes,
+            'data_type': data_type,
+            'in_process': in_process,
+            'isolated': isolated,
+            'bias': bias
+        }
+    
+    def compare_performance_parallel(self, data_sizes, data_types=('random', 'ordered', 'reverse'),
+                                     count_operations=False, workers=None, pin_cpus=True,
+                                     hit_ratio=1.0):
+        """
+        Ejecuta la matriz completa de pruebas en un grupo de procesos
+        
+        Cada celda (tipo de datos, tamaño, contendiente, repetición) es una
+        tarea independiente. Las muestras de las repeticiones se reúnen al
+        final y se resumen igual que en compare_performance, por lo que cada
+        resultado tiene la misma forma que el de la ejecución secuencial.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_types: Tipos de datos a probar
+            count_operations: Si True, agrega los contadores de operaciones
+            workers: Cantidad de procesos (por defecto, un núcleo menos que los
+                disponibles, para dejar uno libre al proceso principal)
+            pin_cpus: Si True, cada proceso se fija a un núcleo distinto
+            hit_ratio: Fracción de búsquedas de llaves existentes
+            
+        Returns:
+            Diccionario tipo de datos → resultados de compare_performance
+        """
+        seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        benchmark = self.benchmark
+        cells = []
+        for data_type in data_types:
+            for size in data_sizes:
+                for name in self.engines + ['frozen']:
+                    for repeat in range(benchmark.repeats):
+                        cells.append({
+                            'seed': seed,
+                            'data_type': data_type,
+                            'size': size,
+                            'contender': name,
+                            'repeat': repeat,
+                            'warmup': benchmark.warmup,
+                            'disable_gc': benchmark.disable_gc,
+                            'count_operations': count_operations and repeat == 0,
+                            'measure_memory': repeat == 0,
+                            'hit_ratio': hit_ratio
+                        })
+        # Las celdas grandes primero para equilibrar la carga entre procesos
+        cells.sort(key=lambda cell: -cell['size'])
+        
+        outputs = run_cells(_run_benchmark_cell, cells, workers=workers, pin_cpus=pin_cpus)
+        
+        # Reunir las muestras de cada (tipo, tamaño, contendiente) en orden de repetición
+        samples = {}
+        for cell, times in zip(cells, outputs):
+            key = (cell['data_type'], cell['size'], cell['contender'])
+            samples.setdefault(key, []).append((cell['repeat'], times))
+        
+        all_results = {}
+        for data_type in data_types:
+            results = {
+                'data_sizes': data_sizes,
+                'engines': engine_styles(self.engines),
+                'frozen': self._empty_frozen_times(),
+                'data_type': data_type,
+                'seed': seed,
+                'dataset_hash': [],
+                'hit_ratio': hit_ratio,
+                'isolation': 'parallel'
+            }
+            for name in self.engines:
+                results[name] = self._empty_times()
+            for size in data_sizes:
+                cell_data = generate_workload(data_type, size, f"{seed}:{data_type}:{size}")
+                results['dataset_hash'].append(dataset_hash(cell_data))
+                for name in self.engines + ['frozen']:
+                    repeats = [times for _, times in sorted(samples[(data_type, size, name)],
+                                                            key=lambda item: item[0])]
+                    target = results[name]
+                    for phase in repeats[0]['stats']:
+                        merged = [value for times in repeats
+                                  for entry in times['stats'][phase] for value in entry['samples']]
+                        self._record(target, phase, summarize(merged))
+                    if 'height' in target:
+                        target['height'].append(repeats[0]['height'][0])
+                    for measure, values in repeats[0].get('memory', {}).items():
+                        target['memory'][measure].extend(values)
+                    for counter, values in repeats[0].get('counters', {}).items():
+                        target.setdefault('counters', {}).setdefault(counter, []).extend(values)
+            all_results[data_type] = self._store(results)
+        
+        return all_results
+    
+    def run_mixed_workload(self, tree, operations, count=None, duration=None, chunk_size=1000):
+        """
+        Ejecuta una secuencia de operaciones mezcladas midiendo cada llamada
+        
+        Las operaciones se extraen por bloques fuera de la región medida, así
+        el costo de generarlas no se suma a la latencia ni al rendimiento. Las
+        latencias se acumulan en histogramas (con el costo del reloj restado).
+        
+        Args:
+            tree: Árbol ya precargado
+            operations: Iterador de tuplas (operación, llave)
+            count: Cantidad de operaciones a ejecutar
+            duration: Duración en segundos (alternativa a count); si no se
+                indica ninguna, se ejecutan 10000 operaciones
+            chunk_size: Operaciones generadas por bloque
+            
+        Returns:
+            Diccionario con operations, elapsed (s), ops_per_sec, latency
+            (operación → percentiles en nanosegundos) e histograms
+            (operación → LatencyHistogram)
+        """
+        if count is None and duration is None:
+            count = 10000
+        methods = {op: getattr(tree, op) for op in ('search', 'insert', 'delete') if supports(tree, op)}
+        histograms = {}
+        overhead = timer_overhead_ns()
+        clock = time.perf_counter_ns
+        elapsed = 0
+        done = 0
+        
+        gc_was_enabled = gc.isenabled()
+        if self.benchmark.disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            while count is None or done < count:
+                size = chunk_size if count is None else min(chunk_size, count - done)
+                batch = [(methods[op], histograms.setdefault(op, LatencyHistogram()).record, key)
+                         for op, key in islice(operations, size)]
+                chunk_start = clock()
+                for method, record, key in batch:
+                    start = clock()
+                    method(key)
+                    record(clock() - start - overhead)
+                elapsed += clock() - chunk_start
+                done += len(batch)
+                if duration is not None and elapsed >= duration * 1e9:
+                    break
+        finally:
+            if self.benchmark.disable_gc and gc_was_enabled:
+                gc.enable()
+        
+        return {
+            'operations': done,
+            'elapsed': elapsed / 1e9,
+            'ops_per_sec': done / (elapsed / 1e9) if elapsed else 0.0,
+            'latency': {op: self._latency_percentiles(histogram) for op, histogram in histograms.items()},
+            'histograms': histograms
+        }
+    
+    def _latency_percentiles(self, histogram):
+        """
+        Resume un histograma de latencias en percentiles
+        
+        Args:
+            histogram: LatencyHistogram con latencias en nanosegundos
+            
+        Returns:
+            Diccionario con count, p50, p95, p99, p99.9 y max (nanosegundos)
+        """
+        summary = {'count': histogram.total}
+        summary.update(histogram.percentiles(self.LATENCY_PERCENTILES))
+        summary['max'] = histogram.max
+        return summary
+    
+    def compare_mixed_workload(self, data_sizes, mix='read_mostly', distribution='zipf',
+                               count=10000, duration=None, data_type='random'):
+        """
+        Compara los motores bajo una mezcla de operaciones sobre árboles precargados
+        
+        Todos los árboles reciben exactamente la misma secuencia de operaciones.
+        Los motores sin alguna operación de la mezcla (por ejemplo, sin
+        delete) se omiten.
+        
+        Args:
+            data_sizes: Tamaños de la precarga
+            mix: Nombre de una mezcla de controller.mixed_workload.MIXES o
+                diccionario operación → peso ('search', 'insert', 'delete')
+            distribution: Distribución de acceso ('uniform', 'zipf', 'latest')
+            count: Cantidad de operaciones por árbol y tamaño
+            duration: Duración en segundos por árbol (reemplaza a count)
+            data_type: Tipo de datos de la precarga (llaves numéricas)
+            
+        Returns:
+            Diccionario con ops_per_sec y latency (operación → percentil →
+            lista por tamaño, en nanosegundos) de cada árbol
+        """
+        mix = resolve_mix(mix)
+        seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        results = {
+            'data_sizes': data_sizes,
+            'data_type': data_type,
+            'mix': mix,
+            'distribution': distribution,
+            'seed': seed
+        }
+        engines = [name for name in self.engines
+                   if all(supports(get_engine(name)['factory'], op) for op in mix)]
+        results['engines'] = engine_styles(engines)
+        for name in engines:
+            results[name] = {
+                'ops_per_sec': [],
+                'operations': [],
+                'latency': {op: {} for op in mix}
+            }
+        
+        for size in data_sizes:
+            preload = generate_workload(data_type, size, f"{seed}:{data_type}:{size}")
+            for name in engines:
+                tree = self._build_tree(get_engine(name)['factory'], preload)
+                operations = generate_operations(
+                    preload, mix, distribution, random.Random(f"{seed}:mixed:{size}"))
+                run = self.run_mixed_workload(tree, operations,
+                                              count=None if duration is not None else count,
+                                              duration=duration)
+                del tree
+                
+                results[name]['ops_per_sec'].append(run['ops_per_sec'])
+                results[name]['operations'].append(run['operations'])
+                for op in mix:
+                    summary = run['latency'].get(op) or self._latency_percentiles(LatencyHistogram())
+                    for measure, value in summary.items():
+                        results[name]['latency'][op].setdefault(measure, []).append(value)
+            
+            print(f"Tamaño {size}: " + ", ".join(
+                f"{get_engine(name)['short_label']} {results[name]['ops_per_sec'][-1]:,.0f} ops/s"
+                for name in engines))
+        
+        return results
+    
+    def record_latencies(self, tree, operation, data, histogram, overhead=0):
+        """
+        Cronometra cada llamada individual de una operación del árbol
+        
+        Args:
+            tree: Árbol sobre el que se opera
+            operation: Nombre del método ('insert', 'search' o 'delete')
+            data: Llaves, una llamada por llave
+            histogram: LatencyHistogram donde registrar cada latencia
+            overhead: Costo del reloj en nanosegundos, restado a cada muestra
+        """
+        method = getattr(tree, operation)
+        record = histogram.record
+        clock = time.perf_counter_ns
+        for key in data:
+            start = clock()
+            method(key)
+            record(clock() - start - overhead)
+    
+    def compare_latency_distribution(self, data_sizes, data_type='random'):
+        """
+        Registra la latencia de cada inserción y búsqueda individual
+        
+        A diferencia de los tiempos agregados, el histograma conserva la cola:
+        en un ABB degenerado unas pocas inserciones pueden costar miles de
+        veces la mediana.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_type: Tipo de datos registrado en controller.workloads
+            
+        Returns:
+            Diccionario con un LatencyHistogram por tamaño en 'insert' y
+            'search' de cada árbol, y el costo del reloj restado
+        """
+        overhead = timer_overhead_ns()
+        results = {
+            'data_sizes': data_sizes,
+            'data_type': data_type,
+            'timer_overhead_ns': overhead
+        }
+        results['engines'] = engine_styles(self.engines)
+        for name in self.engines:
+            results[name] = {
+                'insert': [],
+                'search': []
+            }
+        
+        gc_was_enabled = gc.isenabled()
+        for size in data_sizes:
+            data = self.generate_cell_data(size, data_type)
+            for name in self.engines:
+                tree = get_engine(name)['factory']()
+                insert_histogram = LatencyHistogram()
+                search_histogram = LatencyHistogram()
+                if self.benchmark.disable_gc:
+                    gc.collect()
+                    gc.disable()
+                try:
+                    self.record_latencies(tree, 'insert', data, insert_histogram, overhead)
+                    self.record_latencies(tree, 'search', data, search_histogram, overhead)
+                finally:
+                    if self.benchmark.disable_gc and gc_was_enabled:
+                        gc.enable()
+                del tree
+                results[name]['insert'].append(insert_histogram)
+                results[name]['search'].append(search_histogram)
+            
+            print(f"Tamaño {size}: inserción p50/p99/máx " + ", ".join(
+                f"{get_engine(name)['short_label']}={self._format_tail(results[name]['insert'][-1])}"
+                for name in self.engines))
+        
+        return results
+    
+    def _format_tail(self, histogram):
+        """
+        Formatea la mediana, el p99 y el máximo de un histograma en µs
+        
+        Args:
+            histogram: LatencyHistogram en nanosegundos
+            
+        Returns:
+            Texto 'p50/p99/máx µs'
+        """
+        values = (histogram.value_at_percentile(50), histogram.value_at_percentile(99), histogram.max)
+        return '/'.join(f"{(value or 0) / 1000:.1f}" for value in values) + " µs"
+    
+    def geometric_checkpoints(self, max_size, count=50, start=100):
+        """
+        Calcula tamaños de control espaciados geométricamente
+        
+        Args:
+            max_size: Último tamaño (incluido)
+            count: Cantidad aproximada de puntos
+            start: Primer tamaño
+            
+        Returns:
+            Lista ordenada de tamaños enteros distintos
+        """
+        start = max(1, min(start, max_size))
+        if count <= 1 or start == max_size:
+            return [max_size]
+        ratio = (max_size / start) ** (1 / (count - 1))
+        return sorted({min(max_size, round(start * ratio ** i)) for i in range(count)} | {max_size})
+    
+    def compare_growth(self, max_size, checkpoints=50, data_type='random',
+                       search_samples=1000, trace_memory=False):
+        """
+        Mide cada motor mientras crece, en puntos de control, con una sola construcción
+        
+        En cada punto de control se registra el costo marginal de inserción
+        (las llaves agregadas desde el punto anterior), el costo de búsqueda
+        sobre una muestra de llaves presentes, la altura y la memoria.
+        
+        Args:
+            max_size: Tamaño final de cada árbol
+            checkpoints: Cantidad de puntos de control (o lista de tamaños)
+            data_type: Tipo de datos registrado en controller.workloads
+            search_samples: Búsquedas muestreadas en cada punto de control
+            trace_memory: Si True, la memoria se mide con tracemalloc (exacta
+                pero más lenta, y encarece también las inserciones medidas);
+                si False, con el crecimiento de la memoria residente
+            
+        Returns:
+            Diccionario con insert_per_key y search_per_key (segundos por
+            operación), height, memory y bytes_per_key de cada árbol
+        """
+        sizes = (checkpoints if isinstance(checkpoints, (list, tuple))
+                 else self.geometric_checkpoints(max_size, checkpoints))
+        data = self.generate_cell_data(max(sizes), data_type)
+        
+        # Las mismas llaves de búsqueda para todos los árboles
+        sample_rng = random.Random(f"{self.seed}:growth:{data_type}:{max_size}")
+        probes = [[data[sample_rng.randrange(size)] for _ in range(search_samples)] for size in sizes]
+        
+        results = {
+            'data_sizes': sizes,
+            'data_type': data_type,
+            'memory_source': 'tracemalloc' if trace_memory else 'rss',
+            'engines': engine_styles(self.engines)
+        }
+        clock = time.perf_counter_ns
+        
+        for name in self.engines:
+            times = {
+                'insert_per_key': [],
+                'search_per_key': [],
+                'height': [],
+                'memory': [],
+                'bytes_per_key': []
+            }
+            gc.collect()
+            was_tracing = tracemalloc.is_tracing()
+            if trace_memory:
+                if not was_tracing:
+                    tracemalloc.start()
+                baseline = tracemalloc.get_traced_memory()[0]
+            else:
+                baseline = self._read_rss()
+            
+            tree = get_engine(name)['factory']()
+            insert = tree.insert
+            search = tree.search
+            gc_was_enabled = gc.isenabled()
+            if self.benchmark.disable_gc:
+                gc.disable()
+            try:
+                previous = 0
+                for size, keys in zip(sizes, probes):
+                    start = clock()
+                    for value in data[previous:size]:
+                        insert(value)
+                    insert_elapsed = clock() - start
+                    
+                    start = clock()
+                    for value in keys:
+                        search(value)
+                    search_elapsed = clock() - start
+                    
+                    if trace_memory:
+                        memory = tracemalloc.get_traced_memory()[0] - baseline
+                    else:
+                        rss = self._read_rss()
+                        memory = rss - baseline if rss is not None and baseline is not None else None
+                    
+                    times['insert_per_key'].append(insert_elapsed / 1e9 / (size - previous))
+                    times['search_per_key'].append(search_elapsed / 1e9 / len(keys) if keys else 0.0)
+                    times['height'].append(tree.height())
+                    times['memory'].append(memory)
+                    times['bytes_per_key'].append(memory / size if memory is not None else None)
+                    previous = size
+            finally:
+                if self.benchmark.disable_gc and gc_was_enabled:
+                    gc.enable()
+                if trace_memory and not was_tracing:
+                    tracemalloc.stop()
+            del tree, insert, search
+            results[name] = times
+            
+            print(f"{get_engine(name)['short_label']}: {len(sizes)} puntos hasta {sizes[-1]}, "
+                  f"altura final={times['height'][-1]}, "
+                  f"inserción marginal final={times['insert_per_key'][-1] * 1e6:.2f} µs/llave")
+        
+        return results
+    
+    def compare_hit_miss_search(self, data_sizes, hit_ratio=0.5, data_type='random',
+                                outside_fraction=0.5):
+        """
+        Mide por separado la latencia de búsquedas exitosas y fallidas
+        
+        Las consultas se intercalan en orden aleatorio, como en un filtro de
+        duplicados real, y cada llamada se registra en el histograma de su
+        categoría: acierto, fallo entre llaves existentes o fallo fuera del
+        rango. En el ABB un fallo siempre recorre el camino hasta una hoja.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            hit_ratio: Fracción de búsquedas de llaves existentes
+            data_type: Tipo de datos registrado en controller.workloads
+            outside_fraction: Fracción de los fallos fuera del rango de llaves
+            
+        Returns:
+            Diccionario con, por árbol y categoría ('hit', 'miss_inside',
+            'miss_outside'), la latencia media y el p99 en nanosegundos por
+            tamaño y los histogramas; además 'search' con el tiempo total
+        """
+        categories = ('hit', 'miss_inside', 'miss_outside')
+        overhead = timer_overhead_ns()
+        results = {
+            'data_sizes': data_sizes,
+            'data_type': data_type,
+            'hit_ratio': hit_ratio,
+            'timer_overhead_ns': overhead,
+            'engines': engine_styles(self.engines)
+        }
+        for name in self.engines:
+            results[name] = {'search': []}
+            for category in categories:
+                results[name][category] = {'mean': [], 'p99': [], 'histogram': []}
+        
+        clock = time.perf_counter_ns
+        for size in data_sizes:
+            data = self.generate_cell_data(size, data_type)
+            seed = self.rng if self.seed is None else f"{self.seed}:hitmiss:{data_type}:{size}"
+            keys, labels = search_probes(data, size, hit_ratio, seed, outside_fraction)
+            
+            for name in self.engines:
+                tree = self._build_tree(get_engine(name)['factory'], data)
+                histograms = {category: LatencyHistogram() for category in categories}
+                probes = [(key, histograms[label].record) for key, label in zip(keys, labels)]
+                search = tree.search
+                
+                gc_was_enabled = gc.isenabled()
+                if self.benchmark.disable_gc:
+                    gc.collect()
+                    gc.disable()
+                try:
+                    total_start = clock()
+                    for key, record in probes:
+                        start = clock()
+                        search(key)
+                        record(clock() - start - overhead)
+                    total = clock() - total_start
+                finally:
+                    if self.benchmark.disable_gc and gc_was_enabled:
+                        gc.enable()
+                del tree, search
+                
+                results[name]['search'].append(total / 1e9)
+                for category, histogram in histograms.items():
+                    results[name][category]['mean'].append(histogram.mean())
+                    results[name][category]['p99'].append(histogram.value_at_percentile(99))
+                    results[name][category]['histogram'].append(histogram)
+            
+            summary = ", ".join(
+                f"{get_engine(name)['short_label']} acierto={(results[name]['hit']['mean'][-1] or 0) / 1000:.2f} µs "
+                f"fallo={(results[name]['miss_inside']['mean'][-1] or 0) / 1000:.2f} µs"
+                for name in self.engines)
+            print(f"Tamaño {size}: {summary}")
+        
+        return results
+    
+    def _measure_order_cell(self, tree_factory, data, times):
+        """
+        Mide inserción, búsqueda, eliminación, altura y memoria de un árbol
+        
+        Args:
+            tree_factory: Función sin argumentos que crea un árbol vacío
+            data: Lista de datos de la prueba
+            times: Diccionario de mediciones donde guardar los resultados
+        """
+        def insert_all(tree):
+            for value in data:
+                tree.insert(value)
+        
+        def search_all(tree):
+            for value in data:
+                tree.search(value)
+        
+        def delete_all(tree):
+            for value in data:
+                tree.delete(value)
+        
+        benchmark = self.benchmark
+        tree = self._build_tree(tree_factory, data)
+        self._record(times, 'insert', benchmark.run(insert_all, tree_factory))
+        self._record(times, 'search', benchmark.run(search_all, lambda: tree))
+        self._record(times, 'delete',
+                     benchmark.run(delete_all, lambda: self._build_tree(tree_factory, data)))
+        times['height'].append(tree.height())
+        del tree
+        profile = self.measure_memory_profile(tree_factory, data, include_rss=False)
+        times['bytes_per_key'].append(profile['bytes_per_key'])
+    
+    def compare_btree_orders(self, data_sizes, orders=(4, 8, 16, 32, 64, 128, 256),
+                             data_types=('random', 'ordered')):
+        """
+        Barre el orden de nodo del B-Tree para encontrar el óptimo en CPython
+        
+        Con nodos angostos domina el costo por nivel (un objeto de Python por
+        visita); con nodos muy anchos, el de desplazar la lista al insertar o
+        eliminar. Cada combinación se compara contra el Red-Black Tree con
+        los mismos datos.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            orders: Órdenes de nodo (máximo de hijos) a probar
+            data_types: Tipos de datos registrados en controller.workloads
+            
+        Returns:
+            Diccionario con, por tipo de datos, 'orders' (orden → mediciones
+            por tamaño), 'rbt' (referencia) y 'best_order' (orden con menor
+            inserción + búsqueda en cada tamaño)
+        """
+        results = {
+            'data_sizes': data_sizes,
+            'orders': list(orders),
+            'data_types': list(data_types),
+            'seed': self.seed
+        }
+        
+        def empty():
+            return {'insert': [], 'search': [], 'delete': [], 'height': [],
+                    'bytes_per_key': [], 'stats': {}}
+        
+        for data_type in data_types:
+            sweep = {
+                'orders': {order: empty() for order in orders},
+                'rbt': empty(),
+                'best_order': []
+            }
+            results[data_type] = sweep
+            for size in data_sizes:
+                data = self.generate_cell_data(size, data_type)
+                self._measure_order_cell(RedBlackTree, data, sweep['rbt'])
+                for order in orders:
+                    self._measure_order_cell(lambda: BTree(order), data, sweep['orders'][order])
+                
+                best = min(orders, key=lambda order: sweep['orders'][order]['insert'][-1]
+                           + sweep['orders'][order]['search'][-1])
+                sweep['best_order'].append(best)
+                best_times = sweep['orders'][best]
+                print(f"Tamaño {size} ({data_type}): mejor orden={best} "
+                      f"(altura {best_times['height'][-1]}, "
+                      f"inserción {best_times['insert'][-1]:.6f}s vs RBT {sweep['rbt']['insert'][-1]:.6f}s, "
+                      f"búsqueda {best_times['search'][-1]:.6f}s vs RBT {sweep['rbt']['search'][-1]:.6f}s)")
+        
+        return results
+    
+    def compare_skewed_search(self, data_sizes, exponents=(0.0, 0.8, 0.99, 1.2), searches=20000,
+                              data_type='random'):
+        """
+        Mide búsquedas con popularidad de Zipf sobre las llaves existentes
+        
+        Con exponente 0 los accesos son uniformes; al crecer el exponente
+        pocas llaves concentran la mayoría de las búsquedas y los árboles
+        autoajustables (splay) las mantienen cerca de la raíz, mientras los
+        balanceados pagan O(log n) en cada acceso. Cada medición parte de un
+        árbol recién construido, así el costo de reorganizarlo queda incluido.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            exponents: Exponentes de la distribución de Zipf a probar
+            searches: Cantidad de búsquedas por medición
+            data_type: Tipo de datos registrado en controller.workloads
+        
+        Returns:
+            Diccionario con, por árbol, 'search' (exponente → tiempo total
+            por tamaño) y 'stats' (exponente → estadísticas por tamaño)
+        """
+        results = {
+            'data_sizes': data_sizes,
+            'exponents': list(exponents),
+            'searches': searches,
+            'data_type': data_type,
+            'seed': self.seed,
+            'engines': engine_styles(self.engines)
+        }
+        for name in self.engines:
+            results[name] = {'search': {s: [] for s in exponents},
+                             'stats': {s: [] for s in exponents}}
+        
+        for size in data_sizes:
+            data = self.generate_cell_data(size, data_type)
+            for s in exponents:
+                seed = self.rng if self.seed is None else f"{self.seed}:skewed:{s}:{size}"
+                ranks = generate_workload('zipf', searches, seed, s=s, universe=len(data))
+                probes = [data[rank - 1] for rank in ranks]
+                
+                def search_all(tree):
+                    search = tree.search
+                    for key in probes:
+                        search(key)
+                
+                for name in self.engines:
+                    factory = get_engine(name)['factory']
+                    stats = self.benchmark.run(search_all, lambda: self._build_tree(factory, data))
+                    results[name]['search'][s].append(stats['median'])
+                    results[name]['stats'][s].append(stats)
+            
+            top = exponents[-1]
+            summary = ", ".join(
+                f"{get_engine(name)['short_label']} "
+                f"{results[name]['search'][top][-1] / searches * 1e9:.0f} ns"
+                for name in self.engines)
+            print(f"Tamaño {size} (Zipf s={top}): {summary} por búsqueda")
+        
+        return results
+    
+    def compare_rebalance(self, data_sizes, data_type='ordered'):
+        """
+        Mide el rebalanceo global del ABB (Day-Stout-Warren) y su efecto
+        
+        Por tamaño se construye el ABB insertando los datos, se mide la
+        búsqueda de todas las llaves, el costo único de rebalance() sobre
+        un árbol recién construido y la búsqueda después de rebalancear.
+        
+        Args:
+            data_sizes: Lista de tamaños de datos a probar
+            data_type: Tipo de datos registrado en controller.workloads (por
+                defecto 'ordered', el peor caso del ABB)
+            
+        Returns:
+            Diccionario con 'before' y 'after' (búsqueda y altura por tamaño),
+            'rebalance' (tiempo por tamaño), 'break_even' (búsquedas
+            necesarias para recuperar el costo) y 'stats'
+        """
+        results = {
+            'data_sizes': data_sizes,
+            'data_type': data_type,
+            'seed': self.seed,
+            'before': {'search': [], 'height': []},
+            'after': {'search': [], 'height': []},
+            'rebalance': [],
+            'break_even': [],
+            'stats': {'search_before': [], 'search_after': [], 'rebalance': []}
+        }
+        
+        for size in data_sizes:
+            data = self.generate_cell_data(size, data_type)
+            
+            def search_all(tree):
+                for value in data:
+                    tree.search(value)
+            
+            def rebalance(tree):
+                tree.rebalance()
+            
+            tree = self._build_tree(BinarySearchTree, data)
+            before = self.benchmark.run(search_all, lambda: tree)
+            results['before']['height'].append(tree.height())
+            cost = self.benchmark.run(rebalance, lambda: self._build_tree(BinarySearchTree, data))
+            tree.rebalance()
+            after = self.benchmark.run(search_all, lambda: tree)
+            results['after']['height'].append(tree.height())
+            del tree
+            
+            results['before']['search'].append(before['median'])
+            results['after']['search'].append(after['median'])
+            results['rebalance'].append(cost['median'])
+            for phase, stats in (('search_before', before), ('rebalance', cost), ('search_after', after)):
+                results['stats'][phase].append(stats)
+            saved = (before['median'] - after['median']) / size
+            results['break_even'].append(cost['median'] / saved if saved > 0 else None)
+            
+            break_even = results['break_even'][-1]
+            print(f"Tamaño {size}: altura {results['before']['height'][-1]} → "
+                  f"{results['after']['height'][-1]}, rebalanceo {cost['median']:.6f}s, "
+                  f"búsqueda {before['median']:.6f}s → {after['median']:.6f}s"
+                  + (f", se recupera en {break_even:.0f} búsquedas" if break_even is not None else ""))
+        
+        return results
+    
+    def get_results(self, extra=None):
+        """
+        Obtiene los resultados de las pruebas
+        
+        Args:
+            extra: Entradas adicionales para el diccionario de resultados
+            
+        Returns:
+            Diccionario con data_sizes, engines, una entrada por motor y frozen
+        """
+        results = {
             'data_sizes': self.data_sizes,
-            'bst': self.bst_times,
-            'rbt': self.rbt_times
+            'engines': engine_styles(self.engines)
         }
+        results.update(self.times)
+        results['frozen'] = self.frozen_times
+        results.update(extra or {})
+        return results
+
+
+def _run_benchmark_cell(cell):
+    """
+    Mide una celda de la matriz de pruebas dentro de un proceso trabajador
+    
+    Args:
+        cell: Diccionario con seed, data_type, size, contender, repeat,
+            warmup, disable_gc, count_operations, measure_memory y hit_ratio
+        
+    Returns:
+        Diccionario de mediciones de measure_contender (una muestra por fase)
+    """
+    benchmark = Benchmark(warmup=cell['warmup'], repeats=1, disable_gc=cell['disable_gc'])
+    controller = PerformanceController(benchmark=benchmark, seed=cell['seed'])
+    data = controller.generate_cell_data(cell['size'], cell['data_type'])
+    probes = controller.search_probe_keys(data, cell['data_type'], cell['hit_ratio'])
+    return controller.measure_contender(cell['contender'], data, cell['count_operations'],
+                                        cell['measure_memory'], probes)
+
+
+def _run_isolated_trial(payload):
+    """
+    Mide un contendiente dentro de un proceso aislado
+    
+    Args:
+        payload: Tupla (benchmark, contendiente, datos, count_operations, consultas)
+        
+    Returns:
+        Diccionario de mediciones de measure_contender
+    """
+    benchmark, name, data, count_operations, probes = payload
+    return PerformanceController(benchmark=benchmark).measure_contender(
+        name, data, count_operations, probes=probes)
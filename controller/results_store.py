@@ -0,0 +1,312 @@
+"""
+Almacén persistente de resultados (JSONL) y comparación entre ejecuciones
+"""
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+import uuid
+
+from controller.benchmark import t_critical_95
+from controller.histogram import LatencyHistogram
+
+
+def _git_revision():
+    """
+    Obtiene la revisión de git del repositorio del proyecto
+
+    Returns:
+        Diccionario con commit y dirty (None si git no está disponible)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, timeout=10, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                                capture_output=True, text=True, timeout=10, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {'commit': None, 'dirty': None}
+    return {'commit': commit, 'dirty': bool(status.strip())}
+
+
+def run_metadata():
+    """
+    Describe el entorno de la ejecución
+
+    Returns:
+        Diccionario con máquina, sistema, versión de Python y revisión de git
+    """
+    return {
+        'machine': {
+            'hostname': platform.node(),
+            'architecture': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'system': platform.platform()
+        },
+        'python': {
+            'version': platform.python_version(),
+            'implementation': platform.python_implementation()
+        },
+        'git': _git_revision()
+    }
+
+
+def _to_json(value):
+    """
+    Convierte a JSON los tipos que json no serializa por sí mismo
+
+    Args:
+        value: Objeto no serializable
+
+    Returns:
+        Representación serializable
+
+    Raises:
+        TypeError: Si el tipo no es conocido
+    """
+    if isinstance(value, LatencyHistogram):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        # Escalares de NumPy
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+class ResultsStore:
+    """
+    Archivo JSONL con una línea por ejecución de compare_performance
+
+    Todas las ejecuciones guardadas por la misma instancia comparten un
+    identificador de sesión, así una corrida completa de main.py (varios
+    tipos de datos) puede compararse contra la anterior como una unidad.
+    """
+
+    def __init__(self, path='benchmark_results.jsonl'):
+        """
+        Abre (o crea al guardar) un almacén de resultados
+
+        Args:
+            path: Ruta del archivo JSONL
+        """
+        self.path = path
+        self.session = uuid.uuid4().hex[:12]
+
+    def save(self, results, label=None):
+        """
+        Agrega una ejecución al almacén
+
+        Args:
+            results: Diccionario devuelto por compare_performance
+            label: Etiqueta opcional (por ejemplo, el nombre de una rama)
+
+        Returns:
+            Identificador de la ejecución guardada
+        """
+        record = {
+            'run_id': uuid.uuid4().hex[:12],
+            'session': self.session,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'label': label,
+            'metadata': run_metadata(),
+            'seed': results.get('seed'),
+            'dataset_hash': results.get('dataset_hash'),
+            'results': results
+        }
+        with open(self.path, 'a', encoding='utf-8') as store:
+            store.write(json.dumps(record, default=_to_json, ensure_ascii=False) + '\n')
+        return record['run_id']
+
+    def load(self):
+        """
+        Lee todas las ejecuciones guardadas
+
+        Returns:
+            Lista de registros en orden de guardado (vacía si no hay archivo)
+        """
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding='utf-8') as store:
+            return [json.loads(line) for line in store if line.strip()]
+
+    def sessions(self):
+        """
+        Lista las sesiones en orden de guardado
+
+        Returns:
+            Lista de identificadores de sesión
+        """
+        seen = []
+        for record in self.load():
+            if record['session'] not in seen:
+                seen.append(record['session'])
+        return seen
+
+    def select(self, reference):
+        """
+        Obtiene los registros de una sesión o de una ejecución
+
+        Args:
+            reference: Identificador de sesión o de ejecución, 'latest' (última
+                sesión) o 'previous' (penúltima sesión)
+
+        Returns:
+            Lista de registros
+
+        Raises:
+            ValueError: Si la referencia no existe
+        """
+        records = self.load()
+        sessions = self.sessions()
+        if reference in ('latest', 'previous'):
+            position = -1 if reference == 'latest' else -2
+            if len(sessions) < -position:
+                raise ValueError(f"No hay suficientes sesiones guardadas en {self.path}")
+            reference = sessions[position]
+        selected = [record for record in records
+                    if reference in (record['session'], record['run_id'])]
+        if not selected:
+            raise ValueError(f"Ejecución o sesión desconocida: {reference}")
+        return selected
+
+
+def welch_t_test(base, head):
+    """
+    Prueba t de Welch para dos muestras con varianzas distintas
+
+    Args:
+        base: Muestras de la ejecución base
+        head: Muestras de la ejecución nueva
+
+    Returns:
+        Tupla (t, grados de libertad, significativo al 95%); con menos de dos
+        muestras en alguno de los lados la diferencia no es significativa
+    """
+    if len(base) < 2 or len(head) < 2:
+        return 0.0, 0, False
+    var_base = statistics.variance(base) / len(base)
+    var_head = statistics.variance(head) / len(head)
+    spread = var_base + var_head
+    if spread == 0:
+        different = statistics.fmean(base) != statistics.fmean(head)
+        return (math.inf if different else 0.0), len(base) + len(head) - 2, different
+    t = (statistics.fmean(head) - statistics.fmean(base)) / math.sqrt(spread)
+    df = spread ** 2 / (var_base ** 2 / (len(base) - 1) + var_head ** 2 / (len(head) - 1))
+    return t, df, abs(t) > t_critical_95(max(1, int(df)))
+
+
+def run_key(results):
+    """
+    Obtiene la clave con la que se emparejan ejecuciones de dos sesiones
+
+    Args:
+        results: Resultados guardados de una ejecución
+
+    Returns:
+        Tupla (tipo de datos, proporción de aciertos, aislamiento, motores);
+        los resultados antiguos sin esos campos usan los valores por defecto
+    """
+    engines = results.get('engines')
+    if engines is None:
+        engines = [name for name, times in results.items()
+                   if isinstance(times, dict) and 'stats' in times and name != 'frozen']
+    return (results.get('data_type'), results.get('hit_ratio', 1.0),
+            results.get('isolation'), tuple(sorted(engines)))
+
+
+def _index_runs(records, side):
+    """
+    Indexa los resultados de una sesión por su clave de emparejamiento
+
+    Args:
+        records: Registros de la sesión
+        side: Nombre de la sesión para el mensaje de error
+
+    Returns:
+        Diccionario clave → resultados
+
+    Raises:
+        ValueError: Si dos ejecuciones de la sesión tienen la misma clave
+    """
+    runs = {}
+    for record in records:
+        key = run_key(record['results'])
+        if key in runs:
+            raise ValueError(f"Emparejamiento ambiguo: la sesión {side} tiene varias ejecuciones "
+                             f"con tipo {key[0]}, aciertos {key[1]}, aislamiento {key[2]} "
+                             f"y motores {', '.join(key[3])}; seleccione ejecuciones por id")
+        runs[key] = record['results']
+    return runs
+
+
+def compare_runs(base_records, head_records, threshold=0.10):
+    """
+    Compara dos ejecuciones fase por fase y tamaño por tamaño
+
+    Se emparejan los registros por tipo de datos, proporción de aciertos,
+    aislamiento y conjunto de motores (ver run_key), y dentro de cada par
+    los tamaños comunes. Un cambio es regresión si la mediana empeora más
+    que el umbral y la prueba de Welch sobre las muestras lo confirma al 95%.
+
+    Args:
+        base_records: Registros de la ejecución base
+        head_records: Registros de la ejecución nueva
+        threshold: Empeoramiento relativo mínimo para marcar regresión
+
+    Returns:
+        Lista de diccionarios con data_type, contender, phase, size, base,
+        head (medianas), change, t, df, significant y status ('regression',
+        'improvement' o 'unchanged')
+
+    Raises:
+        ValueError: Si una sesión tiene varias ejecuciones con la misma clave
+    """
+    base_runs = _index_runs(base_records, 'base')
+    rows = []
+    for key, head in _index_runs(head_records, 'nueva').items():
+        data_type = key[0]
+        base = base_runs.get(key)
+        if base is None:
+            continue
+        for contender, times in head.items():
+            if not isinstance(times, dict) or 'stats' not in times or contender not in base:
+                continue
+            for phase, head_stats in times['stats'].items():
+                base_stats = base[contender].get('stats', {}).get(phase)
+                if not base_stats:
+                    continue
+                base_sizes = {size: i for i, size in enumerate(base['data_sizes'])}
+                for i, size in enumerate(head['data_sizes']):
+                    if size not in base_sizes or i >= len(head_stats):
+                        continue
+                    before = base_stats[base_sizes[size]]
+                    after = head_stats[i]
+                    change = (after['median'] - before['median']) / before['median'] if before['median'] else 0.0
+                    t, df, significant = welch_t_test(before['samples'], after['samples'])
+                    if significant and change > threshold:
+                        status = 'regression'
+                    elif significant and change < -threshold:
+                        status = 'improvement'
+                    else:
+                        status = 'unchanged'
+                    rows.append({
+                        'data_type': data_type,
+                        'contender': contender,
+                        'phase': phase,
+                        'size': size,
+                        'base': before['median'],
+                        'head': after['median'],
+                        'change': change,
+                        't': t,
+                        'df': df,
+                        'significant': significant,
+                        'status': status
+                    })
+    return rows
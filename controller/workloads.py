@@ -0,0 +1,337 @@
+"""
+Registro de generadores de cargas de trabajo (secuencias de llaves)
+
+Cada generador recibe la cantidad de llaves, un generador aleatorio
+random.Random ya sembrado y sus parámetros propios, y devuelve una lista.
+Se registra con @register_workload y queda disponible por nombre para el
+controlador, main.py y la interfaz gráfica.
+"""
+import bisect
+import hashlib
+import random
+import string
+
+
+# Nombre → (función generadora, descripción para mostrar)
+WORKLOADS = {}
+
+
+def register_workload(name, description):
+    """
+    Decorador que registra un generador de cargas de trabajo
+
+    Args:
+        name: Nombre con el que se solicita el generador
+        description: Descripción breve para menús y reportes
+
+    Returns:
+        Decorador que devuelve la función sin modificarla
+    """
+    def decorator(func):
+        WORKLOADS[name] = (func, description)
+        return func
+    return decorator
+
+
+def workload_names():
+    """
+    Obtiene los nombres registrados en orden de registro
+
+    Returns:
+        Lista de nombres
+    """
+    return list(WORKLOADS)
+
+
+def workload_description(name):
+    """
+    Obtiene la descripción de un generador
+
+    Args:
+        name: Nombre del generador
+
+    Returns:
+        Descripción registrada
+    """
+    return WORKLOADS[name][1]
+
+
+def generate_workload(name, size, seed=None, **params):
+    """
+    Genera una carga de trabajo por nombre
+
+    Args:
+        name: Nombre del generador registrado
+        size: Cantidad de llaves
+        seed: Semilla (entero o texto) o un random.Random ya creado
+        **params: Parámetros propios del generador (por ejemplo k o s)
+
+    Returns:
+        Lista de llaves
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if name not in WORKLOADS:
+        raise ValueError(f"Tipo de datos desconocido: {name} "
+                         f"(disponibles: {', '.join(WORKLOADS)})")
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    return WORKLOADS[name][0](size, rng, **params)
+
+
+def dataset_hash(data):
+    """
+    Calcula una huella estable de un conjunto de datos
+
+    Args:
+        data: Lista de llaves
+
+    Returns:
+        Primeros 16 caracteres hexadecimales del SHA-256 de las llaves
+    """
+    digest = hashlib.sha256()
+    for key in data:
+        digest.update(repr(key).encode())
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+@register_workload('random', 'Aleatorios')
+def random_keys(size, rng):
+    """Permutación aleatoria de 1..n"""
+    data = list(range(1, size + 1))
+    rng.shuffle(data)
+    return data
+
+
+@register_workload('ordered', 'Ordenados')
+def ordered_keys(size, rng):
+    """Llaves 1..n en orden ascendente (peor caso para el ABB)"""
+    return list(range(1, size + 1))
+
+
+@register_workload('reverse', 'Inversos')
+def reverse_keys(size, rng):
+    """Llaves n..1 en orden descendente (peor caso para el ABB)"""
+    return list(range(size, 0, -1))
+
+
+@register_workload('k_sorted', 'Casi ordenados')
+def k_sorted_keys(size, rng, k=16):
+    """
+    Llaves casi ordenadas: cada bloque de k elementos se desordena
+
+    Args:
+        k: Desorden máximo; cada valor queda a menos de k posiciones de su
+            lugar en el orden ascendente
+    """
+    data = list(range(1, size + 1))
+    for start in range(0, size, k):
+        block = data[start:start + k]
+        rng.shuffle(block)
+        data[start:start + k] = block
+    return data
+
+
+@register_workload('sawtooth', 'Diente de sierra')
+def sawtooth_keys(size, rng, teeth=8):
+    """
+    Varias rachas ascendentes intercaladas: 1, t+1, 2t+1, ..., 2, t+2, ...
+
+    Args:
+        teeth: Cantidad de rachas ascendentes
+    """
+    teeth = max(1, min(teeth, size)) if size else 1
+    return [key for tooth in range(1, teeth + 1) for key in range(tooth, size + 1, teeth)]
+
+
+@register_workload('organ_pipe', 'Tubo de órgano')
+def organ_pipe_keys(size, rng):
+    """Llaves impares ascendentes seguidas de las pares descendentes"""
+    return list(range(1, size + 1, 2)) + list(range(size - size % 2, 0, -2))
+
+
+@register_workload('zigzag', 'Zigzag (adversario)')
+def zigzag_keys(size, rng):
+    """
+    Alterna el menor y el mayor restantes: 1, n, 2, n-1, ...
+
+    Cada llave cae en el extremo del subárbol de la anterior, así el ABB
+    degenera en un camino de altura n, igual que con datos ordenados.
+    """
+    low, high = 1, size
+    data = []
+    while low <= high:
+        data.append(low)
+        if low != high:
+            data.append(high)
+        low += 1
+        high -= 1
+    return data
+
+
+@register_workload('zipf', 'Zipf con duplicados')
+def zipf_keys(size, rng, s=1.1, universe=None):
+    """
+    Llaves con frecuencias de Zipf: pocas llaves muy repetidas
+
+    Las llaves más frecuentes se reparten al azar en el rango para que la
+    popularidad no coincida con el orden.
+
+    Args:
+        s: Exponente de la distribución (mayor = más sesgo)
+        universe: Cantidad de llaves distintas posibles (por defecto size)
+    """
+    universe = universe or max(size, 1)
+    cumulative = []
+    total = 0.0
+    for rank in range(1, universe + 1):
+        total += 1.0 / rank ** s
+        cumulative.append(total)
+    keys_by_rank = list(range(1, universe + 1))
+    rng.shuffle(keys_by_rank)
+    return [keys_by_rank[bisect.bisect_left(cumulative, rng.random() * total)]
+            for _ in range(size)]
+
+
+@register_workload('clustered', 'Agrupados por rangos')
+def clustered_keys(size, rng, clusters=10, spread=1000):
+    """
+    Llaves densas dentro de pocos rangos separados por huecos grandes
+
+    Los rangos se visitan en orden aleatorio y dentro de cada uno las llaves
+    llegan desordenadas.
+
+    Args:
+        clusters: Cantidad de rangos
+        spread: Separación entre el inicio de rangos consecutivos, en
+            múltiplos del tamaño de un rango
+    """
+    clusters = max(1, min(clusters, size)) if size else 1
+    per_cluster = -(-size // clusters)
+    order = list(range(clusters))
+    rng.shuffle(order)
+    data = []
+    for cluster in order:
+        base = cluster * per_cluster * spread
+        block = list(range(base, base + per_cluster))
+        rng.shuffle(block)
+        data.extend(block)
+    return data[:size]
+
+
+@register_workload('strings', 'Cadenas de texto')
+def string_keys(size, rng, length=8):
+    """
+    Cadenas aleatorias distintas (comparaciones más costosas que enteros)
+
+    Args:
+        length: Longitud de cada cadena
+    """
+    alphabet = string.ascii_lowercase
+    seen = set()
+    data = []
+    while len(data) < size:
+        key = ''.join(rng.choice(alphabet) for _ in range(length))
+        if key not in seen:
+            seen.add(key)
+            data.append(key)
+    return data
+
+
+def interleaved_miss_keys(data, count, rng):
+    """
+    Genera llaves ausentes que caen entre dos llaves existentes
+
+    Entre enteros consecutivos se usa el punto medio (x + 0.5); si hay un
+    hueco, un entero dentro de él. Para cadenas se agrega el carácter
+    '\x01', que ordena justo después de la llave original (no se usa el
+    nulo porque NumPy descarta los nulos finales y la instantánea congelada
+    vería la llave original).
+
+    Args:
+        data: Llaves existentes (al menos dos distintas)
+        count: Cantidad de llaves a generar
+        rng: Generador random.Random ya sembrado
+
+    Returns:
+        Lista de llaves ausentes dentro del rango de data
+    """
+    keys = sorted(set(data))
+    present = set(keys)
+    if len(keys) < 2:
+        return []
+    misses = []
+    while len(misses) < count:
+        i = rng.randrange(len(keys) - 1)
+        low, high = keys[i], keys[i + 1]
+        if isinstance(low, str):
+            key = low + '\x01'
+        elif isinstance(low, int) and high - low > 1:
+            key = rng.randrange(low + 1, high)
+        else:
+            key = low + (high - low) / 2
+        if key not in present and low < key < high:
+            misses.append(key)
+    return misses
+
+
+def outside_miss_keys(data, count, rng):
+    """
+    Genera llaves ausentes fuera del rango de las existentes
+
+    Para números, la mitad queda por debajo del mínimo y la mitad por encima
+    del máximo; para cadenas, todas por encima del máximo.
+
+    Args:
+        data: Llaves existentes
+        count: Cantidad de llaves a generar
+        rng: Generador random.Random ya sembrado
+
+    Returns:
+        Lista de llaves ausentes fuera de [min(data), max(data)]
+    """
+    if not data:
+        return list(range(1, count + 1))
+    low, high = min(data), max(data)
+    misses = []
+    for i in range(count):
+        offset = rng.randrange(1, count + 2)
+        if isinstance(high, str):
+            misses.append(high + '~' * offset)
+        elif i % 2:
+            misses.append(low - offset)
+        else:
+            misses.append(high + offset)
+    return misses
+
+
+def search_probes(data, count, hit_ratio, seed=None, outside_fraction=0.5):
+    """
+    Genera consultas de búsqueda con una proporción dada de aciertos
+
+    Args:
+        data: Llaves insertadas en el árbol
+        count: Cantidad total de consultas
+        hit_ratio: Fracción de consultas que existen (0 a 1)
+        seed: Semilla (entero o texto) o un random.Random ya creado
+        outside_fraction: Fracción de los fallos fuera del rango de llaves;
+            el resto cae entre llaves existentes
+
+    Returns:
+        Tupla (llaves, categorías) en orden aleatorio, donde cada categoría es
+        'hit', 'miss_inside' o 'miss_outside'
+    """
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    hits = round(count * hit_ratio) if data else 0
+    misses = count - hits
+    outside = round(misses * outside_fraction)
+    inside = interleaved_miss_keys(data, misses - outside, rng)
+    # Si no hay huecos posibles (menos de dos llaves) los fallos van afuera
+    outside = outside_miss_keys(data, misses - len(inside), rng)
+
+    probes = ([(rng.choice(data), 'hit') for _ in range(hits)]
+              + [(key, 'miss_inside') for key in inside]
+              + [(key, 'miss_outside') for key in outside])
+    rng.shuffle(probes)
+    return [key for key, _ in probes], [category for _, category in probes]
@@ -1,6 +1,7 @@
 """
 Ejemplo básico de uso de los árboles BST y Red-Black Tree
 """
+from itertools import islice
 from model import BinarySearchTree, RedBlackTree
 
 
@@ -23,9 +24,10 @@ def demo_basic_operations():
     for value in data:
         bst.insert(value)
     
-    print(f"\nRecorrido Inorden:   {bst.inorder_traversal()}")
-    print(f"Recorrido Preorden:  {bst.preorder_traversal()}")
-    print(f"Recorrido Postorden: {bst.postorder_traversal()}")
+    print(f"\nRecorrido Inorden:   {list(bst.iter_inorder())}")
+    print(f"Recorrido Preorden:  {list(bst.iter_preorder())}")
+    print(f"Recorrido Postorden: {list(bst.iter_postorder())}")
+    print(f"Orden descendente:   {list(reversed(bst))}")
     print(f"Altura del árbol:    {bst.height()}")
     
     # Búsquedas
@@ -43,9 +45,10 @@ def demo_basic_operations():
     for value in data:
         rbt.insert(value)
     
-    print(f"\nRecorrido Inorden:   {rbt.inorder_traversal()}")
-    print(f"Recorrido Preorden:  {rbt.preorder_traversal()}")
-    print(f"Recorrido Postorden: {rbt.postorder_traversal()}")
+    print(f"\nRecorrido Inorden:   {list(rbt.iter_inorder())}")
+    print(f"Recorrido Preorden:  {list(rbt.iter_preorder())}")
+    print(f"Recorrido Postorden: {list(rbt.iter_postorder())}")
+    print(f"Orden descendente:   {list(reversed(rbt))}")
     print(f"Altura del árbol:    {rbt.height()}")
     
     # Búsquedas
@@ -73,6 +76,7 @@ def demo_worst_case():
     
     print(f"Altura del árbol: {bst.height()}")
     print(f"Altura esperada (degenerado): {len(ordered_data)}")
+    print(f"Primeras 10 llaves (iterador): {list(islice(bst.iter_inorder(), 10))}")
     print("⚠️  El árbol degeneró en una lista enlazada!")
     
     # Red-Black Tree con datos ordenados
@@ -4,16 +4,24 @@ Interfaz Gráfica Completa - ABB vs Red-Black Tree
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+from itertools import islice
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
 from controller import PerformanceController
+from controller.workloads import workload_names, workload_description
 from model import BinarySearchTree, RedBlackTree
 
 
 class TreeComparisonGUI:
     
+    # Máximo de llaves mostradas por recorrido en las pestañas de texto
+    TRAVERSAL_PREVIEW = 50
+    
+    # Botones de tipo de datos por fila en el panel de configuración
+    WORKLOADS_PER_ROW = 5
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Comparativo: ABB vs Red-Black Tree")
@@ -32,12 +40,13 @@ class TreeComparisonGUI:
         config_frame.pack(fill=tk.X, padx=10, pady=5)
         
         ttk.Label(config_frame, text="Tipo de datos:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        ttk.Radiobutton(config_frame, text="Aleatorios", 
-                       variable=self.data_type_var, value="random").grid(row=0, column=1, sticky=tk.W)
-        ttk.Radiobutton(config_frame, text="Ordenados", 
-                       variable=self.data_type_var, value="ordered").grid(row=0, column=2, sticky=tk.W)
-        ttk.Radiobutton(config_frame, text="Inversos", 
-                       variable=self.data_type_var, value="reverse").grid(row=0, column=3, sticky=tk.W)
+        types_frame = ttk.Frame(config_frame)
+        types_frame.grid(row=0, column=1, columnspan=3, sticky=tk.W)
+        for index, name in enumerate(workload_names()):
+            ttk.Radiobutton(types_frame, text=workload_description(name),
+                           variable=self.data_type_var, value=name).grid(
+                               row=index // self.WORKLOADS_PER_ROW,
+                               column=index % self.WORKLOADS_PER_ROW, sticky=tk.W)
         
         ttk.Label(config_frame, text="Tamaños (separados por comas):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         size_entry = ttk.Entry(config_frame, textvariable=self.size_var, width=40)
@@ -117,6 +126,8 @@ class TreeComparisonGUI:
                   command=self.manual_insert).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Buscar", 
                   command=self.manual_search).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Eliminar", 
+                  command=self.manual_delete).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Limpiar", 
                   command=self.manual_clear).pack(side=tk.LEFT, padx=5)
         
@@ -210,16 +221,20 @@ Red-Black Tree:
         stats += f"RESULTADOS - Tipo de datos: {self.results['data_type']}\n"
         stats += "═" * 70 + "\n\n"
         
+        phases = (('insert', 'Inserción: '), ('bulk', 'Carga masiva: '), ('search', 'Búsqueda:  '),
+                  ('search_batch', 'Búsqueda por lotes: '), ('delete', 'Eliminación: '))
         for i, size in enumerate(self.results['data_sizes']):
             stats += f"Tamaño: {size}\n"
-            stats += f"  BST:\n"
-            stats += f"    Inserción: {self.results['bst']['insert'][i]:.6f} s\n"
-            stats += f"    Búsqueda:  {self.results['bst']['search'][i]:.6f} s\n"
-            stats += f"    Altura:    {self.results['bst']['height'][i]}\n"
-            stats += f"  RBT:\n"
-            stats += f"    Inserción: {self.results['rbt']['insert'][i]:.6f} s\n"
-            stats += f"    Búsqueda:  {self.results['rbt']['search'][i]:.6f} s\n"
-            stats += f"    Altura:    {self.results['rbt']['height'][i]}\n\n"
+            for name, style in self.results['engines'].items():
+                times = self.results[name]
+                stats += f"  {style['short_label']}:\n"
+                for phase, label in phases:
+                    if times[phase]:
+                        stats += f"    {label}{times[phase][i]:.6f} s\n"
+                stats += f"    Altura:    {times['height'][i]}\n"
+            stats += "  Instantánea Eytzinger:\n"
+            stats += f"    Congelado: {self.results['frozen']['freeze'][i]:.6f} s\n"
+            stats += f"    Búsqueda:  {self.results['frozen']['search'][i]:.6f} s\n\n"
         
         self.stats_text.insert(1.0, stats)
         self.plot_comparison_graphs()
@@ -235,9 +250,12 @@ Red-Black Tree:
         fig = Figure(figsize=(12, 8))
         data_sizes = self.results['data_sizes']
         
+        engines = self.results['engines']
+        
         ax1 = fig.add_subplot(2, 2, 1)
-        ax1.plot(data_sizes, self.results['bst']['insert'], 'r-o', label='BST', linewidth=2)
-        ax1.plot(data_sizes, self.results['rbt']['insert'], 'b-s', label='RBT', linewidth=2)
+        for name, style in engines.items():
+            ax1.plot(data_sizes, self.results[name]['insert'], color=style['color'],
+                     marker=style['marker'], label=style['short_label'], linewidth=2)
         ax1.set_xlabel('Cantidad de elementos')
         ax1.set_ylabel('Tiempo (s)')
         ax1.set_title('Tiempo de Inserción')
@@ -245,8 +263,10 @@ Red-Black Tree:
         ax1.grid(True, alpha=0.3)
         
         ax2 = fig.add_subplot(2, 2, 2)
-        ax2.plot(data_sizes, self.results['bst']['search'], 'r-o', label='BST', linewidth=2)
-        ax2.plot(data_sizes, self.results['rbt']['search'], 'b-s', label='RBT', linewidth=2)
+        for name, style in engines.items():
+            ax2.plot(data_sizes, self.results[name]['search'], color=style['color'],
+                     marker=style['marker'], label=style['short_label'], linewidth=2)
+        ax2.plot(data_sizes, self.results['frozen']['search'], 'g-^', label='Eytzinger', linewidth=2)
         ax2.set_xlabel('Cantidad de elementos')
         ax2.set_ylabel('Tiempo (s)')
         ax2.set_title('Tiempo de Búsqueda')
@@ -255,8 +275,9 @@ Red-Black Tree:
         
         ax3 = fig.add_subplot(2, 2, 3)
         optimal_heights = [np.log2(n + 1) for n in data_sizes]
-        ax3.plot(data_sizes, self.results['bst']['height'], 'r-o', label='BST', linewidth=2)
-        ax3.plot(data_sizes, self.results['rbt']['height'], 'b-s', label='RBT', linewidth=2)
+        for name, style in engines.items():
+            ax3.plot(data_sizes, self.results[name]['height'], color=style['color'],
+                     marker=style['marker'], label=style['short_label'], linewidth=2)
         ax3.plot(data_sizes, optimal_heights, 'g--', label='Óptimo (log₂n)', linewidth=2, alpha=0.7)
         ax3.set_xlabel('Cantidad de elementos')
         ax3.set_ylabel('Altura')
@@ -264,20 +285,22 @@ Red-Black Tree:
         ax3.legend()
         ax3.grid(True, alpha=0.3)
         
+        # Mejora de cada motor sobre el ABB sin balanceo, barras agrupadas por tamaño
         ax4 = fig.add_subplot(2, 2, 4)
-        improvements = []
-        for i in range(len(data_sizes)):
-            if self.results['bst']['insert'][i] > 0:
-                imp = ((self.results['bst']['insert'][i] - self.results['rbt']['insert'][i]) 
-                      / self.results['bst']['insert'][i] * 100)
-                improvements.append(imp)
-            else:
-                improvements.append(0)
-        
-        ax4.bar(range(len(data_sizes)), improvements, color='green', alpha=0.7)
+        baseline = self.results['bst']['insert'] if 'bst' in engines else None
+        contenders = [(name, style) for name, style in engines.items() if name != 'bst']
+        width = 0.8 / max(len(contenders), 1)
+        for index, (name, style) in enumerate(contenders if baseline else []):
+            improvements = [(base - value) / base * 100 if base > 0 else 0
+                            for base, value in zip(baseline, self.results[name]['insert'])]
+            offset = (index - (len(contenders) - 1) / 2) * width
+            ax4.bar([i + offset for i in range(len(data_sizes))], improvements, width,
+                    color=style['color'], alpha=0.7, label=style['short_label'])
         ax4.set_xlabel('Índice de tamaño')
         ax4.set_ylabel('Mejora (%)')
-        ax4.set_title('Mejora de RBT sobre BST (Inserción)')
+        ax4.set_title('Mejora sobre BST (Inserción)')
+        if baseline and contenders:
+            ax4.legend()
         ax4.set_xticks(range(len(data_sizes)))
         ax4.set_xticklabels([str(s) for s in data_sizes])
         ax4.grid(True, alpha=0.3, axis='y')
@@ -316,10 +339,10 @@ Red-Black Tree:
 Datos insertados: {data}
 
 Recorrido Inorden:
-{bst.inorder_traversal()}
+{self._stream_preview(bst.iter_inorder())}
 
 Recorrido Preorden:
-{bst.preorder_traversal()}
+{self._stream_preview(bst.iter_preorder())}
 
 Altura: {bst.height()}"""
         ax1.text(0.1, 0.5, info_bst, fontsize=11, family='monospace', verticalalignment='center')
@@ -332,10 +355,10 @@ Altura: {bst.height()}"""
 Datos insertados: {data}
 
 Recorrido Inorden:
-{rbt.inorder_traversal()}
+{self._stream_preview(rbt.iter_inorder())}
 
 Recorrido Preorden:
-{rbt.preorder_traversal()}
+{self._stream_preview(rbt.iter_preorder())}
 
 Altura: {rbt.height()}"""
         ax2.text(0.1, 0.5, info_rbt, fontsize=11, family='monospace', verticalalignment='center')
@@ -379,24 +402,49 @@ Altura: {rbt.height()}"""
         
         messagebox.showinfo("Resultado de Búsqueda", result)
         
+    def manual_delete(self):
+        try:
+            value = int(self.value_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Debes ingresar un número válido")
+            return
+        
+        bst_deleted = self.manual_bst.delete(value)
+        rbt_deleted = self.manual_rbt.delete(value)
+        
+        self.update_manual_trees()
+        self.value_entry.delete(0, tk.END)
+        if bst_deleted or rbt_deleted:
+            self.status_label.config(text=f"Valor {value} eliminado de ambos árboles")
+        else:
+            self.status_label.config(text=f"Valor {value} no existe en los árboles")
+        
     def manual_clear(self):
         self.manual_bst = BinarySearchTree()
         self.manual_rbt = RedBlackTree()
         self.update_manual_trees()
         self.status_label.config(text="Árboles limpiados")
         
+    def _stream_preview(self, iterator):
+        limit = self.TRAVERSAL_PREVIEW
+        keys = list(islice(iterator, limit + 1))
+        text = ', '.join(str(key) for key in keys[:limit])
+        if len(keys) > limit:
+            text += ', ...'
+        return f"[{text}]"
+        
     def update_manual_trees(self):
         self.bst_text.delete(1.0, tk.END)
-        bst_info = f"""Inorden:   {self.manual_bst.inorder_traversal()}
-Preorden:  {self.manual_bst.preorder_traversal()}
-Postorden: {self.manual_bst.postorder_traversal()}
+        bst_info = f"""Inorden:   {self._stream_preview(self.manual_bst.iter_inorder())}
+Preorden:  {self._stream_preview(self.manual_bst.iter_preorder())}
+Postorden: {self._stream_preview(self.manual_bst.iter_postorder())}
 Altura:    {self.manual_bst.height()}"""
         self.bst_text.insert(1.0, bst_info)
         
         self.rbt_text.delete(1.0, tk.END)
-        rbt_info = f"""Inorden:   {self.manual_rbt.inorder_traversal()}
-Preorden:  {self.manual_rbt.preorder_traversal()}
-Postorden: {self.manual_rbt.postorder_traversal()}
+        rbt_info = f"""Inorden:   {self._stream_preview(self.manual_rbt.iter_inorder())}
+Preorden:  {self._stream_preview(self.manual_rbt.iter_preorder())}
+Postorden: {self._stream_preview(self.manual_rbt.iter_postorder())}
 Altura:    {self.manual_rbt.height()}"""
         self.rbt_text.insert(1.0, rbt_info)
 
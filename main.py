@@ -3,6 +3,9 @@ Aplicación principal para comparar ABB vs Red-Black Tree
 Arquitectura MVC (Model-View-Controller)
 """
 from controller import PerformanceController
+from controller.engines import engine_names, get_engine
+from controller.results_store import ResultsStore
+from controller.workloads import workload_names, workload_description
 from view import PerformanceView
 
 
@@ -13,53 +16,91 @@ def main():
     print("COMPARATIVO: Árbol Binario de Búsqueda vs Red-Black Tree")
     print("="*70)
     print("\nEste programa compara el rendimiento de:")
-    print("  1. ABB (Árbol Binario de Búsqueda sin balanceo)")
-    print("  2. Red-Black Tree (con balanceo automático)")
-    print("\nSe analizarán tres tipos de datos:")
-    print("  - Datos ordenados (peor caso para ABB)")
-    print("  - Datos aleatorios (caso promedio)")
-    print("  - Datos en orden inverso (peor caso para ABB)")
+    for number, name in enumerate(engine_names(), start=1):
+        print(f"  {number}. {get_engine(name)['label']} ({name})")
+    print(f"\nSe analizarán {len(workload_names())} tipos de datos:")
+    for name in workload_names():
+        print(f"  - {workload_description(name)} ({name})")
     print("="*70)
     
     # Inicializar controlador y vista
-    controller = PerformanceController()
+    # Con semilla fija, los datos de cada (tipo, tamaño) son reproducibles;
+    # cada ejecución se guarda para compararla después con compare.py
+    controller = PerformanceController(seed=42, results_store=ResultsStore())
     view = PerformanceView()
     
     # Definir tamaños de prueba
     data_sizes = [100, 300, 500, 800, 1000]
     
     print(f"\nTamaños de prueba: {data_sizes}")
-    print("\nIniciando pruebas de rendimiento...\n")
+    print("\nIniciando pruebas de rendimiento en paralelo...\n")
+    
+    # Todas las celdas (tipo, tamaño, árbol, repetición) se reparten entre
+    # procesos fijados a núcleos distintos
+    results_by_type = controller.compare_performance_parallel(
+        data_sizes, workload_names(), count_operations=True)
     
     # Lista para almacenar todos los resultados
     all_results = []
     
-    # 1. Pruebas con datos aleatorios
+    for number, name in enumerate(workload_names(), start=1):
+        print("\n" + "="*70)
+        print(f"{number}. PRUEBAS CON DATOS: {workload_description(name).upper()}")
+        print("="*70)
+        results = results_by_type[name]
+        view.print_statistics(results)
+        view.plot_all_comparisons(results, prefix='')
+        all_results.append(results)
+    
+    # Carga mixta al estilo YCSB sobre árboles precargados
+    print("\n" + "="*70)
+    print("CARGA MIXTA: 95% búsquedas / 5% inserciones, accesos Zipf")
+    print("="*70)
+    results_mixed = controller.compare_mixed_workload(data_sizes, 'read_mostly', 'zipf')
+    view.plot_mixed_workload(results_mixed, 'mixed_workload.png')
+    
+    # Latencia individual de cada operación: la cola del ABB degenerado
+    print("\n" + "="*70)
+    print("HISTOGRAMAS DE LATENCIA (datos ordenados)")
+    print("="*70)
+    results_latency = controller.compare_latency_distribution(data_sizes, 'ordered')
+    view.plot_latency_percentiles(results_latency, 'latency_percentiles.png')
+    view.plot_latency_cdf(results_latency, 'latency_cdf.png')
+    
+    # Búsquedas fallidas: cada fallo recorre el árbol hasta una hoja
+    print("\n" + "="*70)
+    print("BÚSQUEDAS CON ACIERTOS Y FALLOS (50% de aciertos, datos ordenados)")
+    print("="*70)
+    results_hit_miss = controller.compare_hit_miss_search(data_sizes, 0.5, 'ordered')
+    view.plot_hit_miss_search(results_hit_miss, 'hit_miss_search.png')
+    
+    # Un solo árbol por contendiente que crece con puntos de control geométricos
+    print("\n" + "="*70)
+    print("CRECIMIENTO INCREMENTAL (datos aleatorios)")
+    print("="*70)
+    results_growth = controller.compare_growth(100000, checkpoints=30)
+    view.plot_growth(results_growth, 'growth_comparison.png')
+    
+    # Orden de nodo del B-Tree: altura contra costo de desplazar las listas
     print("\n" + "="*70)
-    print("1. PRUEBAS CON DATOS ALEATORIOS")
+    print("B-TREE: BARRIDO DEL ORDEN DE NODO")
     print("="*70)
-    results_random = controller.compare_performance(data_sizes, 'random')
-    view.print_statistics(results_random)
-    view.plot_all_comparisons(results_random, prefix='')
-    all_results.append(results_random)
+    results_orders = controller.compare_btree_orders([1000, 10000])
+    view.plot_btree_order_sweep(results_orders, 'btree_orders.png')
     
-    # 2. Pruebas con datos ordenados
+    # Accesos sesgados: el splay tree mantiene las llaves populares en la raíz
     print("\n" + "="*70)
-    print("2. PRUEBAS CON DATOS ORDENADOS (Peor caso para ABB)")
+    print("BÚSQUEDAS CON POPULARIDAD DE ZIPF")
     print("="*70)
-    results_ordered = controller.compare_performance(data_sizes, 'ordered')
-    view.print_statistics(results_ordered)
-    view.plot_all_comparisons(results_ordered, prefix='')
-    all_results.append(results_ordered)
+    results_skewed = controller.compare_skewed_search([1000, 10000])
+    view.plot_skewed_search(results_skewed, 'skewed_search.png')
     
-    # 3. Pruebas con datos en orden inverso
+    # Rebalanceo global del ABB degenerado
     print("\n" + "="*70)
-    print("3. PRUEBAS CON DATOS EN ORDEN INVERSO (Peor caso para ABB)")
+    print("ABB: REBALANCEO DAY-STOUT-WARREN")
     print("="*70)
-    results_reverse = controller.compare_performance(data_sizes, 'reverse')
-    view.print_statistics(results_reverse)
-    view.plot_all_comparisons(results_reverse, prefix='')
-    all_results.append(results_reverse)
+    results_rebalance = controller.compare_rebalance([1000, 5000])
+    view.plot_rebalance(results_rebalance, 'rebalance.png')
     
     # Generar gráfica combinada
     print("\n" + "="*70)
@@ -94,10 +135,18 @@ def main():
     print("PRUEBAS COMPLETADAS")
     print("="*70)
     print("\nGráficas generadas:")
-    print("  - insertion_random.png, insertion_ordered.png, insertion_reverse.png")
-    print("  - search_random.png, search_ordered.png, search_reverse.png")
-    print("  - height_random.png, height_ordered.png, height_reverse.png")
+    for prefix in ('insertion', 'bulk', 'search', 'delete', 'height', 'operations', 'memory'):
+        print(f"  - {prefix}_<tipo>.png para: {', '.join(workload_names())}")
+    print("  - mixed_workload.png (carga mixta: rendimiento y percentiles)")
+    print("  - latency_percentiles.png, latency_cdf.png (latencia por operación)")
+    print("  - hit_miss_search.png (latencia de aciertos y fallos)")
+    print("  - growth_comparison.png (crecimiento incremental)")
+    print("  - btree_orders.png (barrido del orden de nodo del B-Tree)")
+    print("  - skewed_search.png (búsquedas con popularidad de Zipf)")
+    print("  - rebalance.png (rebalanceo global del ABB)")
     print("  - combined_comparison.png (comparativa completa)")
+    print("\nResultados guardados en benchmark_results.jsonl")
+    print("Compare contra la ejecución anterior con: python compare.py")
     print("\n")
 
 
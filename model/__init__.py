@@ -1,9 +1,19 @@
 """
 Model package - Contains tree data structures
 """
-from model.binary_search_tree import BinarySearchTree
-from model.red_black_tree import RedBlackTree
-from model.bst_node import BSTNode
-from model.rb_node import RBNode, Color
+from model.binary_search_tree import BinarySearchTree, ScapegoatTree, OrderStatisticBinarySearchTree
+from model.red_black_tree import RedBlackTree, OrderStatisticRedBlackTree
+from model.array_red_black_tree import ArrayRedBlackTree
+from model.btree import BTree
+from model.splay_tree import SplayTree
+from model.tree_map import TreeMap
+from model.instrumented import InstrumentedBinarySearchTree, InstrumentedRedBlackTree
+from model.bst_node import BSTNode, SizedBSTNode
+from model.rb_node import RBNode, SizedRBNode, RBMapNode, Color
+from model.btree_node import BTreeNode
+from model.splay_node import SplayNode
 
-__all__ = ['BinarySearchTree', 'RedBlackTree', 'BSTNode', 'RBNode', 'Color']
+__all__ = ['BinarySearchTree', 'ScapegoatTree', 'OrderStatisticBinarySearchTree', 'RedBlackTree',
+           'OrderStatisticRedBlackTree', 'ArrayRedBlackTree', 'BTree', 'SplayTree', 'TreeMap',
+           'InstrumentedBinarySearchTree', 'InstrumentedRedBlackTree',
+           'BSTNode', 'SizedBSTNode', 'RBNode', 'SizedRBNode', 'RBMapNode', 'BTreeNode', 'SplayNode', 'Color']
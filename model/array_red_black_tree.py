@@ -0,0 +1,363 @@
+"""
+Árbol Red-Black con almacenamiento en arreglos paralelos (struct-of-arrays)
+"""
+from array import array
+from collections import deque
+
+from model.rb_node import Color
+
+
+class ArrayRedBlackTree:
+    """
+    Árbol Red-Black cuyos nodos viven en arreglos paralelos
+
+    Cada nodo es un índice: la llave, los hijos, el padre y el color se
+    guardan en buffers de `array` en lugar de objetos RBNode. El índice 0
+    es el centinela NIL (negro), igual que self.NIL en RedBlackTree.
+    """
+
+    NIL = 0
+
+    def __init__(self, key_typecode='auto'):
+        """
+        Inicializa un árbol Red-Black vacío
+
+        Args:
+            key_typecode: Código de tipo de `array` para las llaves. Con None
+                las llaves se guardan en una lista, lo que permite llaves no
+                numéricas a costa de más memoria. Con 'auto' (por defecto) se
+                usa 'q' y el árbol pasa a una lista en cuanto llega una llave
+                que no cabe en un entero de 64 bits.
+        """
+        self._auto_keys = key_typecode == 'auto'
+        if key_typecode is None:
+            self._keys = [None]
+        else:
+            self._keys = array('q' if self._auto_keys else key_typecode, [0])
+        self._left = array('i', [0])
+        self._right = array('i', [0])
+        self._parent = array('i', [0])
+        self._color = bytearray([Color.BLACK])
+        self.root = self.NIL
+
+    def __len__(self):
+        """Cantidad de llaves almacenadas"""
+        return len(self._color) - 1
+
+    def insert(self, key):
+        """
+        Inserta una llave en el árbol con balanceo automático
+
+        Args:
+            key: Valor a insertar
+        """
+        keys = self._keys
+        left = self._left
+        right = self._right
+
+        parent = self.NIL
+        current = self.root
+
+        # Buscar la posición para insertar
+        while current != self.NIL:
+            parent = current
+            if key < keys[current]:
+                current = left[current]
+            else:
+                current = right[current]
+
+        # Reservar el nuevo nodo al final de los buffers
+        node = len(self._color)
+        try:
+            keys.append(key)
+        except (TypeError, OverflowError):
+            if not self._auto_keys:
+                raise
+            # La llave no cabe en el arreglo: guardar las llaves en una lista
+            keys = self._keys = list(keys)
+            keys.append(key)
+        left.append(self.NIL)
+        right.append(self.NIL)
+        self._parent.append(parent)
+        self._color.append(Color.RED)
+
+        if parent == self.NIL:
+            self.root = node
+        elif key < keys[parent]:
+            left[parent] = node
+        else:
+            right[parent] = node
+
+        self._fix_insert(node)
+
+    def _fix_insert(self, node):
+        """
+        Repara el árbol después de una inserción para mantener propiedades Red-Black
+
+        Args:
+            node: Índice del nodo recién insertado
+        """
+        left = self._left
+        right = self._right
+        parent = self._parent
+        color = self._color
+
+        # El padre de la raíz es NIL (negro), lo que detiene el ciclo
+        while color[parent[node]] == Color.RED:
+            p = parent[node]
+            grandparent = parent[p]
+            if p == left[grandparent]:
+                uncle = right[grandparent]
+
+                if color[uncle] == Color.RED:
+                    # Caso 1: El tío es rojo
+                    color[p] = Color.BLACK
+                    color[uncle] = Color.BLACK
+                    color[grandparent] = Color.RED
+                    node = grandparent
+                else:
+                    if node == right[p]:
+                        # Caso 2: El nodo es hijo derecho
+                        node = p
+                        self._left_rotate(node)
+                        p = parent[node]
+
+                    # Caso 3: El nodo es hijo izquierdo
+                    color[p] = Color.BLACK
+                    color[grandparent] = Color.RED
+                    self._right_rotate(grandparent)
+            else:
+                uncle = left[grandparent]
+
+                if color[uncle] == Color.RED:
+                    # Caso 1: El tío es rojo
+                    color[p] = Color.BLACK
+                    color[uncle] = Color.BLACK
+                    color[grandparent] = Color.RED
+                    node = grandparent
+                else:
+                    if node == left[p]:
+                        # Caso 2: El nodo es hijo izquierdo
+                        node = p
+                        self._right_rotate(node)
+                        p = parent[node]
+
+                    # Caso 3: El nodo es hijo derecho
+                    color[p] = Color.BLACK
+                    color[grandparent] = Color.RED
+                    self._left_rotate(grandparent)
+
+        color[self.root] = Color.BLACK
+
+    def _left_rotate(self, node):
+        """
+        Realiza una rotación a la izquierda
+
+        Args:
+            node: Índice del nodo sobre el cual rotar
+        """
+        left = self._left
+        right = self._right
+        parent = self._parent
+
+        right_child = right[node]
+        right[node] = left[right_child]
+
+        if left[right_child] != self.NIL:
+            parent[left[right_child]] = node
+
+        node_parent = parent[node]
+        parent[right_child] = node_parent
+
+        if node_parent == self.NIL:
+            self.root = right_child
+        elif node == left[node_parent]:
+            left[node_parent] = right_child
+        else:
+            right[node_parent] = right_child
+
+        left[right_child] = node
+        parent[node] = right_child
+
+    def _right_rotate(self, node):
+        """
+        Realiza una rotación a la derecha
+
+        Args:
+            node: Índice del nodo sobre el cual rotar
+        """
+        left = self._left
+        right = self._right
+        parent = self._parent
+
+        left_child = left[node]
+        left[node] = right[left_child]
+
+        if right[left_child] != self.NIL:
+            parent[right[left_child]] = node
+
+        node_parent = parent[node]
+        parent[left_child] = node_parent
+
+        if node_parent == self.NIL:
+            self.root = left_child
+        elif node == right[node_parent]:
+            right[node_parent] = left_child
+        else:
+            left[node_parent] = left_child
+
+        right[left_child] = node
+        parent[node] = left_child
+
+    def search(self, key):
+        """
+        Busca un valor en el árbol
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        keys = self._keys
+        left = self._left
+        right = self._right
+
+        current = self.root
+        while current != self.NIL:
+            node_key = keys[current]
+            if key == node_key:
+                return True
+            elif key < node_key:
+                current = left[current]
+            else:
+                current = right[current]
+        return False
+
+    def __iter__(self):
+        """Itera las llaves en orden ascendente"""
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        """
+        Itera las llaves en orden descendente (pila explícita, memoria O(h))
+
+        Yields:
+            Valores de mayor a menor
+        """
+        stack = []
+        current = self.root
+        while stack or current != self.NIL:
+            while current != self.NIL:
+                stack.append(current)
+                current = self._right[current]
+            current = stack.pop()
+            yield self._keys[current]
+            current = self._left[current]
+
+    def iter_inorder(self):
+        """
+        Recorrido inorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en orden
+        """
+        stack = []
+        current = self.root
+        while stack or current != self.NIL:
+            while current != self.NIL:
+                stack.append(current)
+                current = self._left[current]
+            current = stack.pop()
+            yield self._keys[current]
+            current = self._right[current]
+
+    def iter_preorder(self):
+        """
+        Recorrido preorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en preorden
+        """
+        stack = [self.root] if self.root != self.NIL else []
+        while stack:
+            node = stack.pop()
+            yield self._keys[node]
+            if self._right[node] != self.NIL:
+                stack.append(self._right[node])
+            if self._left[node] != self.NIL:
+                stack.append(self._left[node])
+
+    def iter_postorder(self):
+        """
+        Recorrido postorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en postorden
+        """
+        stack = []
+        last_visited = self.NIL
+        current = self.root
+        while stack or current != self.NIL:
+            if current != self.NIL:
+                stack.append(current)
+                current = self._left[current]
+            else:
+                top = stack[-1]
+                right = self._right[top]
+                if right != self.NIL and right != last_visited:
+                    current = right
+                else:
+                    yield self._keys[top]
+                    last_visited = stack.pop()
+
+    def inorder_traversal(self):
+        """
+        Realiza un recorrido inorden del árbol
+
+        Returns:
+            Lista con los valores en orden
+        """
+        return list(self.iter_inorder())
+
+    def preorder_traversal(self):
+        """
+        Realiza un recorrido preorden del árbol
+
+        Returns:
+            Lista con los valores en preorden
+        """
+        return list(self.iter_preorder())
+
+    def postorder_traversal(self):
+        """
+        Realiza un recorrido postorden del árbol
+
+        Returns:
+            Lista con los valores en postorden
+        """
+        return list(self.iter_postorder())
+
+    def height(self):
+        """
+        Calcula la altura del árbol (iterativo mediante BFS)
+
+        Returns:
+            Altura del árbol
+        """
+        if self.root == self.NIL:
+            return 0
+
+        queue = deque([(self.root, 1)])
+        max_height = 0
+
+        while queue:
+            node, level = queue.popleft()
+            max_height = max(max_height, level)
+
+            if self._left[node] != self.NIL:
+                queue.append((self._left[node], level + 1))
+            if self._right[node] != self.NIL:
+                queue.append((self._right[node], level + 1))
+
+        return max_height
@@ -1,15 +1,118 @@
 """
 Árbol Binario de Búsqueda sin balanceo (ABB)
 """
-from model.bst_node import BSTNode
+import math
+from bisect import bisect_left, bisect_right
+from model.bst_node import BSTNode, SizedBSTNode
 
 
 class BinarySearchTree:
-    """Árbol Binario de Búsqueda sin balanceo"""
+    """
+    Árbol Binario de Búsqueda sin balanceo
     
-    def __init__(self):
-        """Inicializa un ABB vacío"""
+    Opcionalmente funciona en modo chivo expiatorio (scapegoat, Galperin y
+    Rivest): si una inserción queda a profundidad mayor que log_{1/α}(n), se
+    busca el ancestro cuyo hijo en el camino pesa más que α veces su tamaño
+    y ese subárbol se reconstruye perfectamente balanceado en tiempo lineal.
+    Los nodos siguen siendo BSTNode (sin padre ni color) y la altura queda
+    en O(log n) con costo amortizado O(log n) por inserción.
+    
+    También puede rebalancearse completo con rebalance() (Day-Stout-Warren),
+    a mano o automáticamente cuando la altura supera un factor de log2(n).
+    """
+    
+    # Clase usada para crear los nodos (las subclases pueden reemplazarla)
+    node_class = BSTNode
+    
+    def __init__(self, alpha=None, rebalance_factor=None):
+        """
+        Inicializa un ABB vacío
+        
+        Args:
+            alpha: Factor de balance del modo chivo expiatorio, entre 0.5 y 1
+                (menor = más balanceado y más reconstrucciones); None para el
+                ABB sin balanceo
+            rebalance_factor: Si se indica (al menos 1), el árbol se rebalancea
+                completo cuando su altura supera rebalance_factor * log2(n + 1)
+                
+        Raises:
+            ValueError: Si alpha no está en el intervalo (0.5, 1), si
+                rebalance_factor es menor que 1 o si se combinan ambos modos
+        """
+        if alpha is not None and not 0.5 < alpha < 1:
+            raise ValueError("alpha debe estar entre 0.5 y 1 (exclusivo)")
+        if rebalance_factor is not None and rebalance_factor < 1:
+            raise ValueError("rebalance_factor debe ser al menos 1")
+        if alpha is not None and rebalance_factor is not None:
+            raise ValueError("El modo chivo expiatorio y el rebalanceo automático son excluyentes")
         self.root = None
+        self._size = 0
+        self.alpha = alpha
+        self.rebalance_factor = rebalance_factor
+        # Mayor tamaño desde la última reconstrucción total (modo chivo expiatorio)
+        self._max_size = 0
+        # Cota superior de la altura, sin recorrer el árbol (rebalanceo automático)
+        self._height_bound = 0
+    
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Construye un árbol perfectamente balanceado en tiempo O(n)
+        
+        Args:
+            iterable: Valores ordenados ascendentemente
+            
+        Returns:
+            Nuevo árbol con todos los valores
+            
+        Raises:
+            ValueError: Si los valores no están ordenados
+        """
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("Los datos deben estar ordenados ascendentemente")
+        
+        tree = cls()
+        tree.root = tree._build_balanced(keys, 0, len(keys) - 1)
+        tree._size = len(keys)
+        tree._max_size = len(keys)
+        tree._height_bound = len(keys).bit_length()
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Construye un árbol balanceado a partir de valores en cualquier orden
+        
+        Args:
+            iterable: Valores a insertar
+            
+        Returns:
+            Nuevo árbol con todos los valores
+        """
+        return cls.from_sorted(sorted(iterable))
+    
+    def _build_balanced(self, keys, low, high):
+        """
+        Construye recursivamente un subárbol balanceado (profundidad O(log n))
+        
+        Args:
+            keys: Lista ordenada de valores
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            
+        Returns:
+            Raíz del subárbol o None si el rango está vacío
+        """
+        if low > high:
+            return None
+        
+        mid = (low + high) // 2
+        node = self.node_class(keys[mid])
+        node.left = self._build_balanced(keys, low, mid - 1)
+        node.right = self._build_balanced(keys, mid + 1, high)
+        return node
     
     def insert(self, key):
         """
@@ -18,23 +121,321 @@ class BinarySearchTree:
         Args:
             key: Valor a insertar
         """
+        if self.alpha is not None:
+            self._insert_scapegoat(key)
+            return
+        if self.rebalance_factor is not None:
+            self._insert_auto_rebalance(key)
+            return
+        self._size += 1
         if self.root is None:
-            self.root = BSTNode(key)
+            self.root = self.node_class(key)
             return
         
         current = self.root
         while True:
             if key < current.key:
                 if current.left is None:
-                    current.left = BSTNode(key)
+                    current.left = self.node_class(key)
                     return
                 current = current.left
             else:
                 if current.right is None:
-                    current.right = BSTNode(key)
+                    current.right = self.node_class(key)
                     return
                 current = current.right
     
+    def _insert_scapegoat(self, key):
+        """
+        Inserta un valor y reconstruye el subárbol del chivo expiatorio si
+        el nuevo nodo quedó demasiado profundo
+        
+        Args:
+            key: Valor a insertar
+        """
+        node = self.node_class(key)
+        self._size += 1
+        if self.root is None:
+            self.root = node
+            self._max_size = max(self._max_size, 1)
+            return
+        
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            current = current.left if key < current.key else current.right
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        
+        size = self._size
+        self._max_size = max(self._max_size, size)
+        if len(path) <= math.log(size) / math.log(1 / self.alpha):
+            return
+        
+        # Subir hasta el primer ancestro desbalanceado: su hijo en el camino
+        # pesa más que alpha veces su tamaño. Los tamaños se cuentan al subir
+        # (solo hace falta contar el hermano); el total es el tamaño del
+        # subárbol que de todos modos se reconstruye
+        child = node
+        child_size = 1
+        for i in range(len(path) - 1, -1, -1):
+            scapegoat = path[i]
+            sibling = scapegoat.right if scapegoat.left is child else scapegoat.left
+            scapegoat_size = child_size + 1 + self._subtree_size(sibling)
+            if child_size > self.alpha * scapegoat_size:
+                break
+            child = scapegoat
+            child_size = scapegoat_size
+        rebuilt = self._rebuild_subtree(scapegoat)
+        if i == 0:
+            self.root = rebuilt
+        elif path[i - 1].left is scapegoat:
+            path[i - 1].left = rebuilt
+        else:
+            path[i - 1].right = rebuilt
+    
+    def _subtree_size(self, node):
+        """
+        Cuenta los nodos de un subárbol (pila explícita)
+        
+        Args:
+            node: Raíz del subárbol (puede ser None)
+            
+        Returns:
+            Cantidad de nodos
+        """
+        count = 0
+        stack = [node] if node is not None else []
+        while stack:
+            current = stack.pop()
+            count += 1
+            if current.left is not None:
+                stack.append(current.left)
+            if current.right is not None:
+                stack.append(current.right)
+        return count
+    
+    def _insert_auto_rebalance(self, key):
+        """
+        Inserta un valor y rebalancea todo el árbol si la altura supera el
+        límite de la política
+        
+        La altura se sigue con la profundidad de cada inserción (las
+        eliminaciones solo pueden reducirla), así la política no recorre el
+        árbol. El límite nunca es menor que la altura mínima con n nodos, de
+        modo que un árbol recién rebalanceado no vuelve a dispararlo. Con
+        inserciones ordenadas el rebalanceo se repite cada O(log n)
+        inserciones; para ese caso conviene el modo chivo expiatorio.
+        
+        Args:
+            key: Valor a insertar
+        """
+        node = self.node_class(key)
+        self._size += 1
+        depth = 1
+        if self.root is None:
+            self.root = node
+        else:
+            current = self.root
+            while True:
+                depth += 1
+                if key < current.key:
+                    if current.left is None:
+                        current.left = node
+                        break
+                    current = current.left
+                else:
+                    if current.right is None:
+                        current.right = node
+                        break
+                    current = current.right
+        
+        self._height_bound = max(self._height_bound, depth)
+        size = self._size
+        if self._height_bound > max(self.rebalance_factor * math.log2(size + 1), size.bit_length()):
+            self.rebalance()
+    
+    def rebalance(self):
+        """
+        Rebalancea todo el árbol en su lugar con Day-Stout-Warren
+        
+        Primero rota a la derecha hasta convertir el árbol en una vid (lista
+        enlazada por la derecha, en orden) y luego la comprime con pasadas de
+        rotaciones a la izquierda hasta dejarla con altura mínima. Todo es
+        iterativo: tiempo O(n) y memoria extra O(1) (un nodo auxiliar).
+        """
+        size = len(self)
+        if size < 2:
+            return
+        pseudo_root = BSTNode(None)
+        pseudo_root.right = self.root
+        self._tree_to_vine(pseudo_root)
+        
+        # Primera pasada: solo las hojas sobrantes del último nivel
+        leaves = size + 1 - (1 << ((size + 1).bit_length() - 1))
+        self._compress(pseudo_root, leaves)
+        remaining = size - leaves
+        while remaining > 1:
+            remaining //= 2
+            self._compress(pseudo_root, remaining)
+        
+        self.root = pseudo_root.right
+        self._height_bound = size.bit_length()
+        self._max_size = size
+    
+    def _tree_to_vine(self, pseudo_root):
+        """
+        Convierte el árbol en una vid con rotaciones a la derecha
+        
+        Args:
+            pseudo_root: Nodo auxiliar cuyo hijo derecho es la raíz
+        """
+        tail = pseudo_root
+        rest = tail.right
+        while rest is not None:
+            if rest.left is None:
+                tail = rest
+                rest = rest.right
+            else:
+                # Rotar a la derecha: el hijo izquierdo sube sobre rest
+                pivot = rest.left
+                rest.left = pivot.right
+                pivot.right = rest
+                rest = pivot
+                tail.right = pivot
+    
+    def _compress(self, pseudo_root, count):
+        """
+        Aplica count rotaciones a la izquierda sobre nodos alternos de la vid
+        
+        Args:
+            pseudo_root: Nodo auxiliar cuyo hijo derecho es la raíz
+            count: Cantidad de rotaciones
+        """
+        scanner = pseudo_root
+        for _ in range(count):
+            child = scanner.right
+            pivot = child.right
+            # Rotar a la izquierda: el hijo derecho sube sobre child
+            scanner.right = pivot
+            child.right = pivot.left
+            pivot.left = child
+            scanner = pivot
+    
+    def _rebuild_subtree(self, node):
+        """
+        Reconstruye un subárbol perfectamente balanceado en tiempo O(n)
+        
+        Los nodos existentes se reutilizan: se listan en inorden con una pila
+        explícita y se vuelven a enlazar por mitades.
+        
+        Args:
+            node: Raíz del subárbol
+            
+        Returns:
+            Nueva raíz del subárbol
+        """
+        nodes = []
+        stack = []
+        current = node
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            nodes.append(current)
+            current = current.right
+        return self._link_balanced(nodes, 0, len(nodes) - 1)
+    
+    def _link_balanced(self, nodes, low, high):
+        """
+        Enlaza recursivamente nodos ordenados en un subárbol balanceado
+        (profundidad O(log n))
+        
+        Args:
+            nodes: Lista de nodos en inorden
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            
+        Returns:
+            Raíz del subárbol o None si el rango está vacío
+        """
+        if low > high:
+            return None
+        
+        mid = (low + high) // 2
+        node = nodes[mid]
+        node.left = self._link_balanced(nodes, low, mid - 1)
+        node.right = self._link_balanced(nodes, mid + 1, high)
+        return node
+    
+    def delete(self, key):
+        """
+        Elimina un valor del árbol (iterativo para evitar stack overflow)
+        
+        Args:
+            key: Valor a eliminar
+            
+        Returns:
+            True si el valor existía y fue eliminado, False en caso contrario
+        """
+        parent = None
+        current = self.root
+        while current is not None and key != current.key:
+            parent = current
+            if key < current.key:
+                current = current.left
+            else:
+                current = current.right
+        
+        if current is None:
+            return False
+        self._remove_node(parent, current)
+        return True
+    
+    def _remove_node(self, parent, node):
+        """
+        Desenlaza un nodo encontrado por delete()
+        
+        Args:
+            parent: Padre del nodo (None si es la raíz)
+            node: Nodo con el valor a eliminar
+        """
+        if node.left is not None and node.right is not None:
+            # Dos hijos: copiar el sucesor y eliminar su nodo
+            successor_parent = node
+            successor = node.right
+            while successor.left is not None:
+                successor_parent = successor
+                successor = successor.left
+            node.key = successor.key
+            parent = successor_parent
+            node = successor
+        
+        # El nodo a desenlazar tiene a lo sumo un hijo
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._size -= 1
+        
+        # Modo chivo expiatorio: tras muchas eliminaciones se reconstruye todo
+        if self.alpha is not None and len(self) < self.alpha * self._max_size:
+            if self.root is not None:
+                self.root = self._rebuild_subtree(self.root)
+            self._max_size = len(self)
+    
+    def __len__(self):
+        """Cantidad de valores almacenados"""
+        return self._size
+    
     def search(self, key):
         """
         Busca un valor en el árbol (iterativo para evitar stack overflow)
@@ -55,77 +456,153 @@ class BinarySearchTree:
                 current = current.right
         return False
     
-    def inorder_traversal(self):
+    def search_many(self, keys):
         """
-        Realiza un recorrido inorden del árbol
+        Busca un lote de valores compartiendo el descenso entre ellos
         
+        El lote se ordena una vez y se reparte por el árbol: cada nodo
+        visitado divide con bisect el rango de consultas que le llega entre
+        su subárbol izquierdo y el derecho, así cada nodo se visita a lo
+        sumo una vez por lote.
+        
+        Args:
+            keys: Secuencia de valores a buscar
+            
         Returns:
-            Lista con los valores en orden
+            Lista de booleanos en el mismo orden que keys
         """
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        keys = list(keys)
+        found = [False] * len(keys)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        probes = [keys[i] for i in order]
+        
+        stack = [(self.root, 0, len(probes))] if self.root is not None and probes else []
+        while stack:
+            node, low, high = stack.pop()
+            start = bisect_left(probes, node.key, low, high)
+            end = bisect_right(probes, node.key, start, high)
+            for i in range(start, end):
+                found[order[i]] = True
+            if low < start and node.left is not None:
+                stack.append((node.left, low, start))
+            if end < high and node.right is not None:
+                stack.append((node.right, end, high))
+        return found
     
-    def _inorder_recursive(self, node, result):
+    def freeze(self):
         """
-        Recorrido inorden recursivo
+        Crea una instantánea inmutable en disposición Eytzinger
         
-        Args:
-            node: Nodo actual
-            result: Lista para almacenar los resultados
+        Returns:
+            FrozenTree con las llaves actuales del árbol
         """
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_recursive(node.right, result)
+        from model.frozen_tree import FrozenTree
+        return FrozenTree(self.iter_inorder())
     
-    def preorder_traversal(self):
+    def __iter__(self):
+        """Itera las llaves en orden ascendente"""
+        return self.iter_inorder()
+    
+    def __reversed__(self):
         """
-        Realiza un recorrido preorden del árbol
+        Itera las llaves en orden descendente (pila explícita, memoria O(h))
         
-        Returns:
-            Lista con los valores en preorden
+        Yields:
+            Valores de mayor a menor
         """
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.right
+            current = stack.pop()
+            yield current.key
+            current = current.left
     
-    def _preorder_recursive(self, node, result):
+    def iter_inorder(self):
         """
-        Recorrido preorden recursivo
+        Recorrido inorden perezoso (pila explícita, memoria O(h))
         
-        Args:
-            node: Nodo actual
-            result: Lista para almacenar los resultados
+        Yields:
+            Valores en orden
         """
-        if node is not None:
-            result.append(node.key)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.key
+            current = current.right
     
-    def postorder_traversal(self):
+    def iter_preorder(self):
         """
-        Realiza un recorrido postorden del árbol
+        Recorrido preorden perezoso (pila explícita, memoria O(h))
+        
+        Yields:
+            Valores en preorden
+        """
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                yield current.key
+                if current.right is not None:
+                    stack.append(current.right)
+                current = current.left
+            if stack:
+                current = stack.pop()
+    
+    def iter_postorder(self):
+        """
+        Recorrido postorden perezoso (pila explícita, memoria O(h))
+        
+        Yields:
+            Valores en postorden
+        """
+        stack = []
+        last_visited = None
+        current = self.root
+        while stack or current is not None:
+            if current is not None:
+                stack.append(current)
+                current = current.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last_visited:
+                    current = top.right
+                else:
+                    yield top.key
+                    last_visited = stack.pop()
+    
+    def inorder_traversal(self):
+        """
+        Realiza un recorrido inorden del árbol
         
         Returns:
-            Lista con los valores en postorden
+            Lista con los valores en orden
         """
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
+        return list(self.iter_inorder())
     
-    def _postorder_recursive(self, node, result):
+    def preorder_traversal(self):
         """
-        Recorrido postorden recursivo
+        Realiza un recorrido preorden del árbol
         
-        Args:
-            node: Nodo actual
-            result: Lista para almacenar los resultados
+        Returns:
+            Lista con los valores en preorden
         """
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.key)
+        return list(self.iter_preorder())
+    
+    def postorder_traversal(self):
+        """
+        Realiza un recorrido postorden del árbol
+        
+        Returns:
+            Lista con los valores en postorden
+        """
+        return list(self.iter_postorder())
     
     def height(self):
         """
@@ -170,3 +647,255 @@ class BinarySearchTree:
         right_height = self._height_recursive(node.right)
         
         return 1 + max(left_height, right_height)
+
+
+class ScapegoatTree(BinarySearchTree):
+    """ABB en modo chivo expiatorio (motor del registro de comparaciones)"""
+    
+    def __init__(self, alpha=0.7):
+        """
+        Inicializa un ABB vacío en modo chivo expiatorio
+        
+        Args:
+            alpha: Factor de balance, entre 0.5 y 1
+        """
+        super().__init__(alpha=alpha)
+
+
+class OrderStatisticBinarySearchTree(BinarySearchTree):
+    """
+    ABB aumentado con el tamaño de cada subárbol
+    
+    Cada nodo guarda cuántos nodos tiene su subárbol, lo que permite
+    select(), rank() y count_range() en O(h). Mantener ese campo cuesta una
+    escritura por nivel en cada inserción y eliminación; el BinarySearchTree
+    base no lo paga. Acepta los mismos modos de balanceo que la base: las
+    reconstrucciones recalculan los tamaños de los nodos que reenlazan.
+    """
+    
+    node_class = SizedBSTNode
+    
+    def _build_balanced(self, keys, low, high):
+        """
+        Construye recursivamente un subárbol balanceado con sus tamaños
+        
+        Args:
+            keys: Lista ordenada de valores
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            
+        Returns:
+            Raíz del subárbol o None si el rango está vacío
+        """
+        node = super()._build_balanced(keys, low, high)
+        if node is not None:
+            node.size = high - low + 1
+        return node
+    
+    def _link_balanced(self, nodes, low, high):
+        """
+        Enlaza recursivamente nodos ordenados en un subárbol balanceado y
+        recalcula sus tamaños
+        
+        Args:
+            nodes: Lista de nodos en inorden
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            
+        Returns:
+            Raíz del subárbol o None si el rango está vacío
+        """
+        node = super()._link_balanced(nodes, low, high)
+        if node is not None:
+            node.size = high - low + 1
+        return node
+    
+    def insert(self, key):
+        """
+        Inserta un nuevo nodo sumándolo al tamaño de sus ancestros
+        
+        Args:
+            key: Valor a insertar
+        """
+        if self.alpha is not None or self.rebalance_factor is not None:
+            # Los modos con reconstrucción recalculan los tamaños de lo que
+            # reenlazan, así que basta con sumar el nodo al camino
+            current = self.root
+            while current is not None:
+                current.size += 1
+                current = current.left if key < current.key else current.right
+            super().insert(key)
+            return
+        
+        self._size += 1
+        if self.root is None:
+            self.root = self.node_class(key)
+            return
+        
+        current = self.root
+        while True:
+            current.size += 1
+            if key < current.key:
+                if current.left is None:
+                    current.left = self.node_class(key)
+                    return
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = self.node_class(key)
+                    return
+                current = current.right
+    
+    def rebalance(self):
+        """
+        Rebalancea todo el árbol con Day-Stout-Warren y recalcula los tamaños
+        """
+        super().rebalance()
+        if self.root is not None:
+            self._recount_sizes(self.root)
+    
+    def _recount_sizes(self, node):
+        """
+        Recalcula recursivamente los tamaños de un subárbol balanceado
+        (profundidad O(log n))
+        
+        Args:
+            node: Raíz del subárbol
+            
+        Returns:
+            Tamaño del subárbol
+        """
+        size = 1
+        if node.left is not None:
+            size += self._recount_sizes(node.left)
+        if node.right is not None:
+            size += self._recount_sizes(node.right)
+        node.size = size
+        return size
+    
+    def delete(self, key):
+        """
+        Elimina un valor descontándolo del tamaño de sus ancestros
+        
+        Args:
+            key: Valor a eliminar
+            
+        Returns:
+            True si el valor existía y fue eliminado, False en caso contrario
+        """
+        # Se descuentan los tamaños en la misma pasada de descenso
+        parent = None
+        current = self.root
+        while current is not None and key != current.key:
+            current.size -= 1
+            parent = current
+            if key < current.key:
+                current = current.left
+            else:
+                current = current.right
+        
+        if current is None:
+            # El valor no existía: restaurar los tamaños del camino
+            self._adjust_path_sizes(key, 1)
+            return False
+        
+        current.size -= 1
+        if current.left is not None and current.right is not None:
+            # El camino hasta el sucesor, que es el nodo desenlazado
+            successor = current.right
+            while successor.left is not None:
+                successor.size -= 1
+                successor = successor.left
+        self._remove_node(parent, current)
+        return True
+    
+    def _adjust_path_sizes(self, key, delta):
+        """
+        Ajusta el tamaño de los nodos en el camino de búsqueda de un valor
+        
+        Args:
+            key: Valor que define el camino desde la raíz
+            delta: Cantidad a sumar al tamaño de cada nodo
+        """
+        current = self.root
+        while current is not None and key != current.key:
+            current.size += delta
+            if key < current.key:
+                current = current.left
+            else:
+                current = current.right
+    
+    def select(self, k):
+        """
+        Obtiene el k-ésimo valor más pequeño en tiempo O(h)
+        
+        Args:
+            k: Posición en orden ascendente, empezando en 0
+            
+        Returns:
+            Valor en la posición k
+            
+        Raises:
+            IndexError: Si k está fuera de rango
+        """
+        if not 0 <= k < len(self):
+            raise IndexError("Posición fuera de rango")
+        
+        current = self.root
+        while True:
+            left_size = current.left.size if current.left is not None else 0
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current.key
+            else:
+                k -= left_size + 1
+                current = current.right
+    
+    def rank(self, key):
+        """
+        Cuenta los valores estrictamente menores que key en tiempo O(h)
+        
+        Args:
+            key: Valor de referencia (no necesita existir en el árbol)
+            
+        Returns:
+            Cantidad de valores menores que key
+        """
+        return self._count_less(key, False)
+    
+    def count_range(self, low, high):
+        """
+        Cuenta los valores dentro del rango [low, high] en tiempo O(h)
+        
+        Args:
+            low: Límite inferior (inclusivo)
+            high: Límite superior (inclusivo)
+            
+        Returns:
+            Cantidad de valores en el rango
+        """
+        if high < low:
+            return 0
+        return self._count_less(high, True) - self._count_less(low, False)
+    
+    def _count_less(self, key, inclusive):
+        """
+        Cuenta los valores menores (o menores o iguales) que key
+        
+        Args:
+            key: Valor de referencia
+            inclusive: Si True también cuenta los valores iguales a key
+            
+        Returns:
+            Cantidad de valores que cumplen la condición
+        """
+        count = 0
+        current = self.root
+        while current is not None:
+            if key < current.key or (not inclusive and key == current.key):
+                current = current.left
+            else:
+                count += (current.left.size if current.left is not None else 0) + 1
+                current = current.right
+        return count
@@ -16,3 +16,17 @@ class BSTNode:
         self.key = key
         self.left = None
         self.right = None
+
+
+class SizedBSTNode(BSTNode):
+    """Nodo del ABB que además guarda el tamaño de su subárbol"""
+    
+    def __init__(self, key):
+        """
+        Inicializa un nodo del ABB con estadísticas de orden
+        
+        Args:
+            key: Valor del nodo
+        """
+        super().__init__(key)
+        self.size = 1  # Cantidad de nodos del subárbol (estadísticas de orden)
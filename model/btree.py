@@ -0,0 +1,312 @@
+"""
+B-Tree con orden de nodo configurable
+"""
+from bisect import bisect_left, bisect_right, insort_right
+from model.btree_node import BTreeNode
+
+
+class BTree:
+    """
+    B-Tree: cada nodo guarda hasta order - 1 llaves ordenadas en una lista
+
+    La búsqueda dentro de un nodo usa bisect (en C), así cada nivel cuesta
+    una sola visita a un objeto de Python en lugar de una por comparación, y
+    con nodos anchos la altura es log_order(n) en vez de log2(n). Todas las
+    hojas quedan a la misma profundidad. Se permiten llaves duplicadas.
+    """
+
+    # Clase usada para crear los nodos (las subclases pueden reemplazarla)
+    node_class = BTreeNode
+
+    def __init__(self, order=64):
+        """
+        Inicializa un B-Tree vacío
+
+        Args:
+            order: Máximo de hijos por nodo (al menos 3); cada nodo salvo la
+                raíz tiene entre ceil(order/2) - 1 y order - 1 llaves
+
+        Raises:
+            ValueError: Si el orden es menor que 3
+        """
+        if order < 3:
+            raise ValueError("El orden del B-Tree debe ser al menos 3")
+        self.order = order
+        self._max_keys = order - 1
+        self._min_keys = (order + 1) // 2 - 1
+        self.root = self.node_class()
+        self._size = 0
+
+    def insert(self, key):
+        """
+        Inserta un valor; los nodos llenos se dividen de abajo hacia arriba
+
+        Args:
+            key: Valor a insertar
+        """
+        node = self.root
+        path = []
+        while node.children:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        insort_right(node.keys, key)
+        self._size += 1
+
+        # Dividir por la mediana mientras el nodo exceda el máximo de llaves
+        while len(node.keys) > self._max_keys:
+            mid = len(node.keys) // 2
+            median = node.keys[mid]
+            sibling = self.node_class(node.keys[mid + 1:], node.children[mid + 1:])
+            del node.keys[mid:]
+            del node.children[mid + 1:]
+            if not path:
+                self.root = self.node_class([median], [node, sibling])
+                break
+            node, i = path.pop()
+            node.keys.insert(i, median)
+            node.children.insert(i + 1, sibling)
+
+    def search(self, key):
+        """
+        Busca un valor en el árbol (iterativo)
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        node = self.root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return True
+            if not node.children:
+                return False
+            node = node.children[i]
+
+    def delete(self, key):
+        """
+        Elimina una aparición de un valor manteniendo el mínimo de llaves por nodo
+
+        Una llave de un nodo interno se reemplaza por su predecesora (la
+        mayor de la hoja más a la derecha de su subárbol izquierdo). Si la
+        hoja queda por debajo del mínimo, se pide una llave prestada a un
+        hermano o se fusiona con él, subiendo hacia la raíz.
+
+        Args:
+            key: Valor a eliminar
+
+        Returns:
+            True si el valor existía y fue eliminado, False en caso contrario
+        """
+        node = self.root
+        path = []
+        while True:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                break
+            if not node.children:
+                return False
+            path.append((node, i))
+            node = node.children[i]
+
+        if node.children:
+            target = node
+            path.append((node, i))
+            node = node.children[i]
+            while node.children:
+                path.append((node, len(node.children) - 1))
+                node = node.children[-1]
+            target.keys[i] = node.keys.pop()
+        else:
+            node.keys.pop(i)
+        self._size -= 1
+        self._fix_underflow(node, path)
+        return True
+
+    def _fix_underflow(self, node, path):
+        """
+        Restaura el mínimo de llaves desde un nodo hacia la raíz
+
+        Args:
+            node: Nodo que acaba de perder una llave
+            path: Lista de (ancestro, índice del hijo seguido) desde la raíz
+        """
+        min_keys = self._min_keys
+        while path and len(node.keys) < min_keys:
+            parent, i = path.pop()
+            siblings = parent.children
+
+            if i > 0 and len(siblings[i - 1].keys) > min_keys:
+                # Rotar una llave desde el hermano izquierdo
+                left = siblings[i - 1]
+                node.keys.insert(0, parent.keys[i - 1])
+                parent.keys[i - 1] = left.keys.pop()
+                if left.children:
+                    node.children.insert(0, left.children.pop())
+                return
+
+            if i < len(siblings) - 1 and len(siblings[i + 1].keys) > min_keys:
+                # Rotar una llave desde el hermano derecho
+                right = siblings[i + 1]
+                node.keys.append(parent.keys[i])
+                parent.keys[i] = right.keys.pop(0)
+                if right.children:
+                    node.children.append(right.children.pop(0))
+                return
+
+            # Fusionar con un hermano junto con la llave separadora
+            separator = i - 1 if i > 0 else i
+            left, right = siblings[separator], siblings[separator + 1]
+            left.keys.append(parent.keys.pop(separator))
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+            del siblings[separator + 1]
+            node = parent
+
+        if not self.root.keys and self.root.children:
+            self.root = self.root.children[0]
+
+    def __len__(self):
+        """Cantidad de valores almacenados"""
+        return self._size
+
+    def freeze(self):
+        """
+        Crea una instantánea inmutable en disposición Eytzinger
+
+        Returns:
+            FrozenTree con las llaves actuales del árbol
+        """
+        from model.frozen_tree import FrozenTree
+        return FrozenTree(self.iter_inorder())
+
+    def __iter__(self):
+        """Itera las llaves en orden ascendente"""
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        """
+        Itera las llaves en orden descendente (pila explícita, memoria O(h))
+
+        Yields:
+            Valores de mayor a menor
+        """
+        stack = []
+        node = self.root
+        while True:
+            while node.children:
+                stack.append((node, len(node.keys) - 1))
+                node = node.children[-1]
+            yield from reversed(node.keys)
+            while stack:
+                parent, i = stack.pop()
+                if i >= 0:
+                    yield parent.keys[i]
+                    stack.append((parent, i - 1))
+                    node = parent.children[i]
+                    break
+            else:
+                return
+
+    def iter_inorder(self):
+        """
+        Recorrido inorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en orden
+        """
+        stack = []
+        node = self.root
+        while True:
+            while node.children:
+                stack.append((node, 0))
+                node = node.children[0]
+            yield from node.keys
+            # Subir hasta el primer ancestro con llaves sin visitar
+            while stack:
+                parent, i = stack.pop()
+                if i < len(parent.keys):
+                    yield parent.keys[i]
+                    stack.append((parent, i + 1))
+                    node = parent.children[i + 1]
+                    break
+            else:
+                return
+
+    def iter_preorder(self):
+        """
+        Recorrido preorden perezoso: las llaves de cada nodo antes que sus hijos
+
+        Yields:
+            Valores en preorden
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(reversed(node.children))
+
+    def iter_postorder(self):
+        """
+        Recorrido postorden perezoso: los hijos de cada nodo antes que sus llaves
+
+        Yields:
+            Valores en postorden
+        """
+        stack = [(self.root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded or not node.children:
+                yield from node.keys
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+
+    def inorder_traversal(self):
+        """
+        Realiza un recorrido inorden del árbol
+
+        Returns:
+            Lista con los valores en orden
+        """
+        return list(self.iter_inorder())
+
+    def preorder_traversal(self):
+        """
+        Realiza un recorrido preorden del árbol
+
+        Returns:
+            Lista con los valores en preorden
+        """
+        return list(self.iter_preorder())
+
+    def postorder_traversal(self):
+        """
+        Realiza un recorrido postorden del árbol
+
+        Returns:
+            Lista con los valores en postorden
+        """
+        return list(self.iter_postorder())
+
+    def height(self):
+        """
+        Calcula la altura del árbol en niveles de nodos
+
+        Todas las hojas están a la misma profundidad: basta seguir el primer hijo.
+
+        Returns:
+            Altura del árbol (0 si está vacío)
+        """
+        if not self.root.keys:
+            return 0
+        levels = 1
+        node = self.root
+        while node.children:
+            node = node.children[0]
+            levels += 1
+        return levels
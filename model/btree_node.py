@@ -0,0 +1,18 @@
+"""
+Nodo para B-Tree con llaves ordenadas en un arreglo
+"""
+
+
+class BTreeNode:
+    """Nodo del B-Tree: una lista ordenada de llaves y, si es interno, sus hijos"""
+
+    def __init__(self, keys=None, children=None):
+        """
+        Inicializa un nodo del B-Tree
+
+        Args:
+            keys: Lista ordenada de llaves (vacía por defecto)
+            children: Lista de len(keys) + 1 hijos, o vacía si es hoja
+        """
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
@@ -0,0 +1,49 @@
+"""
+Protocolo de conjunto ordenado que cumple cualquier motor comparable
+
+Un motor es una clase cuyo constructor sin argumentos crea un conjunto vacío
+con insert, search, height e iteración en orden ascendente. Las operaciones
+opcionales (eliminación, carga masiva, búsqueda por lotes) solo se miden en
+los motores que las implementan.
+"""
+from typing import Protocol, runtime_checkable
+
+
+# Operación opcional → fase de compare_performance que la necesita
+OPTIONAL_OPERATIONS = {
+    'delete': 'delete',
+    'from_iterable': 'bulk',
+    'search_many': 'search_batch'
+}
+
+
+@runtime_checkable
+class OrderedSetEngine(Protocol):
+    """Operaciones obligatorias de un motor de conjunto ordenado"""
+
+    def insert(self, key):
+        """Inserta una llave (los duplicados se permiten)"""
+
+    def search(self, key):
+        """Devuelve True si la llave existe y False si no (siempre un bool)"""
+
+    def height(self):
+        """Devuelve la altura (0 para el conjunto vacío)"""
+
+    def __iter__(self):
+        """Recorre las llaves en orden ascendente"""
+
+
+def supports(engine, operation):
+    """
+    Indica si un motor (clase o instancia) implementa una operación opcional
+
+    Args:
+        engine: Clase o instancia del motor
+        operation: Nombre de la operación ('delete', 'from_iterable' o
+            'search_many')
+
+    Returns:
+        True si el motor tiene la operación
+    """
+    return callable(getattr(engine, operation, None))
@@ -0,0 +1,115 @@
+"""
+Instantánea inmutable de un árbol en disposición Eytzinger (orden BFS)
+"""
+import numpy as np
+
+
+class FrozenTree:
+    """
+    Conjunto ordenado de solo lectura almacenado en un arreglo de NumPy
+
+    Las llaves se guardan en orden Eytzinger: la posición 1 es la raíz y los
+    hijos de la posición k están en 2k y 2k+1. Los primeros niveles quedan
+    contiguos en memoria, y la búsqueda por lotes desciende todos los
+    valores a la vez con operaciones vectorizadas y sin saltos por valor.
+    """
+
+    def __init__(self, sorted_keys):
+        """
+        Construye la instantánea a partir de llaves ordenadas
+
+        Args:
+            sorted_keys: Iterable de llaves en orden ascendente
+        """
+        keys = np.asarray(list(sorted_keys))
+        size = len(keys)
+        self._size = size
+        # Cantidad de niveles del árbol completo con `size` nodos
+        self._depth = size.bit_length()
+
+        # En el nivel i del descenso el índice es menor que 2^(i+1), por lo
+        # que 2^depth posiciones bastan; las posiciones sin nodo se marcan
+        # como inválidas en lugar de usar un valor centinela
+        capacity = 1 << self._depth
+        self._layout = np.zeros(capacity, dtype=keys.dtype)
+        self._valid = np.zeros(capacity, dtype=bool)
+        self._valid[1:size + 1] = True
+
+        # Recorrido inorden iterativo sobre el árbol implícito
+        position = 0
+        stack = []
+        k = 1
+        while stack or k <= size:
+            while k <= size:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self._layout[k] = keys[position]
+            position += 1
+            k = 2 * k + 1
+
+    def __len__(self):
+        """Cantidad de llaves almacenadas"""
+        return self._size
+
+    def height(self):
+        """
+        Altura del árbol implícito
+
+        Returns:
+            Cantidad de niveles
+        """
+        return self._depth
+
+    def contains(self, key):
+        """
+        Busca una llave en la instantánea
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        layout = self._layout
+        k = 1
+        while k <= self._size:
+            node_key = layout[k]
+            if key == node_key:
+                return True
+            k = 2 * k + (1 if node_key < key else 0)
+        return False
+
+    def search(self, key):
+        """Alias de contains() para compartir la interfaz de los árboles"""
+        return self.contains(key)
+
+    def contains_many(self, keys):
+        """
+        Busca un lote de llaves con un descenso vectorizado sin ramas
+
+        Cada nivel procesa todo el lote a la vez: se compara la llave del
+        nodo actual, se recuerda el último nodo mayor o igual (cota inferior)
+        y se avanza al hijo correspondiente con aritmética de índices.
+
+        Args:
+            keys: Arreglo de NumPy (o secuencia) con los valores a buscar
+
+        Returns:
+            Arreglo booleano de NumPy con el resultado de cada valor
+        """
+        queries = np.asarray(keys)
+        if self._size == 0 or queries.size == 0:
+            return np.zeros(queries.shape, dtype=bool)
+
+        layout = self._layout
+        valid = self._valid
+        k = np.ones(queries.shape, dtype=np.intp)
+        candidate = np.zeros(queries.shape, dtype=np.intp)
+
+        for _ in range(self._depth):
+            go_left = valid[k] & (layout[k] >= queries)
+            candidate = np.where(go_left, k, candidate)
+            k = 2 * k + (~go_left)
+
+        return (candidate > 0) & (layout[candidate] == queries)
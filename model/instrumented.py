@@ -0,0 +1,213 @@
+"""
+Variantes instrumentadas de los árboles que cuentan operaciones elementales
+
+Las clases base no cambian: el conteo vive solo en estas subclases, de modo
+que los árboles usados para medir tiempos no pagan ningún costo extra. Las
+subclases no copian los algoritmos: llaman a los métodos reales y cuentan
+desde sus puntos de extensión (la llave que se compara, _fix_insert y las
+rotaciones).
+
+En ambos árboles una comparación de inserción es un nodo del camino de
+descenso: el que decide si se sigue por la izquierda o por la derecha.
+"""
+from model.binary_search_tree import BinarySearchTree
+from model.bst_node import BSTNode
+from model.red_black_tree import RedBlackTree
+from model.rb_node import Color
+
+
+class _CountingKey:
+    """Envuelve una llave y cuenta las comparaciones en que es el operando izquierdo"""
+
+    __slots__ = ('key', 'equal', 'less')
+
+    def __init__(self, key):
+        """
+        Inicializa la envoltura con contadores en cero
+
+        Args:
+            key: Llave original
+        """
+        self.key = key
+        self.equal = 0
+        self.less = 0
+
+    def __eq__(self, other):
+        """Compara por igualdad contando la comparación"""
+        self.equal += 1
+        return self.key == other
+
+    def __lt__(self, other):
+        """Compara por orden contando la comparación"""
+        self.less += 1
+        return self.key < other
+
+    __hash__ = None
+
+
+class _CountingBSTNode(BSTNode):
+    """Nodo del ABB instrumentado: guarda la llave original y no su envoltura"""
+
+    def __init__(self, key):
+        """
+        Inicializa un nodo del ABB
+
+        Args:
+            key: Valor del nodo (puede venir envuelto en _CountingKey)
+        """
+        super().__init__(key.key if isinstance(key, _CountingKey) else key)
+
+
+def _count_search(search, key, counters):
+    """
+    Ejecuta la búsqueda base de un árbol contando comparaciones y visitas
+
+    Cada nodo visitado se compara primero por igualdad, así que las visitas
+    son las comparaciones de igualdad.
+
+    Args:
+        search: Método search de la clase base, ya ligado al árbol
+        key: Valor a buscar
+        counters: Diccionario de contadores del árbol
+
+    Returns:
+        True si el valor existe, False en caso contrario
+    """
+    probe = _CountingKey(key)
+    found = search(probe)
+    counters['searches'] += 1
+    counters['search_visits'] += probe.equal
+    counters['search_comparisons'] += probe.equal + probe.less
+    return found
+
+
+class InstrumentedBinarySearchTree(BinarySearchTree):
+    """ABB que cuenta comparaciones de llaves y nodos visitados"""
+
+    node_class = _CountingBSTNode
+
+    def __init__(self):
+        """Inicializa un ABB vacío con contadores en cero"""
+        super().__init__()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Reinicia todos los contadores"""
+        self.counters = {
+            'insert_comparisons': 0,
+            'search_comparisons': 0,
+            'search_visits': 0,
+            'searches': 0
+        }
+
+    def insert(self, key):
+        """
+        Inserta un valor con el algoritmo base contando sus comparaciones
+
+        Args:
+            key: Valor a insertar
+        """
+        probe = _CountingKey(key)
+        super().insert(probe)
+        self.counters['insert_comparisons'] += probe.equal + probe.less
+
+    def search(self, key):
+        """
+        Busca un valor contando comparaciones y nodos visitados
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        return _count_search(super().search, key, self.counters)
+
+
+class InstrumentedRedBlackTree(RedBlackTree):
+    """Árbol Red-Black que cuenta comparaciones, visitas, rotaciones y casos de reparación"""
+
+    def __init__(self):
+        """Inicializa un árbol Red-Black vacío con contadores en cero"""
+        super().__init__()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Reinicia todos los contadores"""
+        self.counters = {
+            'insert_comparisons': 0,
+            'search_comparisons': 0,
+            'search_visits': 0,
+            'searches': 0,
+            'left_rotations': 0,
+            'right_rotations': 0,
+            'fixup_case1': 0,
+            'fixup_case2': 0,
+            'fixup_case3': 0
+        }
+
+    def _fix_insert(self, node):
+        """
+        Ejecuta la reparación base y clasifica los casos que aplicó
+
+        Se llama justo después de enlazar el nodo, así que cada ancestro es
+        una comparación del descenso. Los casos se deducen de sus efectos:
+        el caso 1 es el único que pinta de negro a un tío rojo, el caso 3
+        termina con una rotación y el caso 2 agrega otra antes que él.
+
+        Args:
+            node: Nodo recién insertado
+        """
+        counters = self.counters
+        red_uncles = []
+        child = node
+        ancestor = node.parent
+        while ancestor is not None:
+            counters['insert_comparisons'] += 1
+            sibling = ancestor.right if child is ancestor.left else ancestor.left
+            if sibling.color == Color.RED:
+                red_uncles.append(sibling)
+            child = ancestor
+            ancestor = ancestor.parent
+
+        rotations = counters['left_rotations'] + counters['right_rotations']
+        super()._fix_insert(node)
+        rotations = counters['left_rotations'] + counters['right_rotations'] - rotations
+
+        counters['fixup_case1'] += sum(1 for uncle in red_uncles if uncle.color == Color.BLACK)
+        if rotations >= 1:
+            counters['fixup_case3'] += 1
+        if rotations == 2:
+            counters['fixup_case2'] += 1
+
+    def _left_rotate(self, node):
+        """
+        Rotación a la izquierda con conteo
+
+        Args:
+            node: Nodo sobre el cual rotar
+        """
+        self.counters['left_rotations'] += 1
+        super()._left_rotate(node)
+
+    def _right_rotate(self, node):
+        """
+        Rotación a la derecha con conteo
+
+        Args:
+            node: Nodo sobre el cual rotar
+        """
+        self.counters['right_rotations'] += 1
+        super()._right_rotate(node)
+
+    def search(self, key):
+        """
+        Busca un valor contando comparaciones y nodos visitados
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        return _count_search(super().search, key, self.counters)
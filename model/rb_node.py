@@ -25,3 +25,34 @@ class RBNode:
         self.left = None
         self.right = None
         self.parent = None
+
+
+class SizedRBNode(RBNode):
+    """Nodo Red-Black que además guarda el tamaño de su subárbol"""
+    
+    def __init__(self, key, color=Color.RED):
+        """
+        Inicializa un nodo Red-Black con estadísticas de orden
+        
+        Args:
+            key: Valor del nodo
+            color: Color del nodo (RED por defecto)
+        """
+        super().__init__(key, color)
+        self.size = 1  # Cantidad de nodos del subárbol (estadísticas de orden)
+
+
+class RBMapNode(SizedRBNode):
+    """Nodo Red-Black que además guarda un valor asociado a la llave"""
+    
+    def __init__(self, key, color=Color.RED, value=None):
+        """
+        Inicializa un nodo del mapa ordenado
+        
+        Args:
+            key: Llave del nodo
+            color: Color del nodo (RED por defecto)
+            value: Valor asociado a la llave
+        """
+        super().__init__(key, color)
+        self.value = value
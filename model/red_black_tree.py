@@ -1,16 +1,92 @@
 """
 Árbol Red-Black con balanceo automático
 """
-from model.rb_node import RBNode, Color
+from bisect import bisect_left, bisect_right
+from model.rb_node import RBNode, SizedRBNode, Color
 
 
 class RedBlackTree:
     """Árbol Red-Black con balanceo automático"""
     
+    # Clase usada para crear los nodos (las subclases pueden reemplazarla)
+    node_class = RBNode
+    
     def __init__(self):
         """Inicializa un árbol Red-Black vacío"""
         self.NIL = RBNode(None, Color.BLACK)  # Nodo centinela
         self.root = self.NIL
+        self._size = 0
+        # Estado del modo finger: [nodo mínimo, nodo máximo, última inserción]
+        self._finger = None
+    
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Construye un árbol Red-Black balanceado en tiempo O(n)
+        
+        Los nodos se toman del punto medio de cada rango, por lo que todos
+        los caminos a NIL miden floor(log2(n+1)) o un nodo más. Los nodos
+        hasta esa profundidad son negros y los del último nivel incompleto
+        son rojos, lo que iguala la altura negra de todos los caminos.
+        
+        Args:
+            iterable: Valores ordenados ascendentemente
+            
+        Returns:
+            Nuevo árbol con todos los valores
+            
+        Raises:
+            ValueError: Si los valores no están ordenados
+        """
+        keys = list(iterable)
+        for i in range(1, len(keys)):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("Los datos deben estar ordenados ascendentemente")
+        
+        tree = cls()
+        black_height = (len(keys) + 1).bit_length() - 1
+        tree.root = tree._build_balanced(keys, 0, len(keys) - 1, 1, black_height, None)
+        tree._size = len(keys)
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Construye un árbol Red-Black a partir de valores en cualquier orden
+        
+        Args:
+            iterable: Valores a insertar
+            
+        Returns:
+            Nuevo árbol con todos los valores
+        """
+        return cls.from_sorted(sorted(iterable))
+    
+    def _build_balanced(self, keys, low, high, depth, black_height, parent):
+        """
+        Construye recursivamente un subárbol balanceado y coloreado
+        
+        Args:
+            keys: Lista ordenada de valores
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            depth: Profundidad del nodo a crear (la raíz tiene profundidad 1)
+            black_height: Profundidad máxima con nodos negros
+            parent: Padre del nodo a crear
+            
+        Returns:
+            Raíz del subárbol o NIL si el rango está vacío
+        """
+        if low > high:
+            return self.NIL
+        
+        mid = (low + high) // 2
+        color = Color.BLACK if depth <= black_height else Color.RED
+        node = self.node_class(keys[mid], color)
+        node.parent = parent
+        node.left = self._build_balanced(keys, low, mid - 1, depth + 1, black_height, node)
+        node.right = self._build_balanced(keys, mid + 1, high, depth + 1, black_height, node)
+        return node
     
     def insert(self, key):
         """
@@ -19,7 +95,7 @@ class RedBlackTree:
         Args:
             key: Valor a insertar
         """
-        new_node = RBNode(key, Color.RED)
+        new_node = self.node_class(key, Color.RED)
         new_node.left = self.NIL
         new_node.right = self.NIL
         
@@ -43,9 +119,119 @@ class RedBlackTree:
             parent.left = new_node
         else:
             parent.right = new_node
+        self._size += 1
         
         # Reparar el árbol para mantener las propiedades Red-Black
         self._fix_insert(new_node)
+        self._finger = None
+    
+    def insert_finger(self, key):
+        """
+        Inserta un valor partiendo del último punto de inserción (modo finger)
+        
+        Se recuerdan el nodo mínimo, el máximo y el último nodo insertado con
+        este método. Los valores que caen fuera de los extremos se enlazan
+        directamente al mínimo o al máximo; el resto sube por los punteros al
+        padre desde la última inserción hasta el subárbol que los contiene y
+        desciende desde ahí. Con flujos casi ordenados el descenso desde la
+        raíz desaparece; solo queda la reparación Red-Black.
+        
+        Args:
+            key: Valor a insertar
+        """
+        if self.root == self.NIL:
+            self.insert(key)
+            self._finger = [self.root, self.root, self.root]
+            return
+        
+        parent, as_left = self._finger_slot(key)
+        self._link_finger(self.node_class(key, Color.RED), parent, as_left)
+    
+    def _finger_slot(self, key):
+        """
+        Busca el punto de inserción de un valor en modo finger
+        
+        Args:
+            key: Valor a insertar (el árbol no está vacío)
+            
+        Returns:
+            Tupla (padre, como_hijo_izquierdo) para enlazar el nuevo nodo
+        """
+        finger = self._finger
+        if finger is None:
+            finger = self._finger = [self._minimum(self.root), self._maximum(self.root), None]
+        leftmost, rightmost, last = finger
+        
+        if not key < rightmost.key:
+            return rightmost, False
+        if key < leftmost.key:
+            return leftmost, True
+        return self._finger_position(key, last)
+    
+    def _link_finger(self, new_node, parent, as_left):
+        """
+        Enlaza un nodo nuevo en el punto encontrado por _finger_slot
+        
+        Args:
+            new_node: Nodo rojo sin enlazar
+            parent: Padre del nuevo nodo
+            as_left: True si el nodo queda como hijo izquierdo
+        """
+        finger = self._finger
+        new_node.left = self.NIL
+        new_node.right = self.NIL
+        new_node.parent = parent
+        if as_left:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._size += 1
+        
+        # Las rotaciones no cambian qué nodos son el mínimo y el máximo
+        if parent is finger[1] and not as_left:
+            finger[1] = new_node
+        elif parent is finger[0] and as_left:
+            finger[0] = new_node
+        finger[2] = new_node
+        
+        self._fix_insert(new_node)
+    
+    def _finger_position(self, key, start):
+        """
+        Busca el punto de inserción subiendo desde un nodo cercano
+        
+        Args:
+            key: Valor a insertar
+            start: Nodo desde el cual buscar (None para partir de la raíz)
+            
+        Returns:
+            Tupla (padre, como_hijo_izquierdo) para enlazar el nuevo nodo
+        """
+        node = self.root if start is None else start
+        
+        # Subir hasta el primer ancestro cuyo subárbol acota a key
+        if not key < node.key:
+            while node.parent is not None:
+                parent = node.parent
+                if node == parent.left and key < parent.key:
+                    break
+                node = parent
+        else:
+            while node.parent is not None:
+                parent = node.parent
+                if node == parent.right and not key < parent.key:
+                    break
+                node = parent
+        
+        parent = node
+        current = node
+        while current != self.NIL:
+            parent = current
+            if key < current.key:
+                current = current.left
+            else:
+                current = current.right
+        return parent, key < parent.key
     
     def _fix_insert(self, node):
         """
@@ -146,6 +332,172 @@ class RedBlackTree:
         left_child.right = node
         node.parent = left_child
     
+    def delete(self, key):
+        """
+        Elimina un valor del árbol manteniendo las propiedades Red-Black
+        
+        Args:
+            key: Valor a eliminar
+            
+        Returns:
+            True si el valor existía y fue eliminado, False en caso contrario
+        """
+        node = self._find_node(key)
+        if node is None:
+            return False
+        self._finger = None
+        
+        removed = node
+        if node.left != self.NIL and node.right != self.NIL:
+            removed = self._minimum(node.right)
+        self._before_unlink(node, removed)
+        self._size -= 1
+        
+        removed_color = removed.color
+        
+        if node.left == self.NIL:
+            child = node.right
+            self._transplant(node, node.right)
+        elif node.right == self.NIL:
+            child = node.left
+            self._transplant(node, node.left)
+        else:
+            # Dos hijos: el sucesor ocupa el lugar del nodo
+            child = removed.right
+            
+            if removed.parent == node:
+                child.parent = removed
+            else:
+                self._transplant(removed, removed.right)
+                removed.right = node.right
+                removed.right.parent = removed
+            
+            self._transplant(node, removed)
+            removed.left = node.left
+            removed.left.parent = removed
+            removed.color = node.color
+        
+        if removed_color == Color.BLACK:
+            self._fix_delete(child)
+        return True
+    
+    def _before_unlink(self, node, removed):
+        """
+        Punto de extensión llamado antes de desenlazar un nodo en delete()
+        
+        Args:
+            node: Nodo con el valor eliminado
+            removed: Nodo que se desenlaza físicamente (node o su sucesor)
+        """
+    
+    def _transplant(self, old, new):
+        """
+        Reemplaza el subárbol con raíz old por el subárbol con raíz new
+        
+        Args:
+            old: Nodo a reemplazar
+            new: Nodo que toma su lugar (puede ser NIL)
+        """
+        if old.parent is None:
+            self.root = new
+        elif old == old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        # El centinela también recibe el padre para guiar _fix_delete
+        new.parent = old.parent
+    
+    def _fix_delete(self, node):
+        """
+        Repara el árbol después de una eliminación para mantener propiedades Red-Black
+        
+        Args:
+            node: Nodo que ocupa el lugar del nodo negro eliminado
+        """
+        while node != self.root and node.color == Color.BLACK:
+            if node == node.parent.left:
+                sibling = node.parent.right
+                
+                if sibling.color == Color.RED:
+                    # Caso 1: El hermano es rojo
+                    sibling.color = Color.BLACK
+                    node.parent.color = Color.RED
+                    self._left_rotate(node.parent)
+                    sibling = node.parent.right
+                
+                if sibling.left.color == Color.BLACK and sibling.right.color == Color.BLACK:
+                    # Caso 2: El hermano es negro con hijos negros
+                    sibling.color = Color.RED
+                    node = node.parent
+                else:
+                    if sibling.right.color == Color.BLACK:
+                        # Caso 3: El hijo derecho del hermano es negro
+                        sibling.left.color = Color.BLACK
+                        sibling.color = Color.RED
+                        self._right_rotate(sibling)
+                        sibling = node.parent.right
+                    
+                    # Caso 4: El hijo derecho del hermano es rojo
+                    sibling.color = node.parent.color
+                    node.parent.color = Color.BLACK
+                    sibling.right.color = Color.BLACK
+                    self._left_rotate(node.parent)
+                    node = self.root
+            else:
+                sibling = node.parent.left
+                
+                if sibling.color == Color.RED:
+                    # Caso 1: El hermano es rojo
+                    sibling.color = Color.BLACK
+                    node.parent.color = Color.RED
+                    self._right_rotate(node.parent)
+                    sibling = node.parent.left
+                
+                if sibling.right.color == Color.BLACK and sibling.left.color == Color.BLACK:
+                    # Caso 2: El hermano es negro con hijos negros
+                    sibling.color = Color.RED
+                    node = node.parent
+                else:
+                    if sibling.left.color == Color.BLACK:
+                        # Caso 3: El hijo izquierdo del hermano es negro
+                        sibling.right.color = Color.BLACK
+                        sibling.color = Color.RED
+                        self._left_rotate(sibling)
+                        sibling = node.parent.left
+                    
+                    # Caso 4: El hijo izquierdo del hermano es rojo
+                    sibling.color = node.parent.color
+                    node.parent.color = Color.BLACK
+                    sibling.left.color = Color.BLACK
+                    self._right_rotate(node.parent)
+                    node = self.root
+        
+        node.color = Color.BLACK
+    
+    def __len__(self):
+        """Cantidad de valores almacenados"""
+        return self._size
+    
+    def _find_node(self, key):
+        """
+        Busca el nodo que contiene un valor (iterativo)
+        
+        Args:
+            key: Valor a buscar
+            
+        Returns:
+            Nodo con el valor o None si no existe
+        """
+        current = self.root
+        while current != self.NIL:
+            if key == current.key:
+                return current
+            elif key < current.key:
+                current = current.left
+            else:
+                current = current.right
+        return None
+    
     def search(self, key):
         """
         Busca un valor en el árbol
@@ -179,77 +531,231 @@ class RedBlackTree:
         else:
             return self._search_recursive(node.right, key)
     
-    def inorder_traversal(self):
+    def search_many(self, keys):
         """
-        Realiza un recorrido inorden del árbol
+        Busca un lote de valores compartiendo el descenso entre ellos
         
+        El lote se ordena una vez y se reparte por el árbol: cada nodo
+        visitado divide con bisect el rango de consultas que le llega entre
+        su subárbol izquierdo y el derecho. Con m consultas sobre n nodos el
+        costo es O(m log(n/m)) en lugar de O(m log n).
+        
+        Args:
+            keys: Secuencia de valores a buscar
+            
         Returns:
-            Lista con los valores en orden
+            Lista de booleanos en el mismo orden que keys
         """
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        keys = list(keys)
+        found = [False] * len(keys)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        probes = [keys[i] for i in order]
+        
+        stack = [(self.root, 0, len(probes))] if self.root != self.NIL and probes else []
+        while stack:
+            node, low, high = stack.pop()
+            start = bisect_left(probes, node.key, low, high)
+            end = bisect_right(probes, node.key, start, high)
+            for i in range(start, end):
+                found[order[i]] = True
+            if low < start and node.left != self.NIL:
+                stack.append((node.left, low, start))
+            if end < high and node.right != self.NIL:
+                stack.append((node.right, end, high))
+        return found
     
-    def _inorder_recursive(self, node, result):
+    def _minimum(self, node):
         """
-        Recorrido inorden recursivo
+        Obtiene el nodo con la llave mínima de un subárbol
         
         Args:
-            node: Nodo actual
-            result: Lista para almacenar los resultados
+            node: Raíz del subárbol (distinta de NIL)
+            
+        Returns:
+            Nodo más a la izquierda
         """
-        if node != self.NIL:
-            self._inorder_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_recursive(node.right, result)
+        while node.left != self.NIL:
+            node = node.left
+        return node
     
-    def preorder_traversal(self):
+    def _maximum(self, node):
         """
-        Realiza un recorrido preorden del árbol
+        Obtiene el nodo con la llave máxima de un subárbol
         
+        Args:
+            node: Raíz del subárbol (distinta de NIL)
+            
         Returns:
-            Lista con los valores en preorden
+            Nodo más a la derecha
         """
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
+        while node.right != self.NIL:
+            node = node.right
+        return node
     
-    def _preorder_recursive(self, node, result):
+    def _successor(self, node):
         """
-        Recorrido preorden recursivo
+        Obtiene el sucesor inorden usando los punteros al padre
         
         Args:
             node: Nodo actual
-            result: Lista para almacenar los resultados
+            
+        Returns:
+            Nodo sucesor o None si node es el máximo
         """
-        if node != self.NIL:
-            result.append(node.key)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        if node.right != self.NIL:
+            return self._minimum(node.right)
+        parent = node.parent
+        while parent is not None and node == parent.right:
+            node = parent
+            parent = parent.parent
+        return parent
     
-    def postorder_traversal(self):
+    def _predecessor(self, node):
         """
-        Realiza un recorrido postorden del árbol
+        Obtiene el predecesor inorden usando los punteros al padre
+        
+        Args:
+            node: Nodo actual
+            
+        Returns:
+            Nodo predecesor o None si node es el mínimo
+        """
+        if node.left != self.NIL:
+            return self._maximum(node.left)
+        parent = node.parent
+        while parent is not None and node == parent.left:
+            node = parent
+            parent = parent.parent
+        return parent
+    
+    def freeze(self):
+        """
+        Crea una instantánea inmutable en disposición Eytzinger
         
         Returns:
-            Lista con los valores en postorden
+            FrozenTree con las llaves actuales del árbol
+        """
+        from model.frozen_tree import FrozenTree
+        return FrozenTree(self.iter_inorder())
+    
+    def __iter__(self):
+        """Itera las llaves en orden ascendente"""
+        return self.iter_inorder()
+    
+    def __reversed__(self):
         """
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
+        Itera las llaves en orden descendente (punteros al padre, memoria O(1))
+        
+        Yields:
+            Valores de mayor a menor
+        """
+        if self.root == self.NIL:
+            return
+        node = self._maximum(self.root)
+        while node is not None:
+            yield node.key
+            node = self._predecessor(node)
+    
+    def iter_inorder(self):
+        """
+        Recorrido inorden perezoso (punteros al padre, memoria O(1))
+        
+        Yields:
+            Valores en orden
+        """
+        if self.root == self.NIL:
+            return
+        node = self._minimum(self.root)
+        while node is not None:
+            yield node.key
+            node = self._successor(node)
+    
+    def iter_preorder(self):
+        """
+        Recorrido preorden perezoso (punteros al padre, memoria O(1))
+        
+        Yields:
+            Valores en preorden
+        """
+        if self.root == self.NIL:
+            return
+        node = self.root
+        while node is not None:
+            yield node.key
+            if node.left != self.NIL:
+                node = node.left
+            elif node.right != self.NIL:
+                node = node.right
+            else:
+                # Subir hasta un ancestro con subárbol derecho sin visitar
+                parent = node.parent
+                while parent is not None and (node == parent.right or parent.right == self.NIL):
+                    node = parent
+                    parent = parent.parent
+                node = parent.right if parent is not None else None
     
-    def _postorder_recursive(self, node, result):
+    def iter_postorder(self):
         """
-        Recorrido postorden recursivo
+        Recorrido postorden perezoso (punteros al padre, memoria O(1))
+        
+        Yields:
+            Valores en postorden
+        """
+        if self.root == self.NIL:
+            return
+        node = self._first_postorder(self.root)
+        while node is not None:
+            yield node.key
+            parent = node.parent
+            if parent is not None and node == parent.left and parent.right != self.NIL:
+                node = self._first_postorder(parent.right)
+            else:
+                node = parent
+    
+    def _first_postorder(self, node):
+        """
+        Obtiene el primer nodo en postorden de un subárbol
         
         Args:
-            node: Nodo actual
-            result: Lista para almacenar los resultados
+            node: Raíz del subárbol (distinta de NIL)
+            
+        Returns:
+            Hoja más profunda por la izquierda
         """
-        if node != self.NIL:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.key)
+        while True:
+            if node.left != self.NIL:
+                node = node.left
+            elif node.right != self.NIL:
+                node = node.right
+            else:
+                return node
+    
+    def inorder_traversal(self):
+        """
+        Realiza un recorrido inorden del árbol
+        
+        Returns:
+            Lista con los valores en orden
+        """
+        return list(self.iter_inorder())
+    
+    def preorder_traversal(self):
+        """
+        Realiza un recorrido preorden del árbol
+        
+        Returns:
+            Lista con los valores en preorden
+        """
+        return list(self.iter_preorder())
+    
+    def postorder_traversal(self):
+        """
+        Realiza un recorrido postorden del árbol
+        
+        Returns:
+            Lista con los valores en postorden
+        """
+        return list(self.iter_postorder())
     
     def height(self):
         """
@@ -277,3 +783,169 @@ class RedBlackTree:
         right_height = self._height_recursive(node.right)
         
         return 1 + max(left_height, right_height)
+
+
+class OrderStatisticRedBlackTree(RedBlackTree):
+    """
+    Árbol Red-Black aumentado con el tamaño de cada subárbol
+    
+    Cada nodo guarda cuántos nodos tiene su subárbol, lo que permite
+    select(), rank() y count_range() en O(log n). El costo es mantener ese
+    campo: un paso por ancestro en cada inserción y eliminación y dos
+    escrituras por rotación. El RedBlackTree base no paga ese costo.
+    """
+    
+    node_class = SizedRBNode
+    
+    def __init__(self):
+        """Inicializa un árbol Red-Black aumentado vacío"""
+        super().__init__()
+        self.NIL.size = 0
+    
+    def _build_balanced(self, keys, low, high, depth, black_height, parent):
+        """
+        Construye recursivamente un subárbol balanceado con sus tamaños
+        
+        Args:
+            keys: Lista ordenada de valores
+            low: Índice inicial del rango
+            high: Índice final del rango (inclusivo)
+            depth: Profundidad del nodo a crear (la raíz tiene profundidad 1)
+            black_height: Profundidad máxima con nodos negros
+            parent: Padre del nodo a crear
+            
+        Returns:
+            Raíz del subárbol o NIL si el rango está vacío
+        """
+        node = super()._build_balanced(keys, low, high, depth, black_height, parent)
+        if node != self.NIL:
+            node.size = high - low + 1
+        return node
+    
+    def _fix_insert(self, node):
+        """
+        Suma el nodo recién enlazado a sus ancestros y repara el árbol
+        
+        Todas las inserciones (insert, insert_finger y las de subclases)
+        pasan por aquí justo después de enlazar el nodo.
+        
+        Args:
+            node: Nodo recién insertado
+        """
+        ancestor = node.parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
+        super()._fix_insert(node)
+    
+    def _left_rotate(self, node):
+        """
+        Realiza una rotación a la izquierda y corrige los tamaños
+        
+        Args:
+            node: Nodo sobre el cual rotar
+        """
+        super()._left_rotate(node)
+        node.parent.size = node.size
+        node.size = node.left.size + node.right.size + 1
+    
+    def _right_rotate(self, node):
+        """
+        Realiza una rotación a la derecha y corrige los tamaños
+        
+        Args:
+            node: Nodo sobre el cual rotar
+        """
+        super()._right_rotate(node)
+        node.parent.size = node.size
+        node.size = node.left.size + node.right.size + 1
+    
+    def _before_unlink(self, node, removed):
+        """
+        Descuenta el nodo que se desenlaza de todos sus ancestros
+        
+        Args:
+            node: Nodo con el valor eliminado
+            removed: Nodo que se desenlaza físicamente (node o su sucesor)
+        """
+        ancestor = removed.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+        # El sucesor ocupará el lugar de node con su mismo subárbol
+        removed.size = node.size
+    
+    def select(self, k):
+        """
+        Obtiene el k-ésimo valor más pequeño en tiempo O(log n)
+        
+        Args:
+            k: Posición en orden ascendente, empezando en 0
+            
+        Returns:
+            Valor en la posición k
+            
+        Raises:
+            IndexError: Si k está fuera de rango
+        """
+        if not 0 <= k < self.root.size:
+            raise IndexError("Posición fuera de rango")
+        
+        current = self.root
+        while True:
+            left_size = current.left.size
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current.key
+            else:
+                k -= left_size + 1
+                current = current.right
+    
+    def rank(self, key):
+        """
+        Cuenta los valores estrictamente menores que key en tiempo O(log n)
+        
+        Args:
+            key: Valor de referencia (no necesita existir en el árbol)
+            
+        Returns:
+            Cantidad de valores menores que key
+        """
+        return self._count_less(key, False)
+    
+    def count_range(self, low, high):
+        """
+        Cuenta los valores dentro del rango [low, high] en tiempo O(log n)
+        
+        Args:
+            low: Límite inferior (inclusivo)
+            high: Límite superior (inclusivo)
+            
+        Returns:
+            Cantidad de valores en el rango
+        """
+        if high < low:
+            return 0
+        return self._count_less(high, True) - self._count_less(low, False)
+    
+    def _count_less(self, key, inclusive):
+        """
+        Cuenta los valores menores (o menores o iguales) que key
+        
+        Args:
+            key: Valor de referencia
+            inclusive: Si True también cuenta los valores iguales a key
+            
+        Returns:
+            Cantidad de valores que cumplen la condición
+        """
+        count = 0
+        current = self.root
+        while current != self.NIL:
+            if key < current.key or (not inclusive and key == current.key):
+                current = current.left
+            else:
+                count += current.left.size + 1
+                current = current.right
+        return count
@@ -0,0 +1,18 @@
+"""
+Nodo para Splay Tree
+"""
+
+
+class SplayNode:
+    """Nodo del splay tree (sin padre ni tamaño: el splay descendente no los necesita)"""
+
+    def __init__(self, key):
+        """
+        Inicializa un nodo del splay tree
+
+        Args:
+            key: Valor del nodo
+        """
+        self.key = key
+        self.left = None
+        self.right = None
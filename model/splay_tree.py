@@ -0,0 +1,314 @@
+"""
+Splay Tree autoajustable con splay descendente (top-down)
+"""
+from collections import deque
+from model.splay_node import SplayNode
+
+
+class SplayTree:
+    """
+    Splay Tree: cada acceso sube el nodo buscado a la raíz
+
+    Las llaves consultadas con frecuencia quedan cerca de la raíz, así con
+    accesos sesgados (Zipf) el costo amortizado se acerca a la entropía de
+    la distribución en lugar de O(log n). El splay es descendente e
+    iterativo (Sleator y Tarjan): un solo recorrido desde la raíz, sin
+    punteros al padre ni recursión. Se permiten llaves duplicadas.
+    """
+
+    # Clase usada para crear los nodos (las subclases pueden reemplazarla)
+    node_class = SplayNode
+
+    def __init__(self):
+        """Inicializa un splay tree vacío"""
+        self.root = None
+        self._size = 0
+        # Nodo auxiliar que acumula los árboles izquierdo y derecho del splay
+        self._header = self.node_class(None)
+
+    def _splay(self, node, key):
+        """
+        Reorganiza un subárbol para dejar en su raíz la llave buscada o la
+        última visitada antes de caer a un hijo vacío
+
+        Args:
+            node: Raíz del subárbol (distinta de None)
+            key: Valor buscado
+
+        Returns:
+            Nueva raíz del subárbol
+        """
+        header = self._header
+        header.left = header.right = None
+        left = right = header
+        while True:
+            if key < node.key:
+                child = node.left
+                if child is None:
+                    break
+                if key < child.key:
+                    # Zig-zig: rotar a la derecha antes de enlazar
+                    node.left = child.right
+                    child.right = node
+                    node = child
+                    if node.left is None:
+                        break
+                # Enlazar a la derecha
+                right.left = node
+                right = node
+                node = node.left
+            elif key > node.key:
+                child = node.right
+                if child is None:
+                    break
+                if key > child.key:
+                    # Zag-zag: rotar a la izquierda antes de enlazar
+                    node.right = child.left
+                    child.left = node
+                    node = child
+                    if node.right is None:
+                        break
+                # Enlazar a la izquierda
+                left.right = node
+                left = node
+                node = node.right
+            else:
+                break
+        # Reensamblar: los árboles acumulados pasan a ser hijos de la nueva raíz
+        left.right = node.left
+        right.left = node.right
+        node.left = header.right
+        node.right = header.left
+        return node
+
+    def _splay_max(self, node):
+        """
+        Sube la llave máxima de un subárbol a su raíz
+
+        Args:
+            node: Raíz del subárbol (distinta de None)
+
+        Returns:
+            Nueva raíz, sin hijo derecho
+        """
+        header = self._header
+        header.right = None
+        left = header
+        while node.right is not None:
+            child = node.right
+            node.right = child.left
+            child.left = node
+            node = child
+            if node.right is None:
+                break
+            left.right = node
+            left = node
+            node = node.right
+        left.right = node.left
+        node.left = header.right
+        return node
+
+    def insert(self, key):
+        """
+        Inserta un valor y lo deja en la raíz
+
+        Args:
+            key: Valor a insertar
+        """
+        new_node = self.node_class(key)
+        self._size += 1
+        if self.root is None:
+            self.root = new_node
+            return
+        root = self._splay(self.root, key)
+        # La raíz queda a un lado del nuevo nodo y sus hijos se reparten
+        if key < root.key:
+            new_node.left = root.left
+            new_node.right = root
+            root.left = None
+        else:
+            new_node.right = root.right
+            new_node.left = root
+            root.right = None
+        self.root = new_node
+
+    def search(self, key):
+        """
+        Busca un valor y sube el último nodo visitado a la raíz
+
+        Args:
+            key: Valor a buscar
+
+        Returns:
+            True si el valor existe, False en caso contrario
+        """
+        if self.root is None:
+            return False
+        self.root = self._splay(self.root, key)
+        return self.root.key == key
+
+    def delete(self, key):
+        """
+        Elimina una aparición de un valor
+
+        Se sube el valor a la raíz y sus dos subárboles se unen subiendo el
+        máximo del izquierdo, que queda sin hijo derecho.
+
+        Args:
+            key: Valor a eliminar
+
+        Returns:
+            True si el valor existía y fue eliminado, False en caso contrario
+        """
+        if self.root is None:
+            return False
+        root = self._splay(self.root, key)
+        if root.key != key:
+            self.root = root
+            return False
+        if root.left is None:
+            self.root = root.right
+        else:
+            joined = self._splay_max(root.left)
+            joined.right = root.right
+            self.root = joined
+        self._size -= 1
+        return True
+
+    def __len__(self):
+        """Cantidad de valores almacenados"""
+        return self._size
+
+    def freeze(self):
+        """
+        Crea una instantánea inmutable en disposición Eytzinger
+
+        Returns:
+            FrozenTree con las llaves actuales del árbol
+        """
+        from model.frozen_tree import FrozenTree
+        return FrozenTree(self.iter_inorder())
+
+    def __iter__(self):
+        """Itera las llaves en orden ascendente (sin reorganizar el árbol)"""
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        """
+        Itera las llaves en orden descendente (pila explícita, memoria O(h))
+
+        Yields:
+            Valores de mayor a menor
+        """
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.right
+            current = stack.pop()
+            yield current.key
+            current = current.left
+
+    def iter_inorder(self):
+        """
+        Recorrido inorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en orden
+        """
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.key
+            current = current.right
+
+    def iter_preorder(self):
+        """
+        Recorrido preorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en preorden
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        """
+        Recorrido postorden perezoso (pila explícita, memoria O(h))
+
+        Yields:
+            Valores en postorden
+        """
+        stack = []
+        last_visited = None
+        current = self.root
+        while stack or current is not None:
+            if current is not None:
+                stack.append(current)
+                current = current.left
+            else:
+                top = stack[-1]
+                if top.right is not None and last_visited is not top.right:
+                    current = top.right
+                else:
+                    yield top.key
+                    last_visited = stack.pop()
+
+    def inorder_traversal(self):
+        """
+        Realiza un recorrido inorden del árbol
+
+        Returns:
+            Lista con los valores en orden
+        """
+        return list(self.iter_inorder())
+
+    def preorder_traversal(self):
+        """
+        Realiza un recorrido preorden del árbol
+
+        Returns:
+            Lista con los valores en preorden
+        """
+        return list(self.iter_preorder())
+
+    def postorder_traversal(self):
+        """
+        Realiza un recorrido postorden del árbol
+
+        Returns:
+            Lista con los valores en postorden
+        """
+        return list(self.iter_postorder())
+
+    def height(self):
+        """
+        Calcula la altura del árbol (BFS iterativo: tras accesos ordenados
+        el árbol puede ser un camino de n nodos)
+
+        Returns:
+            Altura del árbol
+        """
+        if self.root is None:
+            return 0
+        queue = deque([(self.root, 1)])
+        max_height = 0
+        while queue:
+            node, level = queue.popleft()
+            max_height = max(max_height, level)
+            if node.left is not None:
+                queue.append((node.left, level + 1))
+            if node.right is not None:
+                queue.append((node.right, level + 1))
+        return max_height
@@ -0,0 +1,281 @@
+"""
+Mapa ordenado (TreeMap) construido sobre el árbol Red-Black
+"""
+from model.rb_node import RBMapNode, Color
+from model.red_black_tree import OrderStatisticRedBlackTree
+
+
+class TreeMap(OrderStatisticRedBlackTree):
+    """
+    Mapa ordenado llave → valor sobre un árbol Red-Black
+
+    El valor vive en el mismo nodo que la llave, por lo que un solo descenso
+    responde tanto si la llave existe como cuál es su valor. Las llaves son
+    únicas: asignar una llave existente reemplaza su valor. Hereda del árbol
+    aumentado, así que también responde select() y rank().
+    """
+
+    node_class = RBMapNode
+
+    def __getitem__(self, key):
+        """
+        Obtiene el valor asociado a una llave
+
+        Args:
+            key: Llave a buscar
+
+        Returns:
+            Valor asociado
+
+        Raises:
+            KeyError: Si la llave no existe
+        """
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        """
+        Asocia un valor a una llave (inserta o reemplaza en un solo descenso)
+
+        Args:
+            key: Llave
+            value: Valor a asociar
+        """
+        parent = None
+        current = self.root
+
+        while current != self.NIL:
+            if key == current.key:
+                current.value = value
+                return
+            parent = current
+            if key < current.key:
+                current = current.left
+            else:
+                current = current.right
+
+        new_node = self.node_class(key, Color.RED, value)
+        new_node.left = self.NIL
+        new_node.right = self.NIL
+        new_node.parent = parent
+
+        if parent is None:
+            self.root = new_node
+        elif key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._size += 1
+
+        self._fix_insert(new_node)
+        self._finger = None
+
+    def __delitem__(self, key):
+        """
+        Elimina una llave y su valor
+
+        Args:
+            key: Llave a eliminar
+
+        Raises:
+            KeyError: Si la llave no existe
+        """
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        """Indica si la llave existe en el mapa"""
+        return self._find_node(key) is not None
+
+    def insert(self, key, value=None):
+        """
+        Inserta una llave con su valor (equivale a map[key] = value)
+
+        Args:
+            key: Llave a insertar
+            value: Valor asociado (None por defecto)
+        """
+        self[key] = value
+
+    def insert_finger(self, key, value=None):
+        """
+        Inserta o reemplaza una llave partiendo del último punto de inserción
+
+        Las llaves iguales se enlazan justo después de la existente, así que
+        si la llave ya está es el vecino anterior del punto de inserción: se
+        reemplaza su valor en lugar de crear un nodo duplicado.
+
+        Args:
+            key: Llave
+            value: Valor a asociar (None por defecto)
+        """
+        if self.root == self.NIL:
+            self[key] = value
+            self._finger = [self.root, self.root, self.root]
+            return
+
+        parent, as_left = self._finger_slot(key)
+        existing = self._predecessor(parent) if as_left else parent
+        if existing is not None and existing.key == key:
+            existing.value = value
+            return
+        self._link_finger(self.node_class(key, Color.RED, value), parent, as_left)
+
+    def get(self, key, default=None):
+        """
+        Obtiene el valor de una llave sin lanzar excepción
+
+        Args:
+            key: Llave a buscar
+            default: Valor devuelto si la llave no existe
+
+        Returns:
+            Valor asociado o default
+        """
+        node = self._find_node(key)
+        if node is None:
+            return default
+        return node.value
+
+    def floor(self, key):
+        """
+        Obtiene la mayor llave menor o igual que key
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Llave encontrada o None si no existe
+        """
+        node = self._floor_node(key)
+        return node.key if node is not None else None
+
+    def ceiling(self, key):
+        """
+        Obtiene la menor llave mayor o igual que key
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Llave encontrada o None si no existe
+        """
+        node = self._ceiling_node(key)
+        return node.key if node is not None else None
+
+    def successor(self, key):
+        """
+        Obtiene la menor llave estrictamente mayor que key
+
+        Si la llave existe se usa el puntero al padre desde su nodo.
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Llave sucesora o None si no existe
+        """
+        node = self._find_node(key)
+        if node is not None:
+            node = self._successor(node)
+        else:
+            node = self._ceiling_node(key)
+        return node.key if node is not None else None
+
+    def predecessor(self, key):
+        """
+        Obtiene la mayor llave estrictamente menor que key
+
+        Si la llave existe se usa el puntero al padre desde su nodo.
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Llave predecesora o None si no existe
+        """
+        node = self._find_node(key)
+        if node is not None:
+            node = self._predecessor(node)
+        else:
+            node = self._floor_node(key)
+        return node.key if node is not None else None
+
+    def irange(self, low=None, high=None):
+        """
+        Itera los pares (llave, valor) dentro del rango [low, high]
+
+        Args:
+            low: Límite inferior inclusivo (None para no acotar)
+            high: Límite superior inclusivo (None para no acotar)
+
+        Yields:
+            Tuplas (llave, valor) en orden ascendente
+        """
+        if low is None:
+            node = self._minimum(self.root) if self.root != self.NIL else None
+        else:
+            node = self._ceiling_node(low)
+
+        while node is not None and (high is None or not high < node.key):
+            yield node.key, node.value
+            node = self._successor(node)
+
+    def keys(self):
+        """Itera las llaves en orden ascendente"""
+        return self.iter_inorder()
+
+    def values(self):
+        """Itera los valores en el orden de sus llaves"""
+        for _, value in self.irange():
+            yield value
+
+    def items(self):
+        """Itera los pares (llave, valor) en orden ascendente"""
+        return self.irange()
+
+    def _floor_node(self, key):
+        """
+        Busca el nodo con la mayor llave menor o igual que key
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Nodo encontrado o None
+        """
+        best = None
+        current = self.root
+        while current != self.NIL:
+            if key == current.key:
+                return current
+            elif key < current.key:
+                current = current.left
+            else:
+                best = current
+                current = current.right
+        return best
+
+    def _ceiling_node(self, key):
+        """
+        Busca el nodo con la menor llave mayor o igual que key
+
+        Args:
+            key: Llave de referencia
+
+        Returns:
+            Nodo encontrado o None
+        """
+        best = None
+        current = self.root
+        while current != self.NIL:
+            if key == current.key:
+                return current
+            elif key < current.key:
+                best = current
+                current = current.left
+            else:
+                current = current.right
+        return best
@@ -0,0 +1,156 @@
+"""
+Tests para Red-Black Tree basado en arreglos
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller import PerformanceController
+from controller.benchmark import Benchmark
+from model import ArrayRedBlackTree, RedBlackTree, Color
+
+
+def _black_height(tree, node):
+    """Verifica las propiedades Red-Black y devuelve la altura negra"""
+    if node == tree.NIL:
+        return 1
+    left = tree._left[node]
+    right = tree._right[node]
+    if tree._color[node] == Color.RED:
+        assert tree._color[left] == Color.BLACK, "Error: hijo rojo de nodo rojo"
+        assert tree._color[right] == Color.BLACK, "Error: hijo rojo de nodo rojo"
+    left_height = _black_height(tree, left)
+    right_height = _black_height(tree, right)
+    assert left_height == right_height, "Error: alturas negras distintas"
+    return left_height + (1 if tree._color[node] == Color.BLACK else 0)
+
+
+def test_array_rbt_insertion():
+    """Prueba la inserción en el Red-Black Tree de arreglos"""
+    print("Test: Inserción en Red-Black Tree de arreglos")
+    tree = ArrayRedBlackTree()
+    values = [7, 3, 18, 10, 22, 8, 11, 26]
+
+    for val in values:
+        tree.insert(val)
+
+    inorder = tree.inorder_traversal()
+    assert inorder == sorted(values), f"Error: {inorder} != {sorted(values)}"
+    assert len(tree) == len(values), "Error: cantidad de llaves"
+    assert tree._color[tree.root] == Color.BLACK, "Error: la raíz debe ser negra"
+    _black_height(tree, tree.root)
+    print("  ✓ Inserción correcta")
+
+
+def test_array_rbt_matches_object_tree():
+    """Prueba que ambos motores producen la misma forma de árbol"""
+    print("\nTest: Equivalencia con RedBlackTree")
+    values = list(range(500))
+    random.Random(42).shuffle(values)
+
+    array_tree = ArrayRedBlackTree()
+    object_tree = RedBlackTree()
+    for val in values:
+        array_tree.insert(val)
+        object_tree.insert(val)
+
+    assert array_tree.preorder_traversal() == object_tree.preorder_traversal(), "Error en preorden"
+    assert array_tree.postorder_traversal() == object_tree.postorder_traversal(), "Error en postorden"
+    assert list(reversed(array_tree)) == list(reversed(object_tree)), "Error en reversed"
+    assert array_tree.height() == object_tree.height(), "Error: alturas distintas"
+    _black_height(array_tree, array_tree.root)
+    print("  ✓ Misma forma que el árbol de objetos")
+
+
+def test_array_rbt_search():
+    """Prueba la búsqueda en el Red-Black Tree de arreglos"""
+    print("\nTest: Búsqueda en Red-Black Tree de arreglos")
+    tree = ArrayRedBlackTree()
+    for val in range(1, 101):
+        tree.insert(val)
+
+    for val in range(1, 101):
+        assert tree.search(val) == True, f"Error: {val} no encontrado"
+    assert tree.search(0) == False, "Error: 0 no debería existir"
+    assert tree.search(101) == False, "Error: 101 no debería existir"
+    print("  ✓ Búsqueda correcta")
+
+
+def test_array_rbt_object_keys():
+    """Prueba llaves no numéricas con almacenamiento en lista"""
+    print("\nTest: Llaves de texto")
+    tree = ArrayRedBlackTree(key_typecode=None)
+    for val in ['pera', 'manzana', 'uva', 'kiwi']:
+        tree.insert(val)
+
+    assert tree.inorder_traversal() == ['kiwi', 'manzana', 'pera', 'uva'], "Error en inorden"
+    assert tree.search('uva') == True, "Error: 'uva' no encontrado"
+
+    # Con el tipo automático el árbol pasa a una lista al ver la primera llave de texto
+    tree = ArrayRedBlackTree()
+    for val in ['pera', 'manzana', 'uva', 'kiwi']:
+        tree.insert(val)
+    assert tree.inorder_traversal() == ['kiwi', 'manzana', 'pera', 'uva'], "Error en inorden automático"
+    assert isinstance(tree._keys, list), "Error: debía pasar a una lista"
+
+    try:
+        ArrayRedBlackTree(key_typecode='q').insert('pera')
+        assert False, "Error: debería lanzar TypeError con un tipo explícito"
+    except TypeError:
+        pass
+    print("  ✓ Llaves de texto correctas")
+
+
+def test_array_rbt_string_workload():
+    """Prueba el motor registrado y la comparación de almacenamiento con texto"""
+    print("\nTest: Carga de trabajo de texto")
+    controller = PerformanceController(benchmark=Benchmark(warmup=0, repeats=1), seed=8,
+                                       engines=['rbt', 'rbt_array'])
+    data = controller.generate_data(300, 'strings')
+    tree = ArrayRedBlackTree()
+    for val in data:
+        tree.insert(val)
+    assert list(tree) == sorted(data), "Error en inorden con texto"
+
+    results = controller.compare_storage_engines([300], 'strings')
+    assert results['rbt']['height'] == results['rbt_array']['height'], "Error: alturas distintas"
+    assert results['rbt_array']['bytes_per_key'][0] > 0, "Error en bytes por llave"
+
+    controller.compare_performance([300], 'strings')
+    assert len(controller.times['rbt_array']['insert']) == 1, "Error: el motor no se midió"
+    print("  ✓ Motor de arreglos con llaves de texto")
+
+
+def test_array_rbt_empty():
+    """Prueba operaciones en árbol vacío"""
+    print("\nTest: Red-Black Tree de arreglos vacío")
+    tree = ArrayRedBlackTree()
+
+    assert tree.search(5) == False, "Error: búsqueda en árbol vacío"
+    assert tree.height() == 0, "Error: altura de árbol vacío"
+    assert tree.inorder_traversal() == [], "Error: recorrido de árbol vacío"
+    assert len(tree) == 0, "Error: tamaño de árbol vacío"
+    print("  ✓ Operaciones en árbol vacío correctas")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL RED-BLACK TREE DE ARREGLOS")
+    print("="*60)
+
+    test_array_rbt_insertion()
+    test_array_rbt_matches_object_tree()
+    test_array_rbt_search()
+    test_array_rbt_object_keys()
+    test_array_rbt_string_workload()
+    test_array_rbt_empty()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL RED-BLACK TREE DE ARREGLOS PASARON ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -5,7 +5,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from model import BinarySearchTree
+from model import BinarySearchTree, ScapegoatTree, OrderStatisticBinarySearchTree
 
 
 def test_bst_insertion():
@@ -96,6 +96,212 @@ def test_bst_height():
     print("  ✓ Cálculo de altura correcto")
 
 
+def test_bst_iterators():
+    """Prueba los recorridos perezosos del BST"""
+    print("\nTest: Iteradores del BST")
+    bst = BinarySearchTree()
+    values = [5, 3, 7, 1, 4, 6, 8]
+    
+    for val in values:
+        bst.insert(val)
+    
+    assert list(bst.iter_inorder()) == bst.inorder_traversal(), "Error en iter_inorder"
+    assert list(bst.iter_preorder()) == [5, 3, 1, 4, 7, 6, 8], "Error en iter_preorder"
+    assert list(bst.iter_postorder()) == [1, 4, 3, 6, 8, 7, 5], "Error en iter_postorder"
+    assert list(reversed(bst)) == [8, 7, 6, 5, 4, 3, 1], "Error en reversed"
+    assert list(bst) == sorted(values), "Error en __iter__"
+    
+    print("  ✓ Iteradores correctos")
+
+
+def test_bst_degenerate_traversal():
+    """Prueba recorridos sobre un árbol degenerado sin RecursionError"""
+    print("\nTest: Recorridos en BST degenerado")
+    bst = BinarySearchTree()
+    n = 5000
+    for val in range(1, n + 1):
+        bst.insert(val)
+    
+    assert bst.inorder_traversal() == list(range(1, n + 1)), "Error en inorden"
+    assert bst.preorder_traversal() == list(range(1, n + 1)), "Error en preorden"
+    assert bst.postorder_traversal() == list(range(n, 0, -1)), "Error en postorden"
+    
+    # Detención temprana: solo se consumen las primeras llaves
+    iterator = bst.iter_inorder()
+    assert [next(iterator) for _ in range(3)] == [1, 2, 3], "Error en detención temprana"
+    
+    print(f"  ✓ Recorridos correctos con altura {n}")
+
+
+def test_bst_from_sorted():
+    """Prueba la construcción masiva en tiempo lineal"""
+    print("\nTest: Construcción masiva del BST")
+    
+    import math
+    n = 1000
+    bst = BinarySearchTree.from_sorted(range(1, n + 1))
+    assert bst.inorder_traversal() == list(range(1, n + 1)), "Error en inorden"
+    assert bst.height() == math.ceil(math.log2(n + 1)), "Error: árbol no balanceado"
+    
+    bst = BinarySearchTree.from_iterable([5, 1, 4, 2, 3])
+    assert bst.preorder_traversal() == [3, 1, 2, 4, 5], "Error en preorden"
+    
+    try:
+        BinarySearchTree.from_sorted([2, 1])
+        assert False, "Error: se esperaba ValueError con datos desordenados"
+    except ValueError:
+        pass
+    
+    print(f"  ✓ Altura {bst.height()} con construcción masiva")
+
+
+def test_bst_delete():
+    """Prueba la eliminación en BST"""
+    print("\nTest: Eliminación en BST")
+    bst = BinarySearchTree()
+    for val in [5, 3, 7, 1, 4, 6, 8]:
+        bst.insert(val)
+    
+    assert bst.delete(1) == True, "Error: hoja no eliminada"
+    assert bst.delete(7) == True, "Error: nodo con dos hijos no eliminado"
+    assert bst.delete(5) == True, "Error: raíz no eliminada"
+    assert bst.delete(42) == False, "Error: 42 no debería existir"
+    
+    assert bst.inorder_traversal() == [3, 4, 6, 8], "Error en inorden tras eliminar"
+    assert bst.search(5) == False, "Error: 5 sigue en el árbol"
+    
+    for val in [3, 4, 6, 8]:
+        bst.delete(val)
+    assert bst.root is None, "Error: el árbol debería quedar vacío"
+    
+    print("  ✓ Eliminación correcta")
+
+
+def test_bst_order_statistics():
+    """Prueba select, rank y count_range en BST"""
+    print("\nTest: Estadísticas de orden en BST")
+    bst = OrderStatisticBinarySearchTree()
+    for val in [50, 30, 70, 20, 40, 60, 80, 35, 45]:
+        bst.insert(val)
+    bst.delete(30)
+    bst.delete(99)
+    
+    expected = [20, 35, 40, 45, 50, 60, 70, 80]
+    assert len(bst) == len(expected), "Error en __len__"
+    assert [bst.select(k) for k in range(len(bst))] == expected, "Error en select"
+    assert bst.rank(50) == 4, "Error en rank"
+    assert bst.rank(1) == 0 and bst.rank(100) == 8, "Error en rank fuera de rango"
+    assert bst.count_range(35, 60) == 5, "Error en count_range"
+    
+    # El ABB base no mantiene tamaños, pero sí su cantidad de valores
+    plain = BinarySearchTree()
+    for val in [50, 30, 70, 20, 40, 60, 80, 35, 45]:
+        plain.insert(val)
+    plain.delete(30)
+    plain.delete(99)
+    assert len(plain) == len(expected), "Error en __len__ del ABB base"
+    assert not hasattr(plain.root, 'size'), "Error: el ABB base no debe guardar tamaños"
+    
+    print("  ✓ Estadísticas de orden correctas")
+
+
+def test_bst_search_many():
+    """Prueba la búsqueda por lotes"""
+    print("\nTest: Búsqueda por lotes en BST")
+    
+    import random
+    rng = random.Random(5)
+    values = rng.sample(range(2000), 500)
+    tree = BinarySearchTree()
+    for val in values:
+        tree.insert(val)
+    
+    probes = [rng.randrange(-10, 2010) for _ in range(700)] + values[:50] + values[:50]
+    expected = [tree.search(val) for val in probes]
+    assert tree.search_many(probes) == expected, "Error en search_many"
+    assert BinarySearchTree().search_many([1, 2]) == [False, False], "Error en árbol vacío"
+    assert tree.search_many([]) == [], "Error con lote vacío"
+    
+    print("  ✓ Búsqueda por lotes correcta")
+
+
+def test_bst_scapegoat():
+    """Prueba que el modo chivo expiatorio acota la altura con datos ordenados"""
+    print("\nTest: Modo chivo expiatorio")
+    import math
+    for alpha in (0.55, 0.7, 0.9):
+        bst = OrderStatisticBinarySearchTree(alpha=alpha)
+        size = 5000
+        for val in range(size):
+            bst.insert(val)
+        limit = math.log(size) / math.log(1 / alpha) + 1
+        assert bst.height() <= limit, f"Error: altura {bst.height()} mayor que {limit:.1f} (alpha {alpha})"
+        assert bst.inorder_traversal() == list(range(size)), "Error en inorden"
+        assert [bst.select(k) for k in (0, 2500, 4999)] == [0, 2500, 4999], "Error en los tamaños"
+        # Sin tamaños en los nodos se eligen los mismos chivos expiatorios
+        plain = ScapegoatTree(alpha=alpha)
+        for val in range(size):
+            plain.insert(val)
+        assert plain.preorder_traversal() == bst.preorder_traversal(), "Error: forma distinta sin tamaños"
+    
+    import random
+    rng = random.Random(24)
+    bst = ScapegoatTree()
+    sized = OrderStatisticBinarySearchTree(alpha=0.7)
+    reference = []
+    for _ in range(5000):
+        key = rng.randrange(300)
+        if rng.random() < 0.55:
+            bst.insert(key)
+            sized.insert(key)
+            reference.append(key)
+        else:
+            assert bst.delete(key) == (key in reference), "Error en el resultado de delete"
+            assert sized.delete(key) == (key in reference), "Error en el resultado de delete"
+            if key in reference:
+                reference.remove(key)
+    assert bst.inorder_traversal() == sorted(reference), "Error tras eliminar"
+    assert len(bst) == len(reference), "Error en __len__"
+    reference.sort()
+    assert [sized.select(k) for k in range(len(reference))] == reference, "Error en los tamaños tras eliminar"
+    
+    try:
+        BinarySearchTree(alpha=0.5)
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    
+    print("  ✓ Altura acotada y reconstrucciones correctas")
+
+
+def test_bst_rebalance():
+    """Prueba el rebalanceo Day-Stout-Warren y la política automática"""
+    print("\nTest: Rebalanceo del BST")
+    for size in (0, 1, 2, 7, 8, 100, 1000):
+        bst = OrderStatisticBinarySearchTree()
+        for val in range(size):
+            bst.insert(val)
+        bst.rebalance()
+        assert bst.height() == size.bit_length(), f"Error: altura {bst.height()} con {size} nodos"
+        assert bst.inorder_traversal() == list(range(size)), "Error en inorden tras rebalancear"
+        assert [bst.select(k) for k in range(size)] == list(range(size)), "Error en los tamaños"
+    
+    import math
+    bst = BinarySearchTree(rebalance_factor=2.0)
+    for val in range(3000):
+        bst.insert(val)
+    assert bst.height() <= 2.0 * math.log2(3001), f"Error: altura {bst.height()} con política automática"
+    assert bst.inorder_traversal() == list(range(3000)), "Error en inorden con política automática"
+    
+    try:
+        BinarySearchTree(rebalance_factor=0.5)
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    
+    print("  ✓ Rebalanceo correcto")
+
+
 def test_bst_empty():
     """Prueba operaciones en árbol vacío"""
     print("\nTest: Árbol BST vacío")
@@ -118,6 +324,14 @@ def run_all_tests():
     test_bst_search()
     test_bst_traversals()
     test_bst_height()
+    test_bst_iterators()
+    test_bst_degenerate_traversal()
+    test_bst_from_sorted()
+    test_bst_delete()
+    test_bst_order_statistics()
+    test_bst_search_many()
+    test_bst_scapegoat()
+    test_bst_rebalance()
     test_bst_empty()
     
     print("\n" + "="*60)
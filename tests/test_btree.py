@@ -0,0 +1,129 @@
+"""
+Tests para B-Tree
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model import BTree
+
+
+def _check_btree_properties(tree):
+    """Verifica orden, ocupación de nodos y que todas las hojas estén al mismo nivel"""
+    leaf_depths = set()
+    stack = [(tree.root, 1, None, None)]
+    while stack:
+        node, depth, low, high = stack.pop()
+        assert node.keys == sorted(node.keys), "Error: llaves del nodo desordenadas"
+        assert len(node.keys) <= tree.order - 1, "Error: nodo con demasiadas llaves"
+        if node is not tree.root:
+            assert len(node.keys) >= (tree.order + 1) // 2 - 1, "Error: nodo con muy pocas llaves"
+        assert all((low is None or key >= low) and (high is None or key <= high) for key in node.keys), \
+            "Error: llave fuera del rango de su subárbol"
+        if node.children:
+            assert len(node.children) == len(node.keys) + 1, "Error: cantidad de hijos"
+            bounds = [low] + node.keys + [high]
+            for i, child in enumerate(node.children):
+                stack.append((child, depth + 1, bounds[i], bounds[i + 1]))
+        else:
+            leaf_depths.add(depth)
+    assert len(leaf_depths) <= 1, "Error: hojas a distinta profundidad"
+
+
+def test_btree_insertion_and_search():
+    """Prueba la inserción y la búsqueda con varios órdenes"""
+    print("Test: Inserción y búsqueda en B-Tree")
+    values = [50, 30, 70, 20, 40, 60, 80, 10, 25, 35, 45, 65, 75, 85, 5]
+    for order in (3, 4, 5, 64):
+        tree = BTree(order)
+        for val in values:
+            tree.insert(val)
+        _check_btree_properties(tree)
+        assert tree.inorder_traversal() == sorted(values), f"Error en inorden (orden {order})"
+        assert all(tree.search(val) for val in values), f"Error: valor no encontrado (orden {order})"
+        assert not tree.search(100) and not tree.search(1), "Error: encontró un valor inexistente"
+        assert len(tree) == len(values), "Error en la cantidad de valores"
+    print("  ✓ Inserción y búsqueda correctas")
+
+
+def test_btree_height():
+    """Prueba que la altura crece como log_order(n), incluso con datos ordenados"""
+    print("\nTest: Altura del B-Tree")
+    assert BTree().height() == 0, "Error: altura del árbol vacío"
+    tree = BTree(16)
+    for val in range(1, 10001):
+        tree.insert(val)
+    _check_btree_properties(tree)
+    # Con al menos 8 hijos por nodo interno, 10000 llaves caben en 5 niveles
+    assert tree.height() <= 5, f"Error: altura {tree.height()} demasiado grande"
+    print(f"  ✓ Altura con 10000 llaves ordenadas: {tree.height()}")
+
+
+def test_btree_traversals():
+    """Prueba los recorridos perezosos"""
+    print("\nTest: Recorridos del B-Tree")
+    tree = BTree(3)
+    for val in [2, 1, 3]:
+        tree.insert(val)
+    assert tree.preorder_traversal() == [2, 1, 3], "Error en preorden"
+    assert tree.postorder_traversal() == [1, 3, 2], "Error en postorden"
+    assert list(reversed(tree)) == [3, 2, 1], "Error en recorrido inverso"
+    assert list(tree) == [1, 2, 3], "Error en iteración"
+    print("  ✓ Recorridos correctos")
+
+
+def test_btree_delete():
+    """Prueba la eliminación con préstamos y fusiones contra una lista de referencia"""
+    print("\nTest: Eliminación en B-Tree")
+    for order in (3, 4, 7):
+        rng = random.Random(order)
+        tree = BTree(order)
+        reference = []
+        for _ in range(2000):
+            key = rng.randrange(200)
+            if rng.random() < 0.55:
+                tree.insert(key)
+                reference.append(key)
+            else:
+                assert tree.delete(key) == (key in reference), "Error en el resultado de delete"
+                if key in reference:
+                    reference.remove(key)
+        _check_btree_properties(tree)
+        assert list(tree) == sorted(reference), f"Error tras eliminar (orden {order})"
+        for key in list(reference):
+            assert tree.delete(key), "Error: no eliminó un valor existente"
+        assert len(tree) == 0 and tree.height() == 0 and list(tree) == [], "Error: el árbol debe quedar vacío"
+    print("  ✓ Eliminación correcta")
+
+
+def test_btree_invalid_order():
+    """Prueba que un orden menor que 3 se rechaza"""
+    print("\nTest: Orden inválido")
+    try:
+        BTree(2)
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Orden inválido rechazado")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL B-TREE")
+    print("="*60)
+
+    test_btree_insertion_and_search()
+    test_btree_height()
+    test_btree_traversals()
+    test_btree_delete()
+    test_btree_invalid_order()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL B-TREE PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,78 @@
+"""
+Tests para las comparaciones especializadas del controlador
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller import PerformanceController
+from controller.benchmark import Benchmark
+
+
+def _controller():
+    """Crea un controlador rápido con el ABB y el RBT"""
+    return PerformanceController(benchmark=Benchmark(warmup=0, repeats=1), seed=4,
+                                 engines=['bst', 'rbt'])
+
+
+def test_compare_order_statistics():
+    """Prueba select()/rank() con las variantes aumentadas"""
+    print("Test: Comparación de estadísticas de orden")
+    results = _controller().compare_order_statistics([100, 200], queries=20)
+
+    for name in ('bst', 'rbt'):
+        for phase in ('select', 'rank', 'select_baseline', 'rank_baseline'):
+            assert len(results[name][phase]) == 2, f"Error en {name} {phase}"
+            assert all(elapsed > 0 for elapsed in results[name][phase]), f"Error: tiempo vacío en {name} {phase}"
+    print("  ✓ Estadísticas de orden medidas")
+
+
+def test_compare_finger_insertion():
+    """Prueba la comparación de inserción finger contra la raíz"""
+    print("\nTest: Comparación de inserción finger")
+    results = _controller().compare_finger_insertion([200, 400], data_types=('ordered', 'k_sorted'))
+
+    for data_type in ('ordered', 'k_sorted'):
+        times = results[data_type]
+        for phase in ('root', 'finger'):
+            assert len(times[phase]) == 2, f"Error en {data_type} {phase}"
+            assert [stats['median'] for stats in times['stats'][phase]] == times[phase], \
+                "Error: la mediana no coincide con las estadísticas"
+    print("  ✓ Inserción finger medida con el motor de medición")
+
+
+def test_compare_isolation_bias():
+    """Prueba el cálculo del sesgo entre medir en proceso y aislado"""
+    print("\nTest: Sesgo de aislamiento")
+    controller = _controller()
+    results = controller.compare_isolation_bias([100], isolation='fork')
+
+    assert controller.seed == 4, "Error: la semilla debía restaurarse"
+    for name in ('bst', 'rbt', 'frozen'):
+        for phase, changes in results['bias'][name].items():
+            assert len(changes) == 1, f"Error en el sesgo de {name} {phase}"
+            alone = results['isolated'][name][phase][0]
+            shared = results['in_process'][name][phase][0]
+            assert abs(changes[0] - (shared - alone) / alone) < 1e-12, "Error en la diferencia relativa"
+    assert results['in_process']['bst']['height'] == results['isolated']['bst']['height'], \
+        "Error: ambas ejecuciones debían usar los mismos datos"
+    print("  ✓ Sesgo calculado")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DE LAS COMPARACIONES ESPECIALIZADAS")
+    print("="*60)
+
+    test_compare_order_statistics()
+    test_compare_finger_insertion()
+    test_compare_isolation_bias()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DE COMPARACIONES PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,108 @@
+"""
+Tests para el registro de motores y su uso en el controlador
+"""
+import sys
+import os
+import bisect
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller import PerformanceController
+from controller.benchmark import Benchmark
+from controller.engines import ENGINES, register_engine, engine_names, get_engine
+from model import BinarySearchTree, RedBlackTree
+from model.engine import OrderedSetEngine, supports
+
+
+class SortedListSet:
+    """Motor mínimo sin operaciones opcionales"""
+
+    def __init__(self):
+        self.keys = []
+
+    def insert(self, key):
+        bisect.insort(self.keys, key)
+
+    def search(self, key):
+        i = bisect.bisect_left(self.keys, key)
+        return i < len(self.keys) and self.keys[i] == key
+
+    def height(self):
+        return 1 if self.keys else 0
+
+    def __iter__(self):
+        return iter(self.keys)
+
+
+def test_builtin_engines():
+    """Prueba que el ABB y el RBT están registrados y cumplen el protocolo"""
+    print("Test: Motores incluidos")
+    assert engine_names()[:2] == ['bst', 'rbt'], "Error en el orden del registro"
+    for name in ('bst', 'rbt'):
+        engine = get_engine(name)
+        assert isinstance(engine['factory'](), OrderedSetEngine), f"Error: {name} no cumple el protocolo"
+        assert engine['instrumented'] is not None, f"Error: {name} sin clase instrumentada"
+    assert supports(BinarySearchTree, 'delete') and supports(RedBlackTree, 'from_iterable'), \
+        "Error en operaciones opcionales"
+    for name in engine_names():
+        tree = get_engine(name)['factory']()
+        for val in (5, 3, 8):
+            tree.insert(val)
+        assert tree.search(3) is True and tree.search(4) is False, f"Error: {name}.search no devuelve bool"
+    print("  ✓ Motores incluidos registrados")
+
+
+def test_register_rejects_incomplete():
+    """Prueba que una clase sin las operaciones obligatorias se rechaza"""
+    print("\nTest: Motor incompleto")
+    try:
+        register_engine('roto', dict)
+        assert False, "Error: debería lanzar TypeError"
+    except TypeError:
+        pass
+    assert 'roto' not in ENGINES, "Error: el motor incompleto quedó registrado"
+    try:
+        get_engine('inexistente')
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Motores inválidos rechazados")
+
+
+def test_controller_with_extra_engine():
+    """Prueba que el controlador mide un motor extra sin fases opcionales"""
+    print("\nTest: Controlador con un motor extra")
+    register_engine('sorted_list', SortedListSet, label='Lista ordenada')
+    try:
+        assert not isinstance(dict(), OrderedSetEngine), "Error: dict no es un motor"
+        controller = PerformanceController(benchmark=Benchmark(warmup=0, repeats=1), seed=1,
+                                           engines=['bst', 'sorted_list'])
+        results = controller.compare_performance([50, 100], 'random', count_operations=True)
+        assert list(results['engines']) == ['bst', 'sorted_list'], "Error en los motores del resultado"
+        assert 'rbt' not in results, "Error: se midió un motor no solicitado"
+        extra = results['sorted_list']
+        assert len(extra['insert']) == 2 and extra['height'] == [1, 1], "Error en fases obligatorias"
+        assert extra['bulk'] == [] and extra['delete'] == [], "Error: se midieron fases no soportadas"
+        assert 'counters' not in extra and 'counters' in results['bst'], "Error en contadores"
+        assert len(results['frozen']['search']) == 2, "Error en la instantánea congelada"
+    finally:
+        del ENGINES['sorted_list']
+    print("  ✓ Motor extra medido")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL REGISTRO DE MOTORES")
+    print("="*60)
+
+    test_builtin_engines()
+    test_register_rejects_incomplete()
+    test_controller_with_extra_engine()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL REGISTRO DE MOTORES PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
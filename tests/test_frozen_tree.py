@@ -0,0 +1,76 @@
+"""
+Tests para la instantánea inmutable en disposición Eytzinger
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from model import BinarySearchTree, RedBlackTree
+from model.frozen_tree import FrozenTree
+
+
+def test_frozen_layout():
+    """Prueba que la disposición Eytzinger respeta el orden BFS"""
+    print("Test: Disposición Eytzinger")
+    frozen = FrozenTree(range(1, 8))
+
+    assert list(frozen._layout[1:8]) == [4, 2, 6, 1, 3, 5, 7], "Error en disposición"
+    assert len(frozen) == 7 and frozen.height() == 3, "Error en tamaño o altura"
+    print("  ✓ Disposición correcta")
+
+
+def test_frozen_contains():
+    """Prueba búsquedas individuales y por lotes contra el árbol original"""
+    print("\nTest: Búsquedas en la instantánea")
+    rng = random.Random(9)
+
+    for size in (0, 1, 2, 5, 64, 100, 1000):
+        values = rng.sample(range(5 * size + 1), size)
+        rbt = RedBlackTree()
+        for val in values:
+            rbt.insert(val)
+        frozen = rbt.freeze()
+
+        probes = np.array([rng.randrange(-5, 5 * size + 6) for _ in range(300)] + values)
+        expected = np.array([rbt.search(int(val)) for val in probes])
+        assert (frozen.contains_many(probes) == expected).all(), f"Error en contains_many con n={size}"
+        for val in probes[:50]:
+            assert frozen.contains(val) == rbt.search(int(val)), f"Error en contains({val})"
+
+    print("  ✓ Búsquedas correctas")
+
+
+def test_frozen_from_bst():
+    """Prueba la instantánea de un BST degenerado"""
+    print("\nTest: Instantánea de BST degenerado")
+    bst = BinarySearchTree()
+    for val in range(1, 501):
+        bst.insert(val)
+    frozen = bst.freeze()
+
+    assert frozen.height() == 9, "Error: la instantánea debe estar balanceada"
+    assert frozen.contains_many([0, 1, 250, 500, 501]).tolist() == [False, True, True, True, False], \
+        "Error en contains_many"
+    print("  ✓ Instantánea balanceada de un árbol degenerado")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DE LA INSTANTÁNEA EYTZINGER")
+    print("="*60)
+
+    test_frozen_layout()
+    test_frozen_contains()
+    test_frozen_from_bst()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DE LA INSTANTÁNEA PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
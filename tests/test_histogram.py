@@ -0,0 +1,75 @@
+"""
+Tests para el histograma de latencias con cubetas logarítmicas
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller.histogram import LatencyHistogram
+
+
+def test_histogram_buckets():
+    """Prueba que cada valor cae en una cubeta que lo contiene con error acotado"""
+    print("Test: Cubetas del histograma")
+    histogram = LatencyHistogram(sub_bucket_bits=7)
+    for value in list(range(2000)) + [10 ** 6, 123456789, 10 ** 12]:
+        low, high = histogram._bounds(histogram._index(value))
+        assert low <= value <= high, f"Error: {value} fuera de [{low}, {high}]"
+        assert (high - low) <= max(value, 1) / 64, f"Error relativo excesivo para {value}"
+    print("  ✓ Cubetas correctas")
+
+
+def test_histogram_percentiles():
+    """Prueba percentiles contra el cálculo exacto"""
+    print("\nTest: Percentiles")
+    rng = random.Random(4)
+    samples = [int(rng.lognormvariate(7, 1.5)) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(value)
+
+    samples.sort()
+    for q in (50, 90, 99, 99.9):
+        exact = samples[-(-int(q * 100) * len(samples) // 10000) - 1]
+        approx = histogram.value_at_percentile(q)
+        assert abs(approx - exact) <= exact / 60 + 1, f"Error en p{q}: {approx} vs {exact}"
+    assert histogram.total == 20000 and histogram.max == samples[-1], "Error en total o máximo"
+    assert histogram.value_at_percentile(100) == samples[-1], "Error en p100"
+    assert histogram.cdf()[-1][1] == 1.0, "Error: la CDF debe terminar en 1"
+    print("  ✓ Percentiles dentro del error esperado")
+
+
+def test_histogram_merge_and_serialize():
+    """Prueba la combinación y la serialización"""
+    print("\nTest: Combinación y serialización")
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in range(1000):
+        (first if value % 2 else second).record(value * 37)
+    first.merge(second)
+    assert first.total == 1000 and first.min == 0 and first.max == 999 * 37, "Error en merge"
+
+    copy = LatencyHistogram.from_dict(first.to_dict())
+    assert copy.percentiles() == first.percentiles() and copy.mean() == first.mean(), \
+        "Error en to_dict/from_dict"
+    assert LatencyHistogram().value_at_percentile(50) is None, "Error: vacío debe dar None"
+    print("  ✓ Combinación y serialización correctas")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL HISTOGRAMA DE LATENCIAS")
+    print("="*60)
+
+    test_histogram_buckets()
+    test_histogram_percentiles()
+    test_histogram_merge_and_serialize()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL HISTOGRAMA PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,107 @@
+"""
+Tests para los árboles instrumentados con contadores de operaciones
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model import (BinarySearchTree, RedBlackTree,
+                   InstrumentedBinarySearchTree, InstrumentedRedBlackTree)
+
+
+def test_instrumented_bst_counts():
+    """Prueba los contadores del ABB con el peor caso conocido"""
+    print("Test: Contadores del ABB")
+    n = 100
+    bst = InstrumentedBinarySearchTree()
+    for val in range(1, n + 1):
+        bst.insert(val)
+    bst.search(n)
+
+    # La i-ésima inserción ordenada compara contra los i-1 nodos previos
+    assert bst.counters['insert_comparisons'] == n * (n - 1) // 2, "Error en comparaciones de inserción"
+    assert bst.counters['search_visits'] == n, "Error en nodos visitados"
+    assert bst.counters['searches'] == 1, "Error en cantidad de búsquedas"
+    print(f"  ✓ {bst.counters['insert_comparisons']} comparaciones en inserción ordenada")
+
+
+def test_instrumented_rbt_matches_base():
+    """Prueba que el árbol instrumentado produce la misma forma que la base"""
+    print("\nTest: Árbol Red-Black instrumentado")
+    values = list(range(300))
+    random.Random(1).shuffle(values)
+
+    base = RedBlackTree()
+    instrumented = InstrumentedRedBlackTree()
+    for val in values:
+        base.insert(val)
+        instrumented.insert(val)
+
+    assert instrumented.preorder_traversal() == base.preorder_traversal(), "Error: formas distintas"
+    counters = instrumented.counters
+    rotations = counters['left_rotations'] + counters['right_rotations']
+    assert rotations == counters['fixup_case2'] + counters['fixup_case3'], "Error: rotaciones y casos no cuadran"
+    assert counters['fixup_case1'] > 0, "Error: se esperaban recoloreos"
+
+    for val in values:
+        instrumented.search(val)
+    assert counters['search_visits'] <= 300 * instrumented.height(), "Error en nodos visitados"
+    print(f"  ✓ {rotations} rotaciones, {counters['fixup_case1']} recoloreos")
+
+
+def test_instrumented_comparisons_match():
+    """Prueba que ambos árboles cuentan igual las comparaciones de un mismo camino"""
+    print("\nTest: Comparaciones equivalentes")
+    # Sin rotaciones ambos árboles quedan con la misma forma
+    values = [4, 2, 6, 1, 3, 5, 7]
+    bst = InstrumentedBinarySearchTree()
+    rbt = InstrumentedRedBlackTree()
+    for val in values:
+        bst.insert(val)
+        rbt.insert(val)
+
+    assert rbt.preorder_traversal() == bst.preorder_traversal(), "Error: se esperaba la misma forma"
+    assert rbt.counters['left_rotations'] + rbt.counters['right_rotations'] == 0, "Error: no debía rotar"
+    assert bst.counters['insert_comparisons'] == rbt.counters['insert_comparisons'] == 10, \
+        "Error: comparaciones de inserción distintas"
+    assert rbt.counters['fixup_case1'] == 1, "Error en recoloreos"
+    for val in values + [0, 8]:
+        assert bst.search(val) == rbt.search(val), "Error: búsquedas distintas"
+    for name in ('search_comparisons', 'search_visits', 'searches'):
+        assert bst.counters[name] == rbt.counters[name], f"Error: {name} distinto"
+    print(f"  ✓ {bst.counters['insert_comparisons']} comparaciones de inserción en ambos árboles")
+
+
+def test_instrumented_reset():
+    """Prueba el reinicio de contadores"""
+    print("\nTest: Reinicio de contadores")
+    tree = InstrumentedRedBlackTree()
+    for val in range(10):
+        tree.insert(val)
+    tree.reset_counters()
+
+    assert all(value == 0 for value in tree.counters.values()), "Error al reiniciar contadores"
+    assert isinstance(tree, RedBlackTree) and issubclass(InstrumentedBinarySearchTree, BinarySearchTree), \
+        "Error: las variantes deben heredar de la base"
+    print("  ✓ Contadores reiniciados")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DE LOS ÁRBOLES INSTRUMENTADOS")
+    print("="*60)
+
+    test_instrumented_bst_counts()
+    test_instrumented_rbt_matches_base()
+    test_instrumented_comparisons_match()
+    test_instrumented_reset()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DE INSTRUMENTACIÓN PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -5,7 +5,30 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from model import RedBlackTree, Color
+from model import RedBlackTree, OrderStatisticRedBlackTree, Color
+
+
+def _check_rb_properties(rbt):
+    """Verifica las propiedades Red-Black y devuelve la altura negra"""
+    sized = isinstance(rbt, OrderStatisticRedBlackTree)
+    assert rbt.root == rbt.NIL or rbt.root.color == Color.BLACK, "Error: la raíz debe ser negra"
+    
+    def black_height(node):
+        if node == rbt.NIL:
+            return 1
+        if node.color == Color.RED:
+            assert node.left.color == Color.BLACK, "Error: hijo rojo de nodo rojo"
+            assert node.right.color == Color.BLACK, "Error: hijo rojo de nodo rojo"
+        for child in (node.left, node.right):
+            if child != rbt.NIL:
+                assert child.parent == node, "Error: puntero al padre inválido"
+        if sized:
+            assert node.size == node.left.size + node.right.size + 1, "Error: tamaño de subárbol"
+        left_height = black_height(node.left)
+        assert left_height == black_height(node.right), "Error: alturas negras distintas"
+        return left_height + (1 if node.color == Color.BLACK else 0)
+    
+    return black_height(rbt.root)
 
 
 def test_rbt_insertion():
@@ -156,6 +179,204 @@ def test_rbt_balance():
     print("  ✓ El árbol mantiene el balance correcto")
 
 
+def test_rbt_iterators():
+    """Prueba los recorridos perezosos del Red-Black Tree"""
+    print("\nTest: Iteradores del Red-Black Tree")
+    rbt = RedBlackTree()
+    values = [7, 3, 18, 10, 22, 8, 11, 26]
+    
+    for val in values:
+        rbt.insert(val)
+    
+    assert list(rbt.iter_inorder()) == sorted(values), "Error en iter_inorder"
+    assert list(reversed(rbt)) == sorted(values, reverse=True), "Error en reversed"
+    assert list(rbt) == sorted(values), "Error en __iter__"
+    
+    # Comparar contra recorridos recursivos de referencia
+    def preorder(node):
+        if node == rbt.NIL:
+            return []
+        return [node.key] + preorder(node.left) + preorder(node.right)
+    
+    def postorder(node):
+        if node == rbt.NIL:
+            return []
+        return postorder(node.left) + postorder(node.right) + [node.key]
+    
+    assert list(rbt.iter_preorder()) == preorder(rbt.root), "Error en iter_preorder"
+    assert list(rbt.iter_postorder()) == postorder(rbt.root), "Error en iter_postorder"
+    
+    # Detención temprana
+    iterator = rbt.iter_inorder()
+    assert next(iterator) == 3, "Error en detención temprana"
+    
+    print("  ✓ Iteradores correctos")
+
+
+def test_rbt_from_sorted():
+    """Prueba la construcción masiva en tiempo lineal"""
+    print("\nTest: Construcción masiva del Red-Black Tree")
+    
+    import math
+    for n in range(0, 130):
+        rbt = RedBlackTree.from_sorted(range(n))
+        _check_rb_properties(rbt)
+        assert rbt.inorder_traversal() == list(range(n)), f"Error en inorden con n={n}"
+        assert rbt.height() == math.ceil(math.log2(n + 1)), f"Error de altura con n={n}"
+    
+    # El árbol construido admite inserciones posteriores
+    rbt = RedBlackTree.from_iterable([9, 1, 5, 3, 7])
+    for val in [2, 4, 6, 8, 10]:
+        rbt.insert(val)
+    _check_rb_properties(rbt)
+    assert rbt.inorder_traversal() == list(range(1, 11)), "Error tras insertar"
+    
+    try:
+        RedBlackTree.from_sorted([3, 1, 2])
+        assert False, "Error: se esperaba ValueError con datos desordenados"
+    except ValueError:
+        pass
+    
+    print("  ✓ Construcción masiva correcta")
+
+
+def test_rbt_delete():
+    """Prueba la eliminación con reparación Red-Black"""
+    print("\nTest: Eliminación en Red-Black Tree")
+    
+    import random
+    rng = random.Random(7)
+    rbt = RedBlackTree()
+    values = list(range(300))
+    rng.shuffle(values)
+    for val in values:
+        rbt.insert(val)
+    
+    remaining = sorted(values)
+    rng.shuffle(values)
+    for val in values[:250]:
+        assert rbt.delete(val) == True, f"Error: {val} no eliminado"
+        remaining.remove(val)
+        _check_rb_properties(rbt)
+        assert rbt.search(val) == False, f"Error: {val} sigue en el árbol"
+    
+    assert rbt.inorder_traversal() == remaining, "Error en inorden tras eliminar"
+    assert rbt.delete(1000) == False, "Error: 1000 no debería existir"
+    
+    for val in values[250:]:
+        rbt.delete(val)
+    assert rbt.root == rbt.NIL, "Error: el árbol debería quedar vacío"
+    assert rbt.height() == 0, "Error: altura de árbol vacío"
+    
+    print("  ✓ Propiedades Red-Black preservadas en cada eliminación")
+
+
+def test_rbt_order_statistics():
+    """Prueba select, rank y count_range"""
+    print("\nTest: Estadísticas de orden en Red-Black Tree")
+    
+    import random
+    rng = random.Random(11)
+    values = rng.sample(range(10000), 400)
+    rbt = OrderStatisticRedBlackTree()
+    for val in values:
+        rbt.insert(val)
+    for val in values[:150]:
+        rbt.delete(val)
+    _check_rb_properties(rbt)
+    
+    remaining = sorted(values[150:])
+    assert len(rbt) == len(remaining), "Error en __len__"
+    for k in range(len(remaining)):
+        assert rbt.select(k) == remaining[k], f"Error en select({k})"
+    
+    import bisect
+    for key in [-1, 0, remaining[10], remaining[10] + 1, 5000, 10001]:
+        assert rbt.rank(key) == bisect.bisect_left(remaining, key), f"Error en rank({key})"
+    
+    low, high = remaining[20], remaining[120]
+    expected = bisect.bisect_right(remaining, high) - bisect.bisect_left(remaining, low)
+    assert rbt.count_range(low, high) == expected, "Error en count_range"
+    assert rbt.count_range(high, low) == 0, "Error en rango vacío"
+    
+    bulk = OrderStatisticRedBlackTree.from_sorted(range(100))
+    _check_rb_properties(bulk)
+    assert bulk.select(42) == 42 and bulk.count_range(10, 19) == 10, "Error tras carga masiva"
+    
+    # El árbol base no mantiene tamaños, pero sí su cantidad de valores
+    plain = RedBlackTree.from_sorted(range(100))
+    plain.insert(100)
+    plain.delete(0)
+    assert len(plain) == 100, "Error en __len__ del árbol base"
+    assert not hasattr(plain.root, 'size'), "Error: el árbol base no debe guardar tamaños"
+    assert not hasattr(plain, 'select'), "Error: select solo existe en la variante aumentada"
+    
+    try:
+        rbt.select(len(remaining))
+        assert False, "Error: se esperaba IndexError"
+    except IndexError:
+        pass
+    
+    print("  ✓ Estadísticas de orden correctas")
+
+
+def test_rbt_finger_insertion():
+    """Prueba la inserción en modo finger"""
+    print("\nTest: Inserción finger en Red-Black Tree")
+    
+    import random
+    rng = random.Random(3)
+    k_sorted = list(range(300))
+    for i in range(0, 300, 8):
+        window = k_sorted[i:i + 8]
+        rng.shuffle(window)
+        k_sorted[i:i + 8] = window
+    shuffled = list(range(300))
+    rng.shuffle(shuffled)
+    
+    for data in (list(range(300)), list(range(300, 0, -1)), k_sorted, shuffled):
+        rbt = RedBlackTree()
+        for val in data:
+            rbt.insert_finger(val)
+        _check_rb_properties(rbt)
+        assert rbt.inorder_traversal() == sorted(data), "Error en inorden"
+    
+    # Mezclar con inserciones normales, duplicados y eliminaciones
+    expected = sorted(list(range(0, 100, 2)) + [51, 53, 5, 5, -1, 77, 33, 300])
+    for tree_class in (RedBlackTree, OrderStatisticRedBlackTree):
+        rbt = tree_class.from_sorted(range(0, 100, 2))
+        for val in [51, 53, 5, 5, 200, -1, 77]:
+            rbt.insert_finger(val)
+        rbt.delete(200)
+        rbt.insert(33)
+        rbt.insert_finger(300)
+        _check_rb_properties(rbt)
+        assert rbt.inorder_traversal() == expected, "Error tras operaciones mixtas"
+        assert len(rbt) == len(expected), "Error en __len__ tras operaciones mixtas"
+    
+    print("  ✓ Inserción finger correcta")
+
+
+def test_rbt_search_many():
+    """Prueba la búsqueda por lotes"""
+    print("\nTest: Búsqueda por lotes en Red-Black Tree")
+    
+    import random
+    rng = random.Random(5)
+    values = rng.sample(range(2000), 500)
+    tree = RedBlackTree()
+    for val in values:
+        tree.insert(val)
+    
+    probes = [rng.randrange(-10, 2010) for _ in range(700)] + values[:50] + values[:50]
+    expected = [tree.search(val) for val in probes]
+    assert tree.search_many(probes) == expected, "Error en search_many"
+    assert RedBlackTree().search_many([1, 2]) == [False, False], "Error en árbol vacío"
+    assert tree.search_many([]) == [], "Error con lote vacío"
+    
+    print("  ✓ Búsqueda por lotes correcta")
+
+
 def test_rbt_empty():
     """Prueba operaciones en árbol vacío"""
     print("\nTest: Árbol Red-Black vacío")
@@ -164,6 +385,7 @@ def test_rbt_empty():
     assert rbt.search(5) == False, "Error: búsqueda en árbol vacío"
     assert rbt.height() == 0, "Error: altura de árbol vacío"
     assert rbt.inorder_traversal() == [], "Error: recorrido de árbol vacío"
+    assert len(rbt) == 0, "Error: tamaño de árbol vacío"
     
     print("  ✓ Operaciones en árbol vacío correctas")
 
@@ -180,6 +402,12 @@ def run_all_tests():
     test_rbt_height()
     test_rbt_ordered_insertion()
     test_rbt_balance()
+    test_rbt_iterators()
+    test_rbt_from_sorted()
+    test_rbt_delete()
+    test_rbt_order_statistics()
+    test_rbt_finger_insertion()
+    test_rbt_search_many()
     test_rbt_empty()
     
     print("\n" + "="*60)
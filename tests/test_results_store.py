@@ -0,0 +1,113 @@
+"""
+Tests para el almacén de resultados y la comparación entre ejecuciones
+"""
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller.benchmark import summarize
+from controller.results_store import ResultsStore, compare_runs, welch_t_test
+
+
+def _fake_results(insert_samples, data_type='random'):
+    """Crea resultados mínimos con la forma de compare_performance"""
+    stats = summarize(insert_samples)
+    return {
+        'data_sizes': [100],
+        'data_type': data_type,
+        'seed': 1,
+        'dataset_hash': ['abc'],
+        'rbt': {'insert': [stats['median']], 'stats': {'insert': [stats]}}
+    }
+
+
+def test_store_roundtrip():
+    """Prueba guardar y seleccionar ejecuciones por sesión"""
+    print("Test: Guardar y leer ejecuciones")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'runs.jsonl')
+        first = ResultsStore(path)
+        run_id = first.save(_fake_results([1.0, 1.1, 0.9]))
+        second = ResultsStore(path)
+        second.save(_fake_results([1.0, 1.0, 1.0]))
+
+        assert len(first.load()) == 2, "Error: deben existir dos ejecuciones"
+        assert first.select('previous')[0]['run_id'] == run_id, "Error en 'previous'"
+        assert first.select('latest')[0]['session'] == second.session, "Error en 'latest'"
+        record = first.select(run_id)[0]
+        assert record['seed'] == 1 and record['dataset_hash'] == ['abc'], "Error en metadatos"
+        assert record['metadata']['python']['version'], "Error: falta la versión de Python"
+        try:
+            first.select('inexistente')
+            assert False, "Error: debería lanzar ValueError"
+        except ValueError:
+            pass
+    print("  ✓ Ejecuciones guardadas y seleccionadas")
+
+
+def test_welch_and_regressions():
+    """Prueba la detección de regresiones significativas"""
+    print("\nTest: Detección de regresiones")
+    base = [1.00, 1.01, 0.99, 1.02, 0.98]
+    slower = [1.30, 1.31, 1.29, 1.32, 1.28]
+    noisy = [0.80, 1.40, 1.00, 0.70, 1.30]
+
+    assert welch_t_test(base, slower)[2], "Error: la diferencia debe ser significativa"
+    assert not welch_t_test(base, noisy)[2], "Error: el ruido no debe ser significativo"
+
+    def record(samples):
+        return {'results': _fake_results(samples)}
+
+    rows = compare_runs([record(base)], [record(slower)], threshold=0.10)
+    assert [row['status'] for row in rows] == ['regression'], "Error: debe marcar regresión"
+    rows = compare_runs([record(slower)], [record(base)], threshold=0.10)
+    assert rows[0]['status'] == 'improvement', "Error: debe marcar mejora"
+    rows = compare_runs([record(base)], [record(slower)], threshold=0.50)
+    assert rows[0]['status'] == 'unchanged', "Error: bajo el umbral no es regresión"
+    print("  ✓ Regresiones detectadas correctamente")
+
+
+def test_compare_matches_runs():
+    """Prueba que cada ejecución se compara con la de igual tipo, aciertos y aislamiento"""
+    print("\nTest: Emparejamiento de ejecuciones")
+    base = [1.00, 1.01, 0.99, 1.02, 0.98]
+    slower = [1.30, 1.31, 1.29, 1.32, 1.28]
+
+    def record(samples, isolation=None, hit_ratio=1.0):
+        results = _fake_results(samples)
+        results.update({'isolation': isolation, 'hit_ratio': hit_ratio, 'engines': {'rbt': {}}})
+        return {'results': results}
+
+    # El aislado empeora; el que corre en proceso no cambia
+    rows = compare_runs([record(base), record(slower, 'fork')],
+                        [record(base), record(slower, 'fork')], threshold=0.10)
+    assert len(rows) == 2, "Error: cada ejecución debe compararse una sola vez"
+    assert all(row['status'] == 'unchanged' for row in rows), "Error: se compararon ejecuciones distintas"
+    rows = compare_runs([record(base, hit_ratio=0.5)], [record(slower)], threshold=0.10)
+    assert rows == [], "Error: no deben compararse proporciones de aciertos distintas"
+    try:
+        compare_runs([record(base), record(slower)], [record(base)])
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Ejecuciones emparejadas correctamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL ALMACÉN DE RESULTADOS")
+    print("="*60)
+
+    test_store_roundtrip()
+    test_welch_and_regressions()
+    test_compare_matches_runs()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL ALMACÉN PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,112 @@
+"""
+Tests para Splay Tree
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model import SplayTree
+
+
+def test_splay_insertion_and_search():
+    """Prueba la inserción y la búsqueda"""
+    print("Test: Inserción y búsqueda en Splay Tree")
+    tree = SplayTree()
+    values = [50, 30, 70, 20, 40, 60, 80, 10, 25, 35, 45, 65, 75, 85, 5]
+    for val in values:
+        tree.insert(val)
+    assert tree.inorder_traversal() == sorted(values), "Error en inorden"
+    assert all(tree.search(val) for val in values), "Error: valor no encontrado"
+    assert not tree.search(100) and not tree.search(1), "Error: encontró un valor inexistente"
+    assert len(tree) == len(values), "Error en la cantidad de valores"
+    assert tree.inorder_traversal() == sorted(values), "Error: la búsqueda alteró el orden"
+    print("  ✓ Inserción y búsqueda correctas")
+
+
+def test_splay_moves_key_to_root():
+    """Prueba que la llave accedida queda en la raíz"""
+    print("\nTest: Splay a la raíz")
+    tree = SplayTree()
+    for val in range(1, 101):
+        tree.insert(val)
+    for val in (1, 50, 37, 100, 2):
+        assert tree.search(val), "Error: valor no encontrado"
+        assert tree.root.key == val, f"Error: {val} no quedó en la raíz"
+    print("  ✓ La llave accedida queda en la raíz")
+
+
+def test_splay_ordered_data():
+    """Prueba que datos ordenados no causan recursión profunda"""
+    print("\nTest: Datos ordenados grandes")
+    tree = SplayTree()
+    size = 100000
+    for val in range(size):
+        tree.insert(val)
+    # Las inserciones ordenadas dejan un camino de n nodos
+    assert tree.height() == size, f"Error: altura {tree.height()}"
+    assert tree.search(0), "Error: no encontró el mínimo"
+    # Un acceso al fondo del camino reduce la altura aproximadamente a la mitad
+    assert tree.height() <= size // 2 + 2, f"Error: altura tras el splay {tree.height()}"
+    assert list(tree) == list(range(size)), "Error en el recorrido"
+    print(f"  ✓ {size} llaves ordenadas, altura tras un acceso: {tree.height()}")
+
+
+def test_splay_traversals():
+    """Prueba los recorridos perezosos"""
+    print("\nTest: Recorridos del Splay Tree")
+    tree = SplayTree()
+    for val in [1, 3, 2]:
+        tree.insert(val)
+    # Cada inserción deja el nuevo valor en la raíz
+    assert tree.preorder_traversal() == [2, 1, 3], "Error en preorden"
+    assert tree.postorder_traversal() == [1, 3, 2], "Error en postorden"
+    assert list(reversed(tree)) == [3, 2, 1], "Error en recorrido inverso"
+    print("  ✓ Recorridos correctos")
+
+
+def test_splay_delete():
+    """Prueba la eliminación contra una lista de referencia"""
+    print("\nTest: Eliminación en Splay Tree")
+    rng = random.Random(23)
+    tree = SplayTree()
+    reference = []
+    for _ in range(3000):
+        key = rng.randrange(200)
+        action = rng.random()
+        if action < 0.5:
+            tree.insert(key)
+            reference.append(key)
+        elif action < 0.8:
+            assert tree.delete(key) == (key in reference), "Error en el resultado de delete"
+            if key in reference:
+                reference.remove(key)
+        else:
+            assert tree.search(key) == (key in reference), "Error en el resultado de search"
+    assert list(tree) == sorted(reference), "Error tras eliminar"
+    assert len(tree) == len(reference), "Error en la cantidad de valores"
+    for key in list(reference):
+        assert tree.delete(key), "Error: no eliminó un valor existente"
+    assert len(tree) == 0 and tree.height() == 0 and tree.root is None, "Error: el árbol debe quedar vacío"
+    print("  ✓ Eliminación correcta")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL SPLAY TREE")
+    print("="*60)
+
+    test_splay_insertion_and_search()
+    test_splay_moves_key_to_root()
+    test_splay_ordered_data()
+    test_splay_traversals()
+    test_splay_delete()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL SPLAY TREE PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,142 @@
+"""
+Tests para el mapa ordenado TreeMap
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+from model import TreeMap
+from model.rb_node import RBMapNode
+
+
+def _build_map():
+    """Crea un mapa de ejemplo con llaves pares"""
+    tree_map = TreeMap()
+    for key in [40, 20, 60, 10, 30, 50, 70]:
+        tree_map[key] = f"v{key}"
+    return tree_map
+
+
+def test_map_get_set():
+    """Prueba asignación, lectura y reemplazo de valores"""
+    print("Test: Lectura y escritura en TreeMap")
+    tree_map = _build_map()
+
+    assert tree_map[30] == "v30", "Error al leer valor"
+    assert tree_map.get(35) is None, "Error: get de llave inexistente"
+    assert tree_map.get(35, "x") == "x", "Error: valor por defecto"
+    assert 50 in tree_map and 55 not in tree_map, "Error en __contains__"
+
+    tree_map[30] = "nuevo"
+    assert tree_map[30] == "nuevo", "Error al reemplazar valor"
+    assert len(tree_map) == 7, "Error: reemplazar no debe cambiar el tamaño"
+
+    try:
+        tree_map[99]
+        assert False, "Error: se esperaba KeyError"
+    except KeyError:
+        pass
+
+    print("  ✓ Lectura y escritura correctas")
+
+
+def test_map_delete():
+    """Prueba la eliminación de llaves"""
+    print("\nTest: Eliminación en TreeMap")
+    tree_map = _build_map()
+
+    del tree_map[40]
+    del tree_map[10]
+    assert list(tree_map.keys()) == [20, 30, 50, 60, 70], "Error en llaves tras eliminar"
+    assert tree_map[50] == "v50", "Error: el valor debe viajar con su llave"
+
+    try:
+        del tree_map[40]
+        assert False, "Error: se esperaba KeyError"
+    except KeyError:
+        pass
+
+    print("  ✓ Eliminación correcta")
+
+
+def test_map_navigation():
+    """Prueba floor, ceiling, successor y predecessor"""
+    print("\nTest: Navegación en TreeMap")
+    tree_map = _build_map()
+
+    assert tree_map.floor(35) == 30 and tree_map.floor(30) == 30, "Error en floor"
+    assert tree_map.floor(5) is None, "Error en floor sin resultado"
+    assert tree_map.ceiling(35) == 40 and tree_map.ceiling(40) == 40, "Error en ceiling"
+    assert tree_map.ceiling(75) is None, "Error en ceiling sin resultado"
+    assert tree_map.successor(40) == 50 and tree_map.successor(45) == 50, "Error en successor"
+    assert tree_map.successor(70) is None, "Error en successor del máximo"
+    assert tree_map.predecessor(40) == 30 and tree_map.predecessor(35) == 30, "Error en predecessor"
+    assert tree_map.predecessor(10) is None, "Error en predecessor del mínimo"
+
+    print("  ✓ Navegación correcta")
+
+
+def test_map_irange():
+    """Prueba la iteración por rangos"""
+    print("\nTest: Rangos en TreeMap")
+    tree_map = _build_map()
+
+    assert list(tree_map.irange(25, 55)) == [(30, "v30"), (40, "v40"), (50, "v50")], "Error en irange"
+    assert [k for k, _ in tree_map.irange(high=20)] == [10, 20], "Error en irange sin límite inferior"
+    assert [k for k, _ in tree_map.irange(low=65)] == [70], "Error en irange sin límite superior"
+    assert list(tree_map.irange(41, 49)) == [], "Error en rango vacío"
+    assert list(tree_map.values())[0] == "v10", "Error en values"
+    assert tree_map.select(3) == 40 and tree_map.rank(45) == 4, "Error en estadísticas de orden"
+
+    print("  ✓ Rangos correctos")
+
+
+def test_map_finger_and_node_class():
+    """Prueba que insert_finger mantiene llaves únicas y que se usa node_class"""
+    print("\nTest: Modo finger y node_class en TreeMap")
+    rng = random.Random(6)
+    tree_map = TreeMap()
+    reference = {}
+    for i in range(2000):
+        key = rng.randrange(300) if i % 3 else i // 3
+        tree_map.insert_finger(key, i)
+        reference[key] = i
+    assert list(tree_map.items()) == sorted(reference.items()), "Error: duplicados o valores perdidos"
+    assert len(tree_map) == len(reference), "Error en la cantidad de llaves"
+
+    class TaggedNode(RBMapNode):
+        pass
+
+    class TaggedMap(TreeMap):
+        node_class = TaggedNode
+
+    tagged = TaggedMap()
+    tagged[2] = "a"
+    tagged.insert_finger(5, "b")
+    tagged.insert_finger(1, "c")
+    assert all(isinstance(tagged._find_node(key), TaggedNode) for key in (1, 2, 5)), \
+        "Error: no se usó node_class"
+    print("  ✓ Llaves únicas en modo finger y node_class respetado")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DEL MAPA ORDENADO (TreeMap)")
+    print("="*60)
+
+    test_map_get_set()
+    test_map_delete()
+    test_map_navigation()
+    test_map_irange()
+    test_map_finger_and_node_class()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DEL TREEMAP PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,128 @@
+"""
+Tests para el registro de generadores de cargas de trabajo
+"""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from controller.workloads import (generate_workload, dataset_hash, workload_names,
+                                  interleaved_miss_keys, outside_miss_keys, search_probes)
+from model import BinarySearchTree, RedBlackTree
+
+
+def test_workloads_deterministic():
+    """Prueba que cada generador es reproducible con la misma semilla"""
+    print("Test: Generadores reproducibles")
+    for name in workload_names():
+        first = generate_workload(name, 500, seed=3)
+        second = generate_workload(name, 500, seed=3)
+        assert len(first) == 500, f"Error en tamaño de {name}"
+        assert first == second, f"Error: {name} no es reproducible"
+        assert dataset_hash(first) == dataset_hash(second), f"Error en hash de {name}"
+    assert dataset_hash(generate_workload('random', 500, seed=3)) != \
+        dataset_hash(generate_workload('random', 500, seed=4)), "Error: semillas distintas, mismo hash"
+    print("  ✓ Todos los generadores son reproducibles")
+
+
+def test_workload_shapes():
+    """Prueba la forma de las secuencias generadas"""
+    print("\nTest: Forma de las secuencias")
+    assert generate_workload('sawtooth', 9, teeth=3) == [1, 4, 7, 2, 5, 8, 3, 6, 9], "Error en sawtooth"
+    assert generate_workload('organ_pipe', 6) == [1, 3, 5, 6, 4, 2], "Error en organ_pipe"
+    assert generate_workload('zigzag', 5) == [1, 5, 2, 4, 3], "Error en zigzag"
+
+    k_sorted = generate_workload('k_sorted', 200, seed=1, k=8)
+    assert all(abs(key - 1 - i) < 8 for i, key in enumerate(k_sorted)), "Error en k_sorted"
+    assert sorted(k_sorted) == list(range(1, 201)), "Error: k_sorted debe ser permutación"
+
+    zipf = generate_workload('zipf', 2000, seed=1)
+    assert len(set(zipf)) < len(zipf), "Error: zipf debe tener duplicados"
+
+    strings = generate_workload('strings', 100, seed=1, length=6)
+    assert len(set(strings)) == 100 and all(len(key) == 6 for key in strings), "Error en strings"
+    print("  ✓ Secuencias con la forma esperada")
+
+
+def test_workloads_in_trees():
+    """Prueba que los árboles aceptan todas las cargas, incluso con duplicados"""
+    print("\nTest: Cargas en los árboles")
+    for name in workload_names():
+        data = generate_workload(name, 300, seed=5)
+        for tree_class in (BinarySearchTree, RedBlackTree):
+            tree = tree_class()
+            for key in data:
+                tree.insert(key)
+            assert list(tree) == sorted(data), f"Error en {tree_class.__name__} con {name}"
+            assert all(tree.search_many(data)), f"Error en search_many con {name}"
+    print("  ✓ Los árboles aceptan todas las cargas")
+
+
+def test_miss_keys():
+    """Prueba que las llaves de fallo no existen y caen donde corresponde"""
+    print("\nTest: Llaves de fallo")
+    rng = random.Random(2)
+    for name in ('random', 'clustered', 'zipf', 'strings'):
+        data = generate_workload(name, 500, seed=7)
+        present = set(data)
+        low, high = min(data), max(data)
+
+        inside = interleaved_miss_keys(data, 200, rng)
+        assert len(inside) == 200 and not present.intersection(inside), f"Error: fallo interno existe ({name})"
+        assert all(low < key < high for key in inside), f"Error: fallo interno fuera del rango ({name})"
+
+        outside = outside_miss_keys(data, 200, rng)
+        assert all(key < low or key > high for key in outside), f"Error: fallo externo en el rango ({name})"
+
+    data = generate_workload('random', 1000, seed=1)
+    keys, labels = search_probes(data, 1000, 0.3, seed=5)
+    present = set(data)
+    assert labels.count('hit') == 300, "Error en proporción de aciertos"
+    assert all((key in present) == (label == 'hit') for key, label in zip(keys, labels)), \
+        "Error: categoría no coincide con la existencia"
+    for tree_class in (BinarySearchTree, RedBlackTree):
+        tree = tree_class.from_iterable(data)
+        assert sum(tree.search_many(keys)) == 300, f"Error en búsquedas de {tree_class.__name__}"
+    
+    # Los fallos internos de cadenas deben seguir siendo fallos en la instantánea NumPy
+    strings = generate_workload('strings', 500, seed=2)
+    keys, labels = search_probes(strings, 200, 0.5, seed=6)
+    inside = interleaved_miss_keys(sorted(strings)[:2], 1, random.Random(1))
+    assert sorted(strings)[0] < inside[0] < sorted(strings)[1], "Error: el fallo no ordena tras la llave"
+    found = RedBlackTree.from_iterable(strings).freeze().contains_many(keys)
+    assert int(found.sum()) == 100, f"Error: {int(found.sum())} aciertos en la instantánea (esperados 100)"
+    assert all(bool(hit) == (label == 'hit') for hit, label in zip(found, labels)), \
+        "Error: fallo de cadena reportado como acierto"
+    print("  ✓ Llaves de fallo correctas")
+
+
+def test_unknown_workload():
+    """Prueba que un tipo desconocido se rechaza"""
+    print("\nTest: Tipo desconocido")
+    try:
+        generate_workload('inexistente', 10)
+        assert False, "Error: debería lanzar ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Tipo desconocido rechazado")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas"""
+    print("="*60)
+    print("PRUEBAS DE LOS GENERADORES DE CARGAS")
+    print("="*60)
+
+    test_workloads_deterministic()
+    test_workload_shapes()
+    test_workloads_in_trees()
+    test_miss_keys()
+    test_unknown_workload()
+
+    print("\n" + "="*60)
+    print("TODAS LAS PRUEBAS DE LOS GENERADORES PASARON CORRECTAMENTE ✓")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    run_all_tests()
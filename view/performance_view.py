@@ -5,6 +5,17 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 
+# Estilo de los resultados guardados antes de que existiera la entrada 'engines'
+_LEGACY_ENGINES = {
+    'bst': {'label': 'BST (sin balanceo)', 'short_label': 'BST', 'color': 'red', 'marker': 'o'},
+    'rbt': {'label': 'Red-Black Tree', 'short_label': 'RBT', 'color': 'blue', 'marker': 's'}
+}
+
+# Estilo de la instantánea congelada (no es un motor del registro)
+_FROZEN_STYLE = {'label': 'Instantánea Eytzinger', 'short_label': 'Eytzinger',
+                 'color': 'green', 'marker': '^'}
+
+
 class PerformanceView:
     """Vista para visualizar el rendimiento de los árboles"""
     
@@ -12,6 +23,73 @@ class PerformanceView:
         """Inicializa la vista"""
         self.figures = []
     
+    def _engines(self, results):
+        """
+        Obtiene los motores presentes en unos resultados, en orden
+        
+        Args:
+            results: Resultados con la entrada 'engines' (o resultados antiguos
+                con 'bst' y 'rbt')
+            
+        Returns:
+            Lista de tuplas (nombre, estilo) donde el estilo tiene label,
+            short_label, color y marker
+        """
+        engines = results.get('engines')
+        if engines is None:
+            engines = {name: style for name, style in _LEGACY_ENGINES.items() if name in results}
+        return [(name, style) for name, style in engines.items() if name in results]
+    
+    def _plot_timing(self, results, series, phase, style, label, linestyle='-', ax=None):
+        """
+        Dibuja una serie de tiempos con barras de error si hay distribución
+        
+        Las fases que el motor no implementa (lista vacía) no se dibujan.
+        
+        Args:
+            results: Resultados de las pruebas
+            series: Motor o 'frozen'
+            phase: Fase medida ('insert', 'search', ...)
+            style: Estilo del motor (color y marker)
+            label: Etiqueta de la leyenda
+            linestyle: Estilo de línea de matplotlib
+            ax: Ejes donde dibujar (por defecto, los actuales)
+        """
+        ax = ax or plt.gca()
+        data_sizes = results['data_sizes']
+        values = results[series].get(phase)
+        if not values:
+            return
+        stats = results[series].get('stats', {}).get(phase)
+        options = dict(color=style['color'], marker=style['marker'], linestyle=linestyle,
+                       label=label, linewidth=2, markersize=8)
+        if stats:
+            # La mediana es el punto y el intervalo de confianza del 95% la barra
+            ax.errorbar(data_sizes, values, yerr=[entry['ci95'] for entry in stats],
+                        capsize=4, **options)
+        else:
+            ax.plot(data_sizes, values, **options)
+    
+    def _format_timing(self, results, series, phase, i):
+        """
+        Formatea un tiempo con su intervalo de confianza si está disponible
+        
+        Args:
+            results: Resultados de las pruebas
+            series: Motor o 'frozen'
+            phase: Fase medida
+            i: Índice del tamaño de datos
+            
+        Returns:
+            Texto con el tiempo en segundos
+        """
+        text = f"{results[series][phase][i]:.6f} s"
+        stats = results[series].get('stats', {}).get(phase)
+        if stats:
+            entry = stats[i]
+            text += f" (±{entry['ci95']:.6f}, min {entry['min']:.6f}, n={entry['n']})"
+        return text
+    
     def plot_insertion_time(self, results, save_path='insertion_comparison.png'):
         """
         Genera gráfica de comparación de tiempos de inserción
@@ -20,14 +98,11 @@ class PerformanceView:
             results: Resultados de las pruebas
             save_path: Ruta donde guardar la gráfica
         """
-        data_sizes = results['data_sizes']
-        bst_times = results['bst']['insert']
-        rbt_times = results['rbt']['insert']
         data_type = results.get('data_type', 'unknown')
         
         plt.figure(figsize=(10, 6))
-        plt.plot(data_sizes, bst_times, 'r-o', label='BST (sin balanceo)', linewidth=2, markersize=8)
-        plt.plot(data_sizes, rbt_times, 'b-s', label='Red-Black Tree', linewidth=2, markersize=8)
+        for name, style in self._engines(results):
+            self._plot_timing(results, name, 'insert', style, style['label'])
         
         plt.xlabel('Cantidad de elementos', fontsize=12)
         plt.ylabel('Tiempo (segundos)', fontsize=12)
@@ -40,6 +115,33 @@ class PerformanceView:
         print(f"Gráfica guardada en: {save_path}")
         plt.close()
     
+    def plot_bulk_build_time(self, results, save_path='bulk_comparison.png'):
+        """
+        Genera gráfica de tiempos de construcción masiva contra inserción
+        
+        Args:
+            results: Resultados de las pruebas
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_type = results.get('data_type', 'unknown')
+        
+        plt.figure(figsize=(10, 6))
+        for name, style in self._engines(results):
+            self._plot_timing(results, name, 'insert', style, f"{style['short_label']} - inserción")
+            self._plot_timing(results, name, 'bulk', style, f"{style['short_label']} - carga masiva",
+                              linestyle='--')
+        
+        plt.xlabel('Cantidad de elementos', fontsize=12)
+        plt.ylabel('Tiempo (segundos)', fontsize=12)
+        plt.title(f'Construcción: Inserción vs Carga Masiva - Datos {data_type}', fontsize=14)
+        plt.legend(fontsize=11)
+        plt.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
     def plot_search_time(self, results, save_path='search_comparison.png'):
         """
         Genera gráfica de comparación de tiempos de búsqueda
@@ -48,14 +150,15 @@ class PerformanceView:
             results: Resultados de las pruebas
             save_path: Ruta donde guardar la gráfica
         """
-        data_sizes = results['data_sizes']
-        bst_times = results['bst']['search']
-        rbt_times = results['rbt']['search']
         data_type = results.get('data_type', 'unknown')
         
         plt.figure(figsize=(10, 6))
-        plt.plot(data_sizes, bst_times, 'r-o', label='BST (sin balanceo)', linewidth=2, markersize=8)
-        plt.plot(data_sizes, rbt_times, 'b-s', label='Red-Black Tree', linewidth=2, markersize=8)
+        for name, style in self._engines(results):
+            self._plot_timing(results, name, 'search', style, style['label'])
+            self._plot_timing(results, name, 'search_batch', style, f"{style['short_label']} - por lotes",
+                              linestyle='--')
+        if 'frozen' in results:
+            self._plot_timing(results, 'frozen', 'search', _FROZEN_STYLE, _FROZEN_STYLE['label'])
         
         plt.xlabel('Cantidad de elementos', fontsize=12)
         plt.ylabel('Tiempo (segundos)', fontsize=12)
@@ -68,6 +171,31 @@ class PerformanceView:
         print(f"Gráfica guardada en: {save_path}")
         plt.close()
     
+    def plot_deletion_time(self, results, save_path='delete_comparison.png'):
+        """
+        Genera gráfica de comparación de tiempos de eliminación
+        
+        Args:
+            results: Resultados de las pruebas
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_type = results.get('data_type', 'unknown')
+        
+        plt.figure(figsize=(10, 6))
+        for name, style in self._engines(results):
+            self._plot_timing(results, name, 'delete', style, style['label'])
+        
+        plt.xlabel('Cantidad de elementos', fontsize=12)
+        plt.ylabel('Tiempo (segundos)', fontsize=12)
+        plt.title(f'Comparación de Tiempos de Eliminación - Datos {data_type}', fontsize=14)
+        plt.legend(fontsize=11)
+        plt.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
     def plot_tree_height(self, results, save_path='height_comparison.png'):
         """
         Genera gráfica de comparación de alturas de árboles
@@ -77,16 +205,15 @@ class PerformanceView:
             save_path: Ruta donde guardar la gráfica
         """
         data_sizes = results['data_sizes']
-        bst_heights = results['bst']['height']
-        rbt_heights = results['rbt']['height']
         data_type = results.get('data_type', 'unknown')
         
         # Calcular altura teórica óptima (log2)
         optimal_heights = [np.log2(n + 1) for n in data_sizes]
         
         plt.figure(figsize=(10, 6))
-        plt.plot(data_sizes, bst_heights, 'r-o', label='BST (sin balanceo)', linewidth=2, markersize=8)
-        plt.plot(data_sizes, rbt_heights, 'b-s', label='Red-Black Tree', linewidth=2, markersize=8)
+        for name, style in self._engines(results):
+            plt.plot(data_sizes, results[name]['height'], color=style['color'], marker=style['marker'],
+                     label=style['label'], linewidth=2, markersize=8)
         plt.plot(data_sizes, optimal_heights, 'g--', label='Altura óptima (log₂n)', linewidth=2, alpha=0.7)
         
         plt.xlabel('Cantidad de elementos', fontsize=12)
@@ -100,6 +227,431 @@ class PerformanceView:
         print(f"Gráfica guardada en: {save_path}")
         plt.close()
     
+    def plot_operation_counts(self, results, save_path='operations_comparison.png'):
+        """
+        Genera gráficas de conteo de operaciones (independientes de la máquina)
+        
+        Args:
+            results: Resultados de las pruebas con contadores ('counters')
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        counted = [(name, style, results[name]['counters']) for name, style in self._engines(results)
+                   if results[name].get('counters')]
+        
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        
+        # Los contadores de reequilibrio solo existen en algunos motores
+        panels = (
+            (axes[0, 0], 'Comparaciones en Inserción', 'Comparaciones',
+             (('insert_comparisons', '-', ''),)),
+            (axes[0, 1], 'Nodos Visitados por Búsqueda', 'Nodos (promedio)',
+             (('search_visits', '-', ''),)),
+            (axes[1, 0], 'Rotaciones', 'Rotaciones',
+             (('left_rotations', '-', ' - izquierda'), ('right_rotations', '--', ' - derecha'))),
+            (axes[1, 1], 'Casos de Reparación en Inserción', 'Aplicaciones',
+             (('fixup_case1', '-', ' - caso 1 (recoloreo)'), ('fixup_case2', '--', ' - caso 2'),
+              ('fixup_case3', ':', ' - caso 3')))
+        )
+        for ax, title, ylabel, counters in panels:
+            for name, style, counts in counted:
+                for counter, linestyle, suffix in counters:
+                    if counter not in counts:
+                        continue
+                    values = counts[counter]
+                    if counter == 'search_visits':
+                        values = [v / s if s else 0 for v, s in zip(values, counts['searches'])]
+                    ax.plot(data_sizes, values, color=style['color'], marker=style['marker'],
+                            linestyle=linestyle, label=style['short_label'] + suffix, linewidth=2)
+            ax.set_title(title, fontsize=12)
+            ax.set_ylabel(ylabel)
+        
+        for ax in axes.flat:
+            ax.set_xlabel('Cantidad de elementos')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        
+        fig.suptitle(f'Conteo de Operaciones - Datos {data_type}', fontsize=14)
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_memory_usage(self, results, save_path='memory_comparison.png'):
+        """
+        Genera gráficas de memoria: bytes retenidos por llave y pico de construcción
+        
+        Args:
+            results: Resultados de las pruebas con la fase de memoria ('memory')
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        engines = [(name, style, results[name]['memory']) for name, style in self._engines(results)
+                   if results[name].get('memory', {}).get('retained')]
+        
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(f'Uso de Memoria - Datos {data_type}', fontsize=14, fontweight='bold')
+        
+        ax = axes[0]
+        for name, style, memory in engines:
+            ax.plot(data_sizes, memory['bytes_per_key'], color=style['color'], marker=style['marker'],
+                    label=style['label'], linewidth=2, markersize=8)
+        ax.set_xlabel('Cantidad de elementos', fontsize=12)
+        ax.set_ylabel('Bytes retenidos por llave', fontsize=12)
+        ax.set_title('Memoria retenida tras la construcción')
+        ax.legend(fontsize=11)
+        ax.grid(True, alpha=0.3)
+        
+        ax = axes[1]
+        with_rss = all(rss is not None for _, _, memory in engines for rss in memory['rss'])
+        for name, style, memory in engines:
+            ax.plot(data_sizes, [peak / 1024 for peak in memory['peak']], color=style['color'],
+                    marker=style['marker'], label=f"{style['short_label']} - pico", linewidth=2, markersize=8)
+            if with_rss:
+                ax.plot(data_sizes, [rss / 1024 for rss in memory['rss']], color=style['color'],
+                        marker=style['marker'], linestyle=':', label=f"{style['short_label']} - RSS",
+                        linewidth=2, markersize=6)
+        ax.set_xlabel('Cantidad de elementos', fontsize=12)
+        ax.set_ylabel('Memoria (KiB)', fontsize=12)
+        ax.set_title('Pico durante la construcción')
+        ax.legend(fontsize=11)
+        ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_mixed_workload(self, results, save_path='mixed_workload.png'):
+        """
+        Genera gráficas de la carga mixta: rendimiento y percentiles de latencia
+        
+        Args:
+            results: Resultados de compare_mixed_workload
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        mix = results['mix']
+        mix_label = ', '.join(f"{op} {share:.0%}" for op, share in mix.items())
+        
+        fig, axes = plt.subplots(1, 1 + len(mix), figsize=(6 * (1 + len(mix)), 6))
+        fig.suptitle(f"Carga mixta ({mix_label}) - distribución {results['distribution']}, "
+                     f"datos {results.get('data_type', 'unknown')}", fontsize=14, fontweight='bold')
+        
+        engines = self._engines(results)
+        ax = axes[0]
+        for name, style in engines:
+            ax.plot(data_sizes, results[name]['ops_per_sec'], color=style['color'], marker=style['marker'],
+                    label=style['label'], linewidth=2, markersize=8)
+        ax.set_xlabel('Cantidad de elementos precargados', fontsize=12)
+        ax.set_ylabel('Operaciones por segundo', fontsize=12)
+        ax.set_title('Rendimiento')
+        ax.legend(fontsize=11)
+        ax.grid(True, alpha=0.3)
+        
+        # Percentiles de la precarga más grande, uno por operación
+        labels = [f'p{q:g}' for q in (50, 95, 99, 99.9)]
+        positions = np.arange(len(labels))
+        width = 0.7 / max(len(engines), 1)
+        for ax, op in zip(axes[1:], mix):
+            for index, (name, style) in enumerate(engines):
+                offset = (index - (len(engines) - 1) / 2) * width
+                latency = results[name]['latency'][op]
+                values = [(latency[p][-1] or 0) / 1000 for p in labels]
+                ax.bar(positions + offset, values, width, color=style['color'], alpha=0.7,
+                       label=style['short_label'])
+            ax.set_xticks(positions)
+            ax.set_xticklabels(labels)
+            ax.set_yscale('log')
+            ax.set_ylabel('Latencia (µs, escala log)', fontsize=12)
+            ax.set_title(f'Latencia de {op} (n={data_sizes[-1]})')
+            ax.legend(fontsize=11)
+            ax.grid(True, alpha=0.3, axis='y')
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_latency_percentiles(self, results, save_path='latency_percentiles.png'):
+        """
+        Genera la curva de percentiles de latencia por operación
+        
+        El eje x usa escala de "nueves" (1 / (1 - q)) para que la cola
+        (p99, p99.9, ...) ocupe tanto espacio como la mediana.
+        
+        Args:
+            results: Resultados de compare_latency_distribution
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        percentiles = [50, 75, 90, 95, 99, 99.5, 99.9, 99.95, 99.99]
+        positions = [1 / (1 - q / 100) for q in percentiles]
+        
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(f'Percentiles de latencia por operación (n={data_sizes[-1]}) - Datos {data_type}',
+                     fontsize=14, fontweight='bold')
+        
+        for ax, operation, title in ((axes[0], 'insert', 'Inserción'), (axes[1], 'search', 'Búsqueda')):
+            for name, style in self._engines(results):
+                histogram = results[name][operation][-1]
+                values = [histogram.value_at_percentile(q) / 1000 for q in percentiles]
+                ax.plot(positions, values, color=style['color'], marker=style['marker'],
+                        label=style['label'], linewidth=2, markersize=6)
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+            ax.set_xticks(positions)
+            ax.set_xticklabels([f'p{q:g}' for q in percentiles], rotation=45)
+            ax.minorticks_off()
+            ax.set_xlabel('Percentil', fontsize=12)
+            ax.set_ylabel('Latencia (µs, escala log)', fontsize=12)
+            ax.set_title(title)
+            ax.legend(fontsize=11)
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_latency_cdf(self, results, save_path='latency_cdf.png'):
+        """
+        Genera la distribución acumulada de latencias por operación
+        
+        Args:
+            results: Resultados de compare_latency_distribution
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(f'Distribución acumulada de latencias (n={data_sizes[-1]}) - Datos {data_type}',
+                     fontsize=14, fontweight='bold')
+        
+        for ax, operation, title in ((axes[0], 'insert', 'Inserción'), (axes[1], 'search', 'Búsqueda')):
+            for name, style in self._engines(results):
+                points = results[name][operation][-1].cdf()
+                ax.step([value / 1000 for value, _ in points], [fraction for _, fraction in points],
+                        where='post', color=style['color'], label=style['label'], linewidth=2)
+            ax.set_xscale('log')
+            ax.set_xlabel('Latencia (µs, escala log)', fontsize=12)
+            ax.set_ylabel('Fracción de operaciones', fontsize=12)
+            ax.set_title(title)
+            ax.legend(fontsize=11)
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_growth(self, results, save_path='growth_comparison.png'):
+        """
+        Genera gráficas del benchmark de crecimiento (un árbol por motor)
+        
+        Args:
+            results: Resultados de compare_growth
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig.suptitle(f'Crecimiento incremental hasta {data_sizes[-1]} llaves - Datos {data_type}',
+                     fontsize=14, fontweight='bold')
+        
+        panels = (
+            (axes[0, 0], 'insert_per_key', 1e6, 'Inserción marginal (µs/llave)'),
+            (axes[0, 1], 'search_per_key', 1e6, 'Búsqueda muestreada (µs/búsqueda)'),
+            (axes[1, 0], 'height', 1, 'Altura del árbol'),
+            (axes[1, 1], 'bytes_per_key', 1, f"Bytes por llave ({results.get('memory_source', 'rss')})")
+        )
+        for ax, measure, scale, title in panels:
+            for name, style in self._engines(results):
+                points = [(size, value * scale) for size, value in zip(data_sizes, results[name][measure])
+                          if value is not None]
+                ax.plot([size for size, _ in points], [value for _, value in points], color=style['color'],
+                        marker=style['marker'], label=style['label'], linewidth=2, markersize=4)
+            if measure == 'height':
+                ax.plot(data_sizes, [np.log2(n + 1) for n in data_sizes], 'g--',
+                        label='Altura óptima (log₂n)', linewidth=2, alpha=0.7)
+            ax.set_xscale('log')
+            ax.set_xlabel('Cantidad de elementos (escala log)')
+            ax.set_title(title, fontsize=12)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_hit_miss_search(self, results, save_path='hit_miss_search.png'):
+        """
+        Genera gráficas de latencia de búsqueda separando aciertos y fallos
+        
+        Args:
+            results: Resultados de compare_hit_miss_search
+            save_path: Ruta donde guardar la gráfica
+        """
+        data_sizes = results['data_sizes']
+        data_type = results.get('data_type', 'unknown')
+        categories = (('hit', '-', 'o', 'acierto'),
+                      ('miss_inside', '--', 's', 'fallo entre llaves'),
+                      ('miss_outside', ':', '^', 'fallo fuera del rango'))
+        
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(f"Búsquedas con {results['hit_ratio']:.0%} de aciertos - Datos {data_type}",
+                     fontsize=14, fontweight='bold')
+        
+        for ax, measure, title in ((axes[0], 'mean', 'Latencia media'), (axes[1], 'p99', 'Latencia p99')):
+            for name, style in self._engines(results):
+                for category, linestyle, marker, label in categories:
+                    points = [(size, value / 1000) for size, value
+                              in zip(data_sizes, results[name][category][measure]) if value is not None]
+                    if points:
+                        ax.plot([size for size, _ in points], [value for _, value in points],
+                                color=style['color'], linestyle=linestyle, marker=marker,
+                                label=f"{style['short_label']} - {label}", linewidth=2, markersize=6)
+            ax.set_xlabel('Cantidad de elementos', fontsize=12)
+            ax.set_ylabel('Latencia por búsqueda (µs)', fontsize=12)
+            ax.set_title(title)
+            ax.legend(fontsize=9)
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_btree_order_sweep(self, results, save_path='btree_orders.png'):
+        """
+        Genera gráficas del barrido de orden de nodo del B-Tree
+        
+        Cada tipo de datos es una serie sobre el orden (tamaño más grande); la
+        línea punteada del mismo color es el Red-Black Tree con esos datos.
+        
+        Args:
+            results: Resultados de compare_btree_orders
+            save_path: Ruta donde guardar la gráfica
+        """
+        orders = results['orders']
+        size = results['data_sizes'][-1]
+        palette = plt.get_cmap('tab10').colors
+        
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig.suptitle(f'B-Tree: barrido del orden de nodo (n={size})', fontsize=14, fontweight='bold')
+        
+        panels = (
+            (axes[0, 0], 'insert', 'Inserción (s)'),
+            (axes[0, 1], 'search', 'Búsqueda (s)'),
+            (axes[1, 0], 'height', 'Altura (niveles)'),
+            (axes[1, 1], 'bytes_per_key', 'Bytes retenidos por llave')
+        )
+        for ax, measure, title in panels:
+            for idx, data_type in enumerate(results['data_types']):
+                sweep = results[data_type]
+                color = palette[idx % len(palette)]
+                ax.plot(orders, [sweep['orders'][order][measure][-1] for order in orders],
+                        color=color, marker='o', label=f'B-Tree - {data_type}', linewidth=2)
+                ax.axhline(sweep['rbt'][measure][-1], color=color, linestyle='--', alpha=0.7,
+                           label=f'RBT - {data_type}')
+            ax.set_xscale('log', base=2)
+            ax.set_xticks(orders)
+            ax.set_xticklabels([str(order) for order in orders])
+            ax.minorticks_off()
+            ax.set_xlabel('Orden del nodo (máximo de hijos)')
+            ax.set_title(title, fontsize=12)
+            ax.legend(fontsize=9)
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_skewed_search(self, results, save_path='skewed_search.png'):
+        """
+        Genera gráficas de búsquedas con popularidad de Zipf
+        
+        A la izquierda, el tiempo por búsqueda según el exponente en el tamaño
+        más grande; a la derecha, según el tamaño con el exponente más alto.
+        
+        Args:
+            results: Resultados de compare_skewed_search
+            save_path: Ruta donde guardar la gráfica
+        """
+        exponents = results['exponents']
+        sizes = results['data_sizes']
+        searches = results['searches']
+        top = exponents[-1]
+        
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig.suptitle('Búsquedas con popularidad de Zipf', fontsize=14, fontweight='bold')
+        
+        for name, style in self._engines(results):
+            series = results[name]['search']
+            ax1.plot(exponents, [series[s][-1] / searches * 1e9 for s in exponents],
+                     color=style['color'], marker=style['marker'], label=style['label'], linewidth=2)
+            ax2.plot(sizes, [value / searches * 1e9 for value in series[top]],
+                     color=style['color'], marker=style['marker'], label=style['label'], linewidth=2)
+        
+        ax1.set_xlabel('Exponente de Zipf (0 = uniforme)')
+        ax1.set_title(f'n={sizes[-1]}', fontsize=12)
+        ax2.set_xlabel('Cantidad de elementos')
+        ax2.set_xscale('log')
+        ax2.set_title(f'Exponente {top}', fontsize=12)
+        for ax in (ax1, ax2):
+            ax.set_ylabel('Tiempo por búsqueda (ns)')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
+    def plot_rebalance(self, results, save_path='rebalance.png'):
+        """
+        Genera gráficas del rebalanceo global del ABB (Day-Stout-Warren)
+        
+        Args:
+            results: Resultados de compare_rebalance
+            save_path: Ruta donde guardar la gráfica
+        """
+        sizes = results['data_sizes']
+        style = _LEGACY_ENGINES['bst']
+        
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig.suptitle(f"ABB: rebalanceo Day-Stout-Warren - Datos {results.get('data_type', 'unknown')}",
+                     fontsize=14, fontweight='bold')
+        
+        ax1.plot(sizes, results['before']['search'], color=style['color'], marker='o',
+                 label='Antes de rebalancear', linewidth=2)
+        ax1.plot(sizes, results['after']['search'], color='green', marker='^',
+                 label='Después de rebalancear', linewidth=2)
+        ax1.set_yscale('log')
+        ax1.set_ylabel('Tiempo de búsqueda (segundos)')
+        ax1.set_title('Búsqueda de todas las llaves', fontsize=12)
+        
+        ax2.plot(sizes, results['rebalance'], color='purple', marker='D', label='rebalance()', linewidth=2)
+        ax2.set_ylabel('Tiempo (segundos)')
+        ax2.set_title('Costo único del rebalanceo (O(n))', fontsize=12)
+        
+        for ax in (ax1, ax2):
+            ax.set_xlabel('Cantidad de elementos')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Gráfica guardada en: {save_path}")
+        plt.close()
+    
     def plot_all_comparisons(self, results, prefix=''):
         """
         Genera todas las gráficas de comparación
@@ -110,9 +662,19 @@ class PerformanceView:
         """
         data_type = results.get('data_type', 'unknown')
         
+        engines = [results[name] for name, _ in self._engines(results)]
+        
         self.plot_insertion_time(results, f'{prefix}insertion_{data_type}.png')
+        if any(times.get('bulk') for times in engines):
+            self.plot_bulk_build_time(results, f'{prefix}bulk_{data_type}.png')
         self.plot_search_time(results, f'{prefix}search_{data_type}.png')
+        if any(times.get('delete') for times in engines):
+            self.plot_deletion_time(results, f'{prefix}delete_{data_type}.png')
         self.plot_tree_height(results, f'{prefix}height_{data_type}.png')
+        if any(times.get('counters') for times in engines):
+            self.plot_operation_counts(results, f'{prefix}operations_{data_type}.png')
+        if any(times.get('memory', {}).get('retained') for times in engines):
+            self.plot_memory_usage(results, f'{prefix}memory_{data_type}.png')
         
         print(f"\nTodas las gráficas generadas para datos tipo: {data_type}")
     
@@ -124,60 +686,34 @@ class PerformanceView:
             results_list: Lista de resultados de diferentes tipos de datos
             save_path: Ruta donde guardar la gráfica
         """
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        engines = self._engines(results_list[0])
+        fig, axes = plt.subplots(2, len(engines), figsize=(7.5 * len(engines), 12), squeeze=False)
         
-        # Colores y marcadores para diferentes tipos de datos
-        colors = ['red', 'blue', 'green']
-        markers = ['o', 's', '^']
+        # Colores y marcadores para diferentes tipos de datos (se reciclan si
+        # hay más tipos que entradas en la paleta)
+        palette = plt.get_cmap('tab10').colors
+        marker_cycle = ['o', 's', '^', 'D', 'v', 'P', 'X', '*']
+        colors = [palette[idx % len(palette)] for idx in range(len(results_list))]
+        markers = [marker_cycle[idx % len(marker_cycle)] for idx in range(len(results_list))]
         
-        for idx, results in enumerate(results_list):
-            data_type = results.get('data_type', f'Type {idx}')
-            data_sizes = results['data_sizes']
-            
-            # Tiempo de inserción BST
-            axes[0, 0].plot(data_sizes, results['bst']['insert'], 
-                          color=colors[idx], marker=markers[idx], 
-                          label=f'BST - {data_type}', linewidth=2)
-            
-            # Tiempo de inserción RBT
-            axes[0, 1].plot(data_sizes, results['rbt']['insert'], 
-                          color=colors[idx], marker=markers[idx], 
-                          label=f'RBT - {data_type}', linewidth=2)
-            
-            # Altura BST
-            axes[1, 0].plot(data_sizes, results['bst']['height'], 
-                          color=colors[idx], marker=markers[idx], 
-                          label=f'BST - {data_type}', linewidth=2)
+        # Una columna por motor: tiempo de inserción arriba y altura abajo
+        for column, (name, style) in enumerate(engines):
+            for idx, results in enumerate(results_list):
+                data_type = results.get('data_type', f'Type {idx}')
+                data_sizes = results['data_sizes']
+                for row, measure in enumerate(('insert', 'height')):
+                    axes[row, column].plot(data_sizes, results[name][measure],
+                                           color=colors[idx], marker=markers[idx],
+                                           label=f"{style['short_label']} - {data_type}", linewidth=2)
             
-            # Altura RBT
-            axes[1, 1].plot(data_sizes, results['rbt']['height'], 
-                          color=colors[idx], marker=markers[idx], 
-                          label=f'RBT - {data_type}', linewidth=2)
-        
-        # Configurar subgráficas
-        axes[0, 0].set_title('Tiempo de Inserción - BST', fontsize=12)
-        axes[0, 0].set_xlabel('Cantidad de elementos')
-        axes[0, 0].set_ylabel('Tiempo (s)')
-        axes[0, 0].legend()
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        axes[0, 1].set_title('Tiempo de Inserción - RBT', fontsize=12)
-        axes[0, 1].set_xlabel('Cantidad de elementos')
-        axes[0, 1].set_ylabel('Tiempo (s)')
-        axes[0, 1].legend()
-        axes[0, 1].grid(True, alpha=0.3)
-        
-        axes[1, 0].set_title('Altura del Árbol - BST', fontsize=12)
-        axes[1, 0].set_xlabel('Cantidad de elementos')
-        axes[1, 0].set_ylabel('Altura')
-        axes[1, 0].legend()
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        axes[1, 1].set_title('Altura del Árbol - RBT', fontsize=12)
-        axes[1, 1].set_xlabel('Cantidad de elementos')
-        axes[1, 1].set_ylabel('Altura')
-        axes[1, 1].legend()
-        axes[1, 1].grid(True, alpha=0.3)
+            for row, (title, ylabel) in enumerate((('Tiempo de Inserción', 'Tiempo (s)'),
+                                                   ('Altura del Árbol', 'Altura'))):
+                ax = axes[row, column]
+                ax.set_title(f"{title} - {style['short_label']}", fontsize=12)
+                ax.set_xlabel('Cantidad de elementos')
+                ax.set_ylabel(ylabel)
+                ax.legend()
+                ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
@@ -194,26 +730,44 @@ class PerformanceView:
         data_type = results.get('data_type', 'unknown')
         print(f"\n{'='*60}")
         print(f"ESTADÍSTICAS - Datos tipo: {data_type}")
+        if results.get('hit_ratio', 1.0) < 1.0:
+            print(f"Búsquedas con {results['hit_ratio']:.0%} de aciertos")
         print(f"{'='*60}")
         
+        engines = self._engines(results)
+        phases = (('insert', 'Inserción: '), ('bulk', 'Carga masiva: '), ('search', 'Búsqueda:  '),
+                  ('search_batch', 'Búsqueda por lotes: '), ('delete', 'Eliminación: '))
         for i, size in enumerate(results['data_sizes']):
             print(f"\nTamaño de datos: {size}")
-            print(f"  BST:")
-            print(f"    - Inserción: {results['bst']['insert'][i]:.6f} s")
-            print(f"    - Búsqueda:  {results['bst']['search'][i]:.6f} s")
-            print(f"    - Altura:    {results['bst']['height'][i]}")
-            print(f"  RBT:")
-            print(f"    - Inserción: {results['rbt']['insert'][i]:.6f} s")
-            print(f"    - Búsqueda:  {results['rbt']['search'][i]:.6f} s")
-            print(f"    - Altura:    {results['rbt']['height'][i]}")
+            for name, style in engines:
+                times = results[name]
+                print(f"  {style['short_label']}:")
+                for phase, label in phases:
+                    if times.get(phase):
+                        print(f"    - {label}{self._format_timing(results, name, phase, i)}")
+                print(f"    - Altura:    {times['height'][i]}")
+                if times.get('memory', {}).get('retained'):
+                    memory = times['memory']
+                    print(f"    - Memoria:   {memory['bytes_per_key'][i]:.1f} B/llave "
+                          f"(pico {memory['peak'][i] / 1024:.1f} KiB)")
             
-            # Calcular mejoras
-            if results['bst']['insert'][i] > 0:
-                insert_improvement = ((results['bst']['insert'][i] - results['rbt']['insert'][i]) 
-                                     / results['bst']['insert'][i] * 100)
-                print(f"  Mejora RBT en inserción: {insert_improvement:.2f}%")
+            if 'frozen' in results:
+                print("  Instantánea Eytzinger:")
+                print(f"    - Congelado: {self._format_timing(results, 'frozen', 'freeze', i)}")
+                print(f"    - Búsqueda:  {self._format_timing(results, 'frozen', 'search', i)}")
             
-            if results['bst']['search'][i] > 0:
-                search_improvement = ((results['bst']['search'][i] - results['rbt']['search'][i]) 
-                                     / results['bst']['search'][i] * 100)
-                print(f"  Mejora RBT en búsqueda: {search_improvement:.2f}%")
+            # Calcular mejoras respecto al ABB sin balanceo
+            if 'bst' not in results:
+                continue
+            for name, style in engines:
+                if name == 'bst':
+                    continue
+                if results['bst']['insert'][i] > 0:
+                    insert_improvement = ((results['bst']['insert'][i] - results[name]['insert'][i])
+                                         / results['bst']['insert'][i] * 100)
+                    print(f"  Mejora {style['short_label']} en inserción: {insert_improvement:.2f}%")
+                
+                if results['bst']['search'][i] > 0:
+                    search_improvement = ((results['bst']['search'][i] - results[name]['search'][i])
+                                         / results['bst']['search'][i] * 100)
+                    print(f"  Mejora {style['short_label']} en búsqueda: {search_improvement:.2f}%")